@@ -1,47 +1,63 @@
 #!/usr/bin/env python3
 """
-Log analyzer for Linux Audio Server integration.
+Decision trace analyzer for Linux Audio Server integration.
 Helps diagnose "idle" state issues when radio is playing.
 
+Reads the sink state decision trace from a diagnostics download
+(Settings -> Devices & services -> Linux Audio Server -> Download diagnostics)
+or from a saved linux_audio_server.get_decision_trace response.
+
 Usage:
-    python3 analyze_logs.py home-assistant.log [sink_name]
+    python3 analyze_logs.py diagnostics.json [sink_name]
 
 Example:
-    python3 analyze_logs.py home-assistant.log speaker_kitchen
+    python3 analyze_logs.py config_entry-linux_audio_server.json speaker_kitchen
 """
 
+import json
 import sys
-import re
-from collections import defaultdict
 
 
-def analyze_logs(log_file, sink_name=None):
-    """Analyze Home Assistant logs for state determination issues."""
+def load_traces(trace_file):
+    """Load per-sink decision traces from a diagnostics or service response file."""
+    with open(trace_file, 'r', encoding='utf-8') as f:
+        text = f.read()
+
+    try:
+        document = json.loads(text)
+    except ValueError:
+        # Service responses copied from Developer Tools are YAML
+        import yaml
+        document = yaml.safe_load(text)
+
+    # Diagnostics downloads wrap the integration data under "data"
+    if "data" in document:
+        document = document["data"]
+    trace = document.get("decision_trace", document)
+    return trace.get("enabled", False), trace.get("sinks", {})
+
+
+def analyze_logs(trace_file, sink_name=None):
+    """Analyze recorded decision traces for state determination issues."""
 
     print("=" * 80)
     print("Linux Audio Server - State Diagnosis Tool")
     print("=" * 80)
     print()
 
-    with open(log_file, 'r', encoding='utf-8') as f:
-        lines = f.readlines()
-
-    # Find all sink names if not specified
-    sink_names = set()
-    sink_pattern = re.compile(r'\[([^\]]+)\] === Determining state ===')
-
-    for line in lines:
-        match = sink_pattern.search(line)
-        if match:
-            sink_names.add(match.group(1))
+    enabled, traces = load_traces(trace_file)
+    sink_names = {name for name, decisions in traces.items() if decisions}
 
     if not sink_names:
-        print("❌ No debug logs found!")
+        print("❌ No decision traces found!")
         print()
-        print("Make sure you enabled debug logging:")
-        print("  logger:")
-        print("    logs:")
-        print("      custom_components.linux_audio_server: debug")
+        print("Make sure you enabled decision tracing before reproducing the issue:")
+        print("  service: linux_audio_server.set_decision_trace")
+        print("  data:")
+        print("    enabled: true")
+        if enabled:
+            print()
+            print("Tracing is enabled but no state was resolved yet; wait for an update.")
         print()
         return
 
@@ -51,125 +67,45 @@ def analyze_logs(log_file, sink_name=None):
     # If sink_name specified, filter to that sink
     if sink_name:
         if sink_name not in sink_names:
-            print(f"❌ Sink '{sink_name}' not found in logs!")
+            print(f"❌ Sink '{sink_name}' not found in trace!")
             print(f"Available sinks: {', '.join(sorted(sink_names))}")
             return
         sink_names = {sink_name}
 
     # Analyze each sink
     for sink in sorted(sink_names):
-        analyze_sink(lines, sink)
+        analyze_sink(traces[sink], sink)
         print()
 
 
-def analyze_sink(lines, sink_name):
-    """Analyze logs for a specific sink."""
+def analyze_sink(decisions, sink_name):
+    """Analyze the decision trace for a specific sink."""
 
     print(f"🔍 Analyzing: {sink_name}")
     print("-" * 80)
 
-    # Find state determination blocks
-    state_blocks = []
-    current_block = []
-    in_block = False
-
-    for line in lines:
-        if f"[{sink_name}] === Determining state ===" in line:
-            if current_block:
-                state_blocks.append(current_block)
-            current_block = [line]
-            in_block = True
-        elif in_block and f"[{sink_name}]" in line:
-            current_block.append(line)
-            if "Returning" in line:
-                state_blocks.append(current_block)
-                current_block = []
-                in_block = False
-
-    if not state_blocks:
-        print("  ⚠️  No state determination logs found")
-        return
-
-    # Analyze the most recent block
-    latest_block = state_blocks[-1]
+    # Analyze the most recent decision
+    latest = decisions[-1]
 
-    print(f"  📅 Total state checks: {len(state_blocks)}")
-    print(f"  🕐 Analyzing most recent check...")
+    print(f"  📅 Total state checks: {len(decisions)}")
+    print(f"  🕐 Analyzing most recent check ({latest.get('time')})...")
     print()
 
-    # Parse the block
+    active_player = latest.get('active_player')
     results = {
-        'sink_inputs_count': None,
-        'active_player': None,
-        'player_state': None,
-        'assigned_player': None,
-        'global_state': None,
-        'pa_state': None,
-        'final_state': None,
-        'priority_used': None,
+        'sink_inputs_count': len(latest.get('sink_inputs', [])),
+        'active_player': active_player,
+        'player_state': (
+            latest.get('active_player_state') if active_player
+            else latest.get('assigned_player_state')
+        ),
+        'assigned_player': latest.get('assigned_player'),
+        'global_state': latest.get('playback_state'),
+        'pa_state': latest.get('sink_state'),
+        'final_state': (latest.get('result') or '').upper(),
+        'priority_used': latest.get('priority'),
     }
 
-    for line in latest_block:
-        # Sink inputs
-        if "Total sink_inputs:" in line:
-            match = re.search(r'Total sink_inputs: (\d+)', line)
-            if match:
-                results['sink_inputs_count'] = int(match.group(1))
-
-        # Priority 1: Active player from sink-inputs
-        if "Priority 1: Active player from sink-inputs:" in line:
-            match = re.search(r'Active player from sink-inputs: (\w+)', line)
-            if match:
-                results['active_player'] = match.group(1)
-        elif "Priority 1: No active player found" in line:
-            results['active_player'] = None
-
-        # Player state
-        if "Found active player" in line and "with state:" in line:
-            match = re.search(r'with state: (\w+)', line)
-            if match:
-                results['player_state'] = match.group(1)
-
-        # Priority 2: Player assignments
-        if "Priority 2: Checking player assignments. Assigned player:" in line:
-            match = re.search(r'Assigned player: (\w+)', line)
-            if match:
-                results['assigned_player'] = match.group(1)
-
-        # Priority 3: Global playback
-        if "Priority 3: Checking global playback state:" in line:
-            match = re.search(r'playback state: (\w+)', line)
-            if match:
-                results['global_state'] = match.group(1)
-
-        # Priority 4: PA state
-        if "Priority 4: Falling back to PulseAudio sink state:" in line:
-            match = re.search(r'sink state: (\w+)', line)
-            if match:
-                results['pa_state'] = match.group(1)
-
-        # Final state
-        if "Returning" in line:
-            if "Priority 1" in line or "from active player" in line:
-                results['priority_used'] = 1
-            elif "Priority 2" in line or "from assigned player" in line:
-                results['priority_used'] = 2
-            elif "Priority 3" in line or "from global playback" in line:
-                results['priority_used'] = 3
-            elif "Priority 4" in line or "from PA sink state" in line:
-                results['priority_used'] = 4
-
-            if "PLAYING" in line:
-                results['final_state'] = "PLAYING"
-            elif "PAUSED" in line:
-                results['final_state'] = "PAUSED"
-            elif "IDLE" in line:
-                results['final_state'] = "IDLE"
-            elif "ON" in line:
-                results['final_state'] = "ON"
-            elif "OFF" in line:
-                results['final_state'] = "OFF"
-
     # Display results
     print("  📊 State Determination Results:")
     print()
@@ -178,8 +114,8 @@ def analyze_sink(lines, sink_name):
     if results['active_player']:
         print(f"    Player state:          {results['player_state'] or 'Unknown'}")
     print(f"    Assigned player:       {results['assigned_player'] or 'None'}")
-    print(f"    Global playback state: {results['global_state'] or 'Not checked'}")
-    print(f"    PulseAudio state:      {results['pa_state'] or 'Not checked'}")
+    print(f"    Global playback state: {results['global_state'] or 'Not reported'}")
+    print(f"    PulseAudio state:      {results['pa_state'] or 'Not reported'}")
     print()
     print(f"    ✅ Final state:         {results['final_state']} (Priority {results['priority_used']})")
     print()
@@ -251,28 +187,31 @@ def analyze_sink(lines, sink_name):
         print(f"     Returning {results['final_state']} from Priority {results['priority_used']}")
 
     print()
-    print("  📋 Recent state determination log:")
+    print("  📋 Recent state decisions:")
     print()
-    for line in latest_block[-10:]:  # Last 10 lines
-        print(f"     {line.strip()}")
+    for decision in decisions[-10:]:  # Last 10 decisions
+        print(
+            f"     {decision.get('time')}  {decision.get('result')}"
+            f" (priority {decision.get('priority')}, track from {decision.get('track_from')})"
+        )
 
 
 if __name__ == "__main__":
     if len(sys.argv) < 2:
-        print("Usage: python3 analyze_logs.py <log_file> [sink_name]")
+        print("Usage: python3 analyze_logs.py <diagnostics_file> [sink_name]")
         print()
         print("Example:")
-        print("  python3 analyze_logs.py home-assistant.log")
-        print("  python3 analyze_logs.py home-assistant.log speaker_kitchen")
+        print("  python3 analyze_logs.py config_entry-linux_audio_server.json")
+        print("  python3 analyze_logs.py config_entry-linux_audio_server.json speaker_kitchen")
         sys.exit(1)
 
-    log_file = sys.argv[1]
+    trace_file = sys.argv[1]
     sink_name = sys.argv[2] if len(sys.argv) > 2 else None
 
     try:
-        analyze_logs(log_file, sink_name)
+        analyze_logs(trace_file, sink_name)
     except FileNotFoundError:
-        print(f"❌ Error: Log file '{log_file}' not found")
+        print(f"❌ Error: File '{trace_file}' not found")
         sys.exit(1)
     except Exception as e:
         print(f"❌ Error analyzing logs: {e}")
@@ -2,19 +2,27 @@
 from __future__ import annotations
 
 import logging
+import time
 from typing import Any
 
 import voluptuous as vol
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.const import CONF_HOST, CONF_PORT, Platform
-from homeassistant.core import HomeAssistant, ServiceCall
+from homeassistant.const import CONF_HOST, CONF_PORT, EVENT_HOMEASSISTANT_CLOSE, Platform
+from homeassistant.core import (
+    Event,
+    HomeAssistant,
+    ServiceCall,
+    ServiceResponse,
+    SupportsResponse,
+)
 from homeassistant.exceptions import HomeAssistantError
 from homeassistant.helpers import config_validation as cv
-from homeassistant.helpers.aiohttp_client import async_get_clientsession
+from homeassistant.helpers.storage import Store
 
 from .api import ApiClientError, LinuxAudioServerApiClient
-from .const import DOMAIN
-from .coordinator import LinuxAudioServerCoordinator
+from .const import DOMAIN, SNAPSHOT_STORAGE_VERSION
+from .coordinator import LinuxAudioServerCoordinator, snapshot_storage_key
+from .lifecycle import KIND_BLUETOOTH_DEVICE
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -47,6 +55,8 @@ SERVICE_PAUSE_ALL = "pause_all"
 SERVICE_STOP_ALL = "stop_all"
 SERVICE_BLUETOOTH_SCAN = "bluetooth_scan"
 SERVICE_ASSIGN_PLAYER = "assign_player"
+SERVICE_SET_DECISION_TRACE = "set_decision_trace"
+SERVICE_GET_DECISION_TRACE = "get_decision_trace"
 
 PLATFORMS: list[Platform] = [
     Platform.MEDIA_PLAYER,
@@ -63,19 +73,44 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Set up Linux Audio Server from a config entry."""
     hass.data.setdefault(DOMAIN, {})
 
-    # Create API client
-    session = async_get_clientsession(hass)
+    # Create API client with its own connection pool, closed on unload
     client = LinuxAudioServerApiClient(
         host=entry.data[CONF_HOST],
         port=entry.data[CONF_PORT],
-        session=session,
     )
 
-    # Create coordinator
-    coordinator = LinuxAudioServerCoordinator(hass, client)
+    async def _async_close_client(_event: Event) -> None:
+        """Close the connection pool when Home Assistant stops."""
+        await client.async_close()
 
-    # Fetch initial data
-    await coordinator.async_config_entry_first_refresh()
+    entry.async_on_unload(
+        hass.bus.async_listen_once(EVENT_HOMEASSISTANT_CLOSE, _async_close_client)
+    )
+
+    # Create coordinator
+    coordinator = LinuxAudioServerCoordinator(hass, client, entry_id=entry.entry_id)
+
+    # Start from the last known snapshot when there is one and refresh in the
+    # background; otherwise block on a full initial fetch
+    setup_start = time.monotonic()
+    if await coordinator.async_load_snapshot():
+        entry.async_create_background_task(
+            hass, coordinator.async_refresh(), f"{DOMAIN} initial refresh"
+        )
+        _LOGGER.info(
+            "Loaded cached snapshot in %.3fs, live refresh running in background",
+            time.monotonic() - setup_start,
+        )
+    else:
+        try:
+            await coordinator.async_config_entry_first_refresh()
+        except Exception:
+            await client.async_close()
+            raise
+        _LOGGER.info(
+            "Initial refresh completed in %.3fs (no cached snapshot)",
+            time.monotonic() - setup_start,
+        )
 
     # Store coordinator
     hass.data[DOMAIN][entry.entry_id] = coordinator
@@ -85,7 +120,13 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     _LOGGER.info("WebSocket listener started for real-time state updates")
 
     # Forward setup to platforms
-    await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
+    try:
+        await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
+    except Exception:
+        await coordinator.async_stop_websocket()
+        hass.data[DOMAIN].pop(entry.entry_id)
+        await client.async_close()
+        raise
 
     # Register services only once (for first instance)
     if not hass.services.has_service(DOMAIN, SERVICE_CREATE_COMBINED_SINK):
@@ -194,7 +235,9 @@ async def _async_register_services(hass: HomeAssistant) -> None:
         try:
             stream_index = call.data["stream_index"]
             volume = call.data["volume"]
-            await coordinator.client.set_stream_volume(stream_index, volume)
+            if await coordinator.client.set_stream_volume(stream_index, volume) is None:
+                _LOGGER.debug("Stream %s volume %s superseded by a newer value", stream_index, volume)
+                return
             await coordinator.async_request_refresh()
             _LOGGER.info("Set stream %s volume to %s", stream_index, volume)
         except ApiClientError as err:
@@ -227,6 +270,7 @@ async def _async_register_services(hass: HomeAssistant) -> None:
             name = call.data["name"]
             url = call.data["url"]
             await coordinator.client.add_radio_stream(name, url)
+            coordinator.invalidate_slices("radio_streams")
             await coordinator.async_request_refresh()
             _LOGGER.info("Added radio stream '%s'", name)
         except ApiClientError as err:
@@ -242,6 +286,7 @@ async def _async_register_services(hass: HomeAssistant) -> None:
         try:
             name = call.data["name"]
             await coordinator.client.delete_radio_stream(name)
+            coordinator.invalidate_slices("radio_streams")
             await coordinator.async_request_refresh()
             _LOGGER.info("Deleted radio stream '%s'", name)
         except ApiClientError as err:
@@ -258,6 +303,7 @@ async def _async_register_services(hass: HomeAssistant) -> None:
             name = call.data["name"]
             url = call.data["url"]
             await coordinator.client.update_radio_stream(name, url)
+            coordinator.invalidate_slices("radio_streams")
             await coordinator.async_request_refresh()
             _LOGGER.info("Updated radio stream '%s'", name)
         except ApiClientError as err:
@@ -274,6 +320,7 @@ async def _async_register_services(hass: HomeAssistant) -> None:
             name = call.data["name"]
             sink = call.data.get("sink")  # Optional sink parameter
             await coordinator.client.play_radio_stream(name, sink=sink)
+            coordinator.invalidate_slices("player_assignments")
             await coordinator.async_request_refresh()
             if sink:
                 _LOGGER.info("Playing radio stream '%s' on sink '%s'", name, sink)
@@ -293,6 +340,7 @@ async def _async_register_services(hass: HomeAssistant) -> None:
             url = call.data["url"]
             sink = call.data.get("sink")  # Optional sink parameter
             await coordinator.client.play_radio_url(url, sink=sink)
+            coordinator.invalidate_slices("player_assignments")
             await coordinator.async_request_refresh()
             if sink:
                 _LOGGER.info("Playing radio URL '%s' on sink '%s'", url, sink)
@@ -311,6 +359,7 @@ async def _async_register_services(hass: HomeAssistant) -> None:
         try:
             address = call.data["address"]
             await coordinator.client.pair_bluetooth(address)
+            coordinator.invalidate_slices("bluetooth_devices")
             await coordinator.async_request_refresh()
             _LOGGER.info("Paired Bluetooth device %s", address)
         except ApiClientError as err:
@@ -326,6 +375,7 @@ async def _async_register_services(hass: HomeAssistant) -> None:
         try:
             address = call.data["address"]
             await coordinator.client.connect_bluetooth(address)
+            coordinator.invalidate_slices("bluetooth_devices")
             await coordinator.async_request_refresh()
             _LOGGER.info("Connected Bluetooth device %s", address)
         except ApiClientError as err:
@@ -341,6 +391,7 @@ async def _async_register_services(hass: HomeAssistant) -> None:
         try:
             address = call.data["address"]
             await coordinator.client.disconnect_bluetooth(address)
+            coordinator.invalidate_slices("bluetooth_devices")
             await coordinator.async_request_refresh()
             _LOGGER.info("Disconnected Bluetooth device %s", address)
         except ApiClientError as err:
@@ -356,6 +407,7 @@ async def _async_register_services(hass: HomeAssistant) -> None:
         try:
             address = call.data["address"]
             await coordinator.client.connect_and_set_default_bluetooth(address)
+            coordinator.invalidate_slices("bluetooth_devices")
             await coordinator.async_request_refresh()
             _LOGGER.info("Connected and set Bluetooth device %s as default", address)
         except ApiClientError as err:
@@ -415,6 +467,7 @@ async def _async_register_services(hass: HomeAssistant) -> None:
 
         try:
             await coordinator.client.start_keep_alive()
+            coordinator.invalidate_slices("keep_alive")
             await coordinator.async_request_refresh()
             _LOGGER.info("Started Bluetooth keep-alive")
         except ApiClientError as err:
@@ -429,6 +482,7 @@ async def _async_register_services(hass: HomeAssistant) -> None:
 
         try:
             await coordinator.client.stop_keep_alive()
+            coordinator.invalidate_slices("keep_alive")
             await coordinator.async_request_refresh()
             _LOGGER.info("Stopped Bluetooth keep-alive")
         except ApiClientError as err:
@@ -444,6 +498,7 @@ async def _async_register_services(hass: HomeAssistant) -> None:
         try:
             interval = call.data["interval"]
             await coordinator.client.set_keep_alive_interval(interval)
+            coordinator.invalidate_slices("keep_alive")
             await coordinator.async_request_refresh()
             _LOGGER.info("Set keep-alive interval to %s seconds", interval)
         except ApiClientError as err:
@@ -459,6 +514,7 @@ async def _async_register_services(hass: HomeAssistant) -> None:
         try:
             sink_name = call.data["sink_name"]
             await coordinator.client.enable_keep_alive_for_sink(sink_name)
+            coordinator.invalidate_slices("keep_alive")
             await coordinator.async_request_refresh()
             _LOGGER.info("Enabled keep-alive for sink: %s", sink_name)
         except ApiClientError as err:
@@ -474,6 +530,7 @@ async def _async_register_services(hass: HomeAssistant) -> None:
         try:
             sink_name = call.data["sink_name"]
             await coordinator.client.disable_keep_alive_for_sink(sink_name)
+            coordinator.invalidate_slices("keep_alive")
             await coordinator.async_request_refresh()
             _LOGGER.info("Disabled keep-alive for sink: %s", sink_name)
         except ApiClientError as err:
@@ -486,8 +543,10 @@ async def _async_register_services(hass: HomeAssistant) -> None:
         if not coordinator:
             raise HomeAssistantError("No Linux Audio Server instance available")
 
-        # Trigger a coordinator refresh which will run the cleanup logic
-        await coordinator.async_request_refresh()
+        # Refresh, then remove entities of gone devices without waiting out the grace period
+        coordinator.invalidate_slices("bluetooth_devices")
+        await coordinator.async_refresh()
+        coordinator.entity_lifecycle.async_sync(force_removal_kinds={KIND_BLUETOOTH_DEVICE})
         _LOGGER.info("Triggered cleanup of stale Bluetooth speaker entities")
 
     async def handle_pause_all(call: ServiceCall) -> None:
@@ -529,6 +588,7 @@ async def _async_register_services(hass: HomeAssistant) -> None:
             await coordinator.client.scan_bluetooth(duration)
             _LOGGER.info("Started Bluetooth scan for %s seconds", duration)
             # Note: coordinator refresh will happen automatically after scan duration
+            coordinator.invalidate_slices("bluetooth_devices")
         except ApiClientError as err:
             _LOGGER.error("Failed to start Bluetooth scan: %s", err)
             raise HomeAssistantError(f"Failed to start Bluetooth scan: {err}") from err
@@ -543,12 +603,34 @@ async def _async_register_services(hass: HomeAssistant) -> None:
             player_name = call.data["player_name"]
             sink_name = call.data["sink_name"]
             await coordinator.client.assign_player(player_name, sink_name)
+            coordinator.invalidate_slices("player_assignments")
             await coordinator.async_request_refresh()
             _LOGGER.info("Assigned player '%s' to sink '%s'", player_name, sink_name)
         except ApiClientError as err:
             _LOGGER.error("Failed to assign player: %s", err)
             raise HomeAssistantError(f"Failed to assign player: {err}") from err
 
+    async def handle_set_decision_trace(call: ServiceCall) -> None:
+        """Handle enabling or disabling sink state decision tracing."""
+        coordinator = get_coordinator()
+        if not coordinator:
+            raise HomeAssistantError("No Linux Audio Server instance available")
+
+        enabled = call.data["enabled"]
+        coordinator.set_decision_trace(enabled)
+        _LOGGER.info("Decision tracing %s", "enabled" if enabled else "disabled")
+
+    async def handle_get_decision_trace(call: ServiceCall) -> ServiceResponse:
+        """Handle returning recorded sink state decisions."""
+        coordinator = get_coordinator()
+        if not coordinator:
+            raise HomeAssistantError("No Linux Audio Server instance available")
+
+        return {
+            "enabled": coordinator.decision_trace_enabled,
+            "sinks": coordinator.decision_traces(call.data.get("sink_name")),
+        }
+
     # Service schemas
     create_combined_sink_schema = vol.Schema({
         vol.Required("name"): cv.string,
@@ -639,6 +721,14 @@ async def _async_register_services(hass: HomeAssistant) -> None:
         vol.Required("sink_name"): cv.string,
     })
 
+    set_decision_trace_schema = vol.Schema({
+        vol.Required("enabled"): cv.boolean,
+    })
+
+    get_decision_trace_schema = vol.Schema({
+        vol.Optional("sink_name"): cv.string,
+    })
+
     # Register services with schemas
     hass.services.async_register(
         DOMAIN,
@@ -808,6 +898,19 @@ async def _async_register_services(hass: HomeAssistant) -> None:
         handle_assign_player,
         schema=assign_player_schema,
     )
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_SET_DECISION_TRACE,
+        handle_set_decision_trace,
+        schema=set_decision_trace_schema,
+    )
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_GET_DECISION_TRACE,
+        handle_get_decision_trace,
+        schema=get_decision_trace_schema,
+        supports_response=SupportsResponse.ONLY,
+    )
 
 
 async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
@@ -816,9 +919,11 @@ async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     coordinator = hass.data[DOMAIN][entry.entry_id]
     await coordinator.async_stop_websocket()
     _LOGGER.info("WebSocket listener stopped")
+    coordinator.entity_lifecycle.async_shutdown()
 
     if unload_ok := await hass.config_entries.async_unload_platforms(entry, PLATFORMS):
         hass.data[DOMAIN].pop(entry.entry_id)
+        await coordinator.client.async_close()
 
         # Unregister services if this was the last instance
         if not hass.data[DOMAIN]:
@@ -851,5 +956,12 @@ async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
             hass.services.async_remove(DOMAIN, SERVICE_STOP_ALL)
             hass.services.async_remove(DOMAIN, SERVICE_BLUETOOTH_SCAN)
             hass.services.async_remove(DOMAIN, SERVICE_ASSIGN_PLAYER)
+            hass.services.async_remove(DOMAIN, SERVICE_SET_DECISION_TRACE)
+            hass.services.async_remove(DOMAIN, SERVICE_GET_DECISION_TRACE)
 
     return unload_ok
+
+
+async def async_remove_entry(hass: HomeAssistant, entry: ConfigEntry) -> None:
+    """Remove the persisted snapshot of a deleted config entry."""
+    await Store(hass, SNAPSHOT_STORAGE_VERSION, snapshot_storage_key(entry.entry_id)).async_remove()
@@ -2,21 +2,135 @@
 from __future__ import annotations
 
 import asyncio
+from collections import deque
+from contextlib import asynccontextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass
+import heapq
+import itertools
 import json
 import logging
+import math
+import socket
 import time
-from typing import Any
+from typing import Any, AsyncIterator
 from urllib.parse import quote
+import weakref
 
 import aiohttp
 from aiohttp import ClientError
 
+try:
+    import orjson
+except ImportError:  # pragma: no cover - shipped with Home Assistant
+    orjson = None
+
+try:
+    import msgspec
+except ImportError:
+    msgspec = None
+
 _LOGGER = logging.getLogger(__name__)
 
 DEFAULT_TIMEOUT = 20  # Increased from 10 to handle intermittent backend slowdowns
 BLUETOOTH_TIMEOUT = 30  # Bluetooth operations can take longer
 MAX_RETRIES = 2  # Number of retries for failed requests
 RETRY_DELAY = 1.0  # Initial delay between retries in seconds
+GET_CACHE_TTL = 0.25  # Serve repeated GETs from memory for this long (0 disables)
+MAX_CONCURRENT_REQUESTS = 4  # Requests in flight to the backend at once
+
+# Dedicated connection pool per server: room for every scheduled request plus
+# the WebSocket, idle connections kept open across fallback polls
+POOL_LIMIT_PER_HOST = MAX_CONCURRENT_REQUESTS + 2
+POOL_KEEPALIVE_TIMEOUT = 30  # seconds an idle connection is kept open
+POOL_DNS_CACHE_TTL = 300  # seconds a resolved host name is cached
+
+# Response bodies and WebSocket frames at least this large are decoded in
+# the executor so a huge payload cannot stall the event loop
+JSON_EXECUTOR_THRESHOLD = 256 * 1024  # bytes
+
+# Request metrics: latency histogram bucket upper bounds in seconds, the number
+# of recent latencies kept per route for percentiles, and error counter names
+METRICS_BUCKETS = (0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 20.0)
+METRICS_WINDOW = 200
+METRIC_TIMEOUT = "timeouts"
+METRIC_RETRY = "retries"
+METRIC_JSON_ERROR = "json_errors"
+METRIC_CONNECTION_ERROR = "connection_errors"
+# Path segments following these are parameters (sink names, stream indexes,
+# radio station names), except for the literal sub-resources listed
+METRICS_PARAM_PARENTS = frozenset({"sink", "sink-input", "combined-sink", "stereo-pair", "stream"})
+METRICS_ROUTE_LITERALS = frozenset({"default", "move"})
+
+# A host of the form unix:///path/to/api.sock reaches a co-located server
+# through its Unix domain socket instead of TCP; the port is then ignored
+UNIX_SOCKET_SCHEME = "unix://"
+UNIX_SOCKET_HTTP_HOST = "localhost"  # Host header sent over the socket
+
+
+class JsonCodec:
+    """JSON decoder backed by the fastest available library.
+
+    orjson is preferred, then msgspec, then the standard library.
+    decode_errors holds the exceptions the backend raises on invalid input.
+    """
+
+    def __init__(self, executor_threshold: int = JSON_EXECUTOR_THRESHOLD) -> None:
+        """Pick the decoder backend."""
+        self._executor_threshold = executor_threshold
+        if orjson is not None:
+            self.name = "orjson"
+            self.loads = orjson.loads
+            self.decode_errors: tuple[type[Exception], ...] = (ValueError,)
+        elif msgspec is not None:
+            self.name = "msgspec"
+            self.loads = msgspec.json.Decoder().decode
+            self.decode_errors = (msgspec.DecodeError, ValueError)
+        else:
+            self.name = "json"
+            self.loads = json.loads
+            self.decode_errors = (ValueError,)
+
+    async def async_loads(self, data: bytes | str) -> Any:
+        """Decode data, in the executor when it is above the size threshold.
+
+        An empty body decodes to None, as with aiohttp's response.json().
+        """
+        if not data or data.isspace():
+            return None
+        if len(data) < self._executor_threshold:
+            return self.loads(data)
+        return await asyncio.get_running_loop().run_in_executor(None, self.loads, data)
+
+
+def unix_socket_path(host: str) -> str | None:
+    """Return the socket path of a unix:// host, or None for a TCP host."""
+    if host.startswith(UNIX_SOCKET_SCHEME):
+        return host[len(UNIX_SOCKET_SCHEME):]
+    return None
+
+# Request priorities, lowest value first. Interactive commands always have a
+# slot reserved; event-triggered refreshes go before background polling and
+# slow Bluetooth operations.
+PRIORITY_INTERACTIVE = 0
+PRIORITY_EVENT = 1
+PRIORITY_BACKGROUND = 2
+
+# Priority of requests made from the current task; callers such as the
+# coordinator set it around their fetches
+REQUEST_PRIORITY: ContextVar[int] = ContextVar(
+    "linux_audio_server_request_priority", default=PRIORITY_INTERACTIVE
+)
+
+# WebSocket events are buffered between the receive loop and the handler
+WS_QUEUE_SIZE = 256
+WS_OVERFLOW_DROP_OLDEST = "drop_oldest"  # Discard the oldest queued event
+WS_OVERFLOW_COALESCE = "coalesce"  # Replace a queued event with the same key
+WS_OVERFLOW_BLOCK = "block"  # Stop reading from the socket until there is room
+
+# Synthetic event queued when events may have been missed and cannot be
+# replayed by the server; the handler should perform a full refresh
+WS_RESYNC_EVENT = {"source": "client", "event": "resync"}
 
 
 class LinuxAudioServerApiClient:
@@ -26,13 +140,139 @@ class LinuxAudioServerApiClient:
         self,
         host: str,
         port: int,
-        session: aiohttp.ClientSession,
+        session: aiohttp.ClientSession | None = None,
+        get_cache_ttl: float = GET_CACHE_TTL,
+        max_concurrent_requests: int = MAX_CONCURRENT_REQUESTS,
+        codec: JsonCodec | None = None,
     ) -> None:
-        """Initialize the API client."""
+        """Initialize the API client.
+
+        Without a session the client opens its own connection pool, which
+        must be released with async_close. A unix:// host always uses its
+        own pool, connected to the socket.
+        """
         self._host = host
         self._port = port
+        self._connector: PooledConnectorMixin | None = None
+        authority = f"{host}:{port}"
+        socket_path = unix_socket_path(host)
+        if socket_path is not None:
+            self._connector = PooledUnixConnector(
+                path=socket_path,
+                limit=POOL_LIMIT_PER_HOST,
+                keepalive_timeout=POOL_KEEPALIVE_TIMEOUT,
+            )
+            # The socket replaces host and port; URLs only carry the path
+            authority = UNIX_SOCKET_HTTP_HOST
+        elif session is None:
+            self._connector = PooledConnector(
+                limit_per_host=POOL_LIMIT_PER_HOST,
+                keepalive_timeout=POOL_KEEPALIVE_TIMEOUT,
+                use_dns_cache=True,
+                ttl_dns_cache=POOL_DNS_CACHE_TTL,
+            )
+        if self._connector is not None:
+            session = aiohttp.ClientSession(connector=self._connector)
         self._session = session
-        self._base_url = f"http://{host}:{port}"
+        self._base_url = f"http://{authority}"
+        self._ws_url = f"ws://{authority}/api/events/ws"
+        self._codec = codec or JsonCodec()
+        self._metrics = RequestMetrics()
+
+        # Identical concurrent GETs share one in-flight request, and results
+        # are reused for get_cache_ttl. Any write, or an event reporting a
+        # server-side change, invalidates both.
+        self._get_cache_ttl = get_cache_ttl
+        # In-flight GETs by endpoint, with the priority they were started at
+        self._inflight_gets: dict[str, tuple[int, asyncio.Task]] = {}
+        self._get_cache: dict[str, tuple[float, dict[str, Any]]] = {}
+        self._write_generation = 0
+        self._request_stats = {"inflight_hits": 0, "cache_hits": 0, "misses": 0}
+        # Decoded GET bodies with their ETag / Last-Modified validators; a
+        # 304 reply reuses the stored object instead of reading and decoding
+        self._validated_gets: dict[str, ValidatedResponse] = {}
+        self._validation_stats = {
+            "not_modified": 0,
+            "bytes_saved": 0,
+            "decode_time_saved": 0.0,
+        }
+        self._scheduler = RequestScheduler(max_concurrent_requests)
+
+        # Last-write-wins commands: per target, the command in flight and the
+        # latest queued (endpoint, data, waiter) replacing it once it completes
+        self._command_targets: dict[str, dict[str, Any]] = {}
+        self._ws_queue: WebSocketEventQueue | None = None
+        # Sequence number of the last event handled; events still queued when
+        # the connection drops are not handled, so they are replayed
+        self._ws_handled_seq: int | None = None
+        # Sequence number of the last event received on the current connection
+        self._ws_last_seq: int | None = None
+        self._ws_connected_before = False
+        self._ws_connected = False
+        self._ws_stats = {
+            "received": 0,
+            "processed": 0,
+            "dropped": 0,
+            "coalesced": 0,
+            "duplicates": 0,
+            "resyncs": 0,
+            "max_queue_depth": 0,
+            "last_lag": 0.0,
+            "max_lag": 0.0,
+        }
+
+    @property
+    def request_stats(self) -> dict[str, int]:
+        """Return GET deduplication and scheduling counters."""
+        return {
+            **self._request_stats,
+            "in_flight": self._scheduler.in_flight,
+            "queued": self._scheduler.queued,
+        }
+
+    @property
+    def request_metrics(self) -> dict[str, Any]:
+        """Return latency percentiles, histograms and error counters per route."""
+        return self._metrics.summary()
+
+    @property
+    def json_codec(self) -> str:
+        """Return the name of the JSON decoder in use."""
+        return self._codec.name
+
+    @property
+    def validation_stats(self) -> dict[str, Any]:
+        """Return conditional GET counters."""
+        return {
+            **self._validation_stats,
+            "decode_time_saved": round(self._validation_stats["decode_time_saved"], 6),
+            "cached_endpoints": len(self._validated_gets),
+        }
+
+    @property
+    def pool_stats(self) -> dict[str, Any]:
+        """Return connection pool counters, empty for a shared session."""
+        if self._connector is None:
+            return {}
+        return self._connector.stats
+
+    async def async_close(self) -> None:
+        """Close the client's own connection pool."""
+        if self._connector is not None and not self._session.closed:
+            await self._session.close()
+
+    @property
+    def websocket_connected(self) -> bool:
+        """Return True while the WebSocket event stream is connected."""
+        return self._ws_connected
+
+    @property
+    def websocket_stats(self) -> dict[str, Any]:
+        """Return WebSocket event queue counters."""
+        return {
+            **self._ws_stats,
+            "queue_depth": len(self._ws_queue) if self._ws_queue else 0,
+        }
 
     async def _request(
         self,
@@ -41,6 +281,86 @@ class LinuxAudioServerApiClient:
         data: dict[str, Any] | None = None,
         timeout: float = DEFAULT_TIMEOUT,
         retry: bool = True,
+        priority: int | None = None,
+    ) -> dict[str, Any]:
+        """Make a request to the API, deduplicating identical GETs.
+
+        The request runs at the given priority, or at the caller's
+        REQUEST_PRIORITY when none is given.
+        """
+        if priority is not None:
+            token = REQUEST_PRIORITY.set(priority)
+            try:
+                return await self._request(method, endpoint, data, timeout, retry)
+            finally:
+                REQUEST_PRIORITY.reset(token)
+
+        if method != "GET":
+            # Reads started before or during a write may be stale afterwards
+            self.invalidate_gets()
+            try:
+                return await self._request_with_retry(method, endpoint, data, timeout, retry)
+            finally:
+                self.invalidate_gets()
+
+        cached = self._get_cache.get(endpoint)
+        if cached and time.monotonic() - cached[0] < self._get_cache_ttl:
+            self._request_stats["cache_hits"] += 1
+            return cached[1]
+
+        # Only join a GET started at the same or a more urgent priority, so
+        # a user command never waits for a slot behind a background poll
+        priority = REQUEST_PRIORITY.get()
+        inflight = self._inflight_gets.get(endpoint)
+        if inflight is not None and inflight[0] <= priority:
+            task = inflight[1]
+            self._request_stats["inflight_hits"] += 1
+        else:
+            self._request_stats["misses"] += 1
+            task = asyncio.create_task(
+                self._shared_get(endpoint, timeout, retry, self._write_generation)
+            )
+            self._inflight_gets[endpoint] = (priority, task)
+            task.add_done_callback(self._forget_inflight_get)
+
+        # Shield so one caller being cancelled does not cancel the others
+        return await asyncio.shield(task)
+
+    async def _shared_get(
+        self, endpoint: str, timeout: float, retry: bool, generation: int
+    ) -> dict[str, Any]:
+        """Perform a GET shared by all concurrent callers and cache its result."""
+        result = await self._request_with_retry("GET", endpoint, None, timeout, retry)
+        if self._get_cache_ttl > 0 and generation == self._write_generation:
+            self._get_cache[endpoint] = (time.monotonic(), result)
+        return result
+
+    def _forget_inflight_get(self, task: asyncio.Task) -> None:
+        """Drop a finished shared GET from the in-flight table."""
+        for endpoint, (_, inflight) in list(self._inflight_gets.items()):
+            if inflight is task:
+                del self._inflight_gets[endpoint]
+        if not task.cancelled():
+            # Mark the error retrieved in case every caller was cancelled
+            task.exception()
+
+    def invalidate_gets(self) -> None:
+        """Stop sharing in-flight and cached GETs after the server state changed.
+
+        Called around this client's writes, and by the coordinator when an
+        event reports a change that must be refetched.
+        """
+        self._write_generation += 1
+        self._inflight_gets.clear()
+        self._get_cache.clear()
+
+    async def _request_with_retry(
+        self,
+        method: str,
+        endpoint: str,
+        data: dict[str, Any] | None = None,
+        timeout: float = DEFAULT_TIMEOUT,
+        retry: bool = True,
     ) -> dict[str, Any]:
         """Make a request to the API with automatic retry on timeout."""
         last_error = None
@@ -48,6 +368,7 @@ class LinuxAudioServerApiClient:
 
         for attempt in range(retries + 1):
             if attempt > 0:
+                self._metrics.count(method, endpoint, METRIC_RETRY)
                 delay = RETRY_DELAY * (2 ** (attempt - 1))  # Exponential backoff
                 _LOGGER.warning(
                     "Retrying request to %s (attempt %d/%d) after %.1fs delay",
@@ -56,7 +377,9 @@ class LinuxAudioServerApiClient:
                 await asyncio.sleep(delay)
 
             try:
-                return await self._do_request(method, endpoint, data, timeout)
+                # Hold a scheduler slot per attempt, not across retry delays
+                async with self._scheduler.slot(REQUEST_PRIORITY.get()):
+                    return await self._do_request(method, endpoint, data, timeout)
             except ApiClientError as err:
                 last_error = err
                 if attempt < retries:
@@ -70,6 +393,71 @@ class LinuxAudioServerApiClient:
         # All retries exhausted
         raise last_error
 
+    async def _coalesced_command(
+        self, target: str, endpoint: str, data: dict[str, Any]
+    ) -> dict[str, Any] | None:
+        """Send a command where only the latest value per target matters.
+
+        At most one request per target is in flight. A command issued while
+        another is in flight replaces any queued one, and a newer command
+        also cancels the retries of an older one. Returns None when this
+        command was superseded before it was applied.
+        """
+        waiter = asyncio.get_running_loop().create_future()
+        state = self._command_targets.get(target)
+        if state is None:
+            state = {"pending": (endpoint, data, waiter)}
+            self._command_targets[target] = state
+            state["task"] = asyncio.create_task(self._run_coalesced_commands(target, state))
+        else:
+            if state["pending"] is not None:
+                superseded = state["pending"][2]
+                if not superseded.done():
+                    superseded.set_result(None)
+            state["pending"] = (endpoint, data, waiter)
+        return await waiter
+
+    async def _run_coalesced_commands(self, target: str, state: dict[str, Any]) -> None:
+        """Send queued commands for a target until none is left."""
+        try:
+            while state["pending"] is not None:
+                endpoint, data, waiter = state["pending"]
+                state["pending"] = None
+                try:
+                    result = await self._send_latest_command(state, endpoint, data)
+                except ApiClientError as err:
+                    if not waiter.done():
+                        waiter.set_exception(err)
+                else:
+                    if not waiter.done():
+                        waiter.set_result(result)
+        finally:
+            del self._command_targets[target]
+
+    async def _send_latest_command(
+        self, state: dict[str, Any], endpoint: str, data: dict[str, Any]
+    ) -> dict[str, Any] | None:
+        """Send a command, giving up its retries once a newer one is queued."""
+        for attempt in range(MAX_RETRIES + 1):
+            try:
+                return await self._request("POST", endpoint, data, retry=False)
+            except ApiClientError as err:
+                if state["pending"] is not None:
+                    return None
+                if attempt >= MAX_RETRIES or "Timeout" not in str(err):
+                    raise
+
+            self._metrics.count("POST", endpoint, METRIC_RETRY)
+            delay = RETRY_DELAY * (2 ** attempt)
+            _LOGGER.warning(
+                "Retrying request to %s (attempt %d/%d) after %.1fs delay",
+                endpoint, attempt + 2, MAX_RETRIES + 1, delay
+            )
+            await asyncio.sleep(delay)
+            if state["pending"] is not None:
+                return None
+        return None
+
     async def _do_request(
         self,
         method: str,
@@ -81,87 +469,110 @@ class LinuxAudioServerApiClient:
         url = f"{self._base_url}{endpoint}"
         start_time = time.time()
 
-        # Log connection pool status if available
-        if hasattr(self._session.connector, '_conns'):
-            conn_info = f"Pool: {len(self._session.connector._conns)} conns"
+        if self._connector is not None:
+            stats = self._connector.stats
+            conn_info = f"Pool: {stats['acquired']} acquired, {stats['idle']} idle"
         else:
-            conn_info = "Pool: unknown"
+            conn_info = "Pool: shared"
 
         _LOGGER.debug(
             "API request starting: %s %s (timeout: %ss, %s)",
             method, endpoint, timeout, conn_info
         )
 
+        status = None
         try:
             async with asyncio.timeout(timeout):
                 connect_start = time.time()
-
-                if method == "GET":
-                    async with self._session.get(url) as response:
-                        connect_time = time.time() - connect_start
-                        read_start = time.time()
-                        response.raise_for_status()
-                        result = await response.json()
-                        read_time = time.time() - read_start
-                        total_time = time.time() - start_time
-
-                        _LOGGER.debug(
-                            "API request completed: %s %s (connect: %.3fs, read: %.3fs, total: %.3fs)",
-                            method, endpoint, connect_time, read_time, total_time
-                        )
-                        return result
-
-                elif method == "POST":
-                    async with self._session.post(url, json=data) as response:
-                        connect_time = time.time() - connect_start
-                        read_start = time.time()
-                        response.raise_for_status()
-                        result = await response.json()
-                        read_time = time.time() - read_start
-                        total_time = time.time() - start_time
-
+                validated = self._validated_gets.get(endpoint) if method == "GET" else None
+                headers = validated.headers if validated else None
+                # GETs carry no body; other methods send data as JSON
+                body_json = data if method != "GET" else None
+
+                async with self._session.request(
+                    method, url, json=body_json, headers=headers
+                ) as response:
+                    status = response.status
+                    connect_time = time.time() - connect_start
+                    read_start = time.time()
+                    if response.status == 304 and validated:
+                        # Unchanged: reuse the decoded body without reading one
+                        self._validation_stats["not_modified"] += 1
+                        self._validation_stats["bytes_saved"] += validated.size
+                        self._validation_stats["decode_time_saved"] += validated.decode_time
+                        self._metrics.observe(method, endpoint, time.time() - start_time, status)
                         _LOGGER.debug(
-                            "API request completed: %s %s (connect: %.3fs, read: %.3fs, total: %.3fs)",
-                            method, endpoint, connect_time, read_time, total_time
+                            "API request not modified: %s %s (connect: %.3fs)",
+                            method, endpoint, connect_time
                         )
-                        return result
-
-                elif method == "DELETE":
-                    async with self._session.delete(url) as response:
-                        connect_time = time.time() - connect_start
-                        read_start = time.time()
-                        response.raise_for_status()
-                        result = await response.json()
-                        read_time = time.time() - read_start
-                        total_time = time.time() - start_time
-
-                        _LOGGER.debug(
-                            "API request completed: %s %s (connect: %.3fs, read: %.3fs, total: %.3fs)",
-                            method, endpoint, connect_time, read_time, total_time
-                        )
-                        return result
+                        return validated.result
+
+                    response.raise_for_status()
+                    body = await response.read()
+                    decode_start = time.time()
+                    result = await self._codec.async_loads(body)
+                    decode_time = time.time() - decode_start
+                    read_time = time.time() - read_start
+                    total_time = time.time() - start_time
+                    if method == "GET":
+                        self._remember_validators(endpoint, response, result, len(body), decode_time)
+                    self._metrics.observe(method, endpoint, total_time, status)
+
+                    _LOGGER.debug(
+                        "API request completed: %s %s (connect: %.3fs, read: %.3fs, total: %.3fs)",
+                        method, endpoint, connect_time, read_time, total_time
+                    )
+                    return result
 
         except asyncio.TimeoutError as err:
             elapsed = time.time() - start_time
+            self._metrics.observe(method, endpoint, elapsed, status, METRIC_TIMEOUT)
             _LOGGER.error(
                 "Timeout after %.3fs connecting to %s (timeout setting: %ss, %s)",
                 elapsed, url, timeout, conn_info
             )
             raise ApiClientError(f"Timeout connecting to {url}") from err
-        except (aiohttp.ContentTypeError, json.JSONDecodeError) as err:
-            elapsed = time.time() - start_time
-            _LOGGER.error(
-                "Invalid JSON response from %s after %.3fs: %s",
-                url, elapsed, err
-            )
-            raise ApiClientError(f"Invalid JSON response from {url}") from err
         except ClientError as err:
             elapsed = time.time() - start_time
+            # An HTTP error status is counted by its class; anything else
+            # (refused, reset, truncated body) is a connection error
+            error = None if status is not None and status >= 400 else METRIC_CONNECTION_ERROR
+            self._metrics.observe(method, endpoint, elapsed, status, error)
             _LOGGER.error(
                 "Error communicating with %s after %.3fs: %s (type: %s, %s)",
                 url, elapsed, err, type(err).__name__, conn_info
             )
             raise ApiClientError(f"Error communicating with {url}") from err
+        except self._codec.decode_errors as err:
+            elapsed = time.time() - start_time
+            self._metrics.observe(method, endpoint, elapsed, status, METRIC_JSON_ERROR)
+            _LOGGER.error(
+                "Invalid JSON response from %s after %.3fs: %s",
+                url, elapsed, err
+            )
+            raise ApiClientError(f"Invalid JSON response from {url}") from err
+
+    def _remember_validators(
+        self,
+        endpoint: str,
+        response: aiohttp.ClientResponse,
+        result: dict[str, Any],
+        size: int,
+        decode_time: float,
+    ) -> None:
+        """Store a decoded GET body if the server sent validators for it."""
+        etag = response.headers.get(aiohttp.hdrs.ETAG)
+        last_modified = response.headers.get(aiohttp.hdrs.LAST_MODIFIED)
+        if etag is None and last_modified is None:
+            self._validated_gets.pop(endpoint, None)
+            return
+
+        headers = {}
+        if etag is not None:
+            headers[aiohttp.hdrs.IF_NONE_MATCH] = etag
+        if last_modified is not None:
+            headers[aiohttp.hdrs.IF_MODIFIED_SINCE] = last_modified
+        self._validated_gets[endpoint] = ValidatedResponse(headers, result, size, decode_time)
 
     async def health_check(self) -> dict[str, Any]:
         """Check the health of the server."""
@@ -204,11 +615,14 @@ class LinuxAudioServerApiClient:
         encoded_name = quote(sink_name, safe="")
         return await self._request("GET", f"/api/audio/sink/{encoded_name}/volume")
 
-    async def set_sink_volume(self, sink_name: str, volume: float) -> dict[str, Any]:
-        """Set the volume of a specific sink (0.0 to 1.0)."""
+    async def set_sink_volume(self, sink_name: str, volume: float) -> dict[str, Any] | None:
+        """Set the volume of a specific sink (0.0 to 1.0).
+
+        Returns None when superseded by a newer volume for the same sink.
+        """
         encoded_name = quote(sink_name, safe="")
-        return await self._request(
-            "POST",
+        return await self._coalesced_command(
+            f"sink_volume:{sink_name}",
             f"/api/audio/sink/{encoded_name}/volume",
             {"volume": volume},
         )
@@ -226,10 +640,13 @@ class LinuxAudioServerApiClient:
         """Get all active audio streams (sink inputs)."""
         return await self._request("GET", "/api/audio/sink-inputs")
 
-    async def set_stream_volume(self, input_index: int, volume: float) -> dict[str, Any]:
-        """Set the volume of a specific stream."""
-        return await self._request(
-            "POST",
+    async def set_stream_volume(self, input_index: int, volume: float) -> dict[str, Any] | None:
+        """Set the volume of a specific stream.
+
+        Returns None when superseded by a newer volume for the same stream.
+        """
+        return await self._coalesced_command(
+            f"stream_volume:{input_index}",
             f"/api/audio/sink-input/{input_index}/volume",
             {"volume": volume},
         )
@@ -384,15 +801,29 @@ class LinuxAudioServerApiClient:
 
     async def scan_bluetooth(self, duration: int = 10) -> dict[str, Any]:
         """Scan for Bluetooth devices."""
-        return await self._request("POST", "/api/bluetooth/scan", {"duration": duration})
+        return await self._request(
+            "POST", "/api/bluetooth/scan", {"duration": duration}, priority=PRIORITY_BACKGROUND
+        )
 
     async def pair_bluetooth(self, address: str) -> dict[str, Any]:
         """Pair with a Bluetooth device."""
-        return await self._request("POST", "/api/bluetooth/pair", {"address": address}, timeout=BLUETOOTH_TIMEOUT)
+        return await self._request(
+            "POST",
+            "/api/bluetooth/pair",
+            {"address": address},
+            timeout=BLUETOOTH_TIMEOUT,
+            priority=PRIORITY_BACKGROUND,
+        )
 
     async def connect_bluetooth(self, address: str) -> dict[str, Any]:
         """Connect to a Bluetooth device."""
-        return await self._request("POST", "/api/bluetooth/connect", {"address": address}, timeout=BLUETOOTH_TIMEOUT)
+        return await self._request(
+            "POST",
+            "/api/bluetooth/connect",
+            {"address": address},
+            timeout=BLUETOOTH_TIMEOUT,
+            priority=PRIORITY_BACKGROUND,
+        )
 
     async def disconnect_bluetooth(self, address: str) -> dict[str, Any]:
         """Disconnect from a Bluetooth device."""
@@ -400,7 +831,13 @@ class LinuxAudioServerApiClient:
 
     async def connect_and_set_default_bluetooth(self, address: str) -> dict[str, Any]:
         """Connect to Bluetooth device and set as default output."""
-        return await self._request("POST", "/api/bluetooth/connect-and-set-default", {"address": address}, timeout=BLUETOOTH_TIMEOUT)
+        return await self._request(
+            "POST",
+            "/api/bluetooth/connect-and-set-default",
+            {"address": address},
+            timeout=BLUETOOTH_TIMEOUT,
+            priority=PRIORITY_BACKGROUND,
+        )
 
     # TTS endpoints
     async def speak_tts(self, message: str, language: str = "en", sinks: list[str] | None = None) -> dict[str, Any]:
@@ -456,11 +893,38 @@ class LinuxAudioServerApiClient:
         """Assign a specific player to a sink."""
         return await self._request("POST", "/api/players/assign", {"player": player_name, "sink": sink_name})
 
-    async def connect_websocket(self, on_message_callback):
-        """Connect to WebSocket event stream for real-time updates."""
-        ws_url = f"ws://{self._host}:{self._port}/api/events/ws"
+    async def connect_websocket(
+        self,
+        on_message_callback,
+        queue_size: int = WS_QUEUE_SIZE,
+        overflow: str = WS_OVERFLOW_COALESCE,
+    ):
+        """Connect to WebSocket event stream for real-time updates.
+
+        Frames are parsed by the receive loop and handed to a consumer task
+        through a bounded queue, so a slow callback never stalls reading
+        from the socket (and missing heartbeats). When the queue is full the
+        overflow policy decides what happens to the new event.
+
+        On reconnect the server is asked to replay events after the last
+        sequence number handled, which includes events that were still
+        queued when the connection dropped. If missed events cannot be
+        replayed, a WS_RESYNC_EVENT is queued instead.
+        """
+        ws_url = self._ws_url
+        resume_seq = self._ws_handled_seq
+        self._ws_last_seq = resume_seq
+        if resume_seq is not None:
+            ws_url = f"{ws_url}?since={resume_seq}"
+        resuming = self._ws_connected_before
         _LOGGER.info(f"Connecting to WebSocket: {ws_url}")
 
+        queue = WebSocketEventQueue(queue_size, overflow, self._ws_stats)
+        self._ws_queue = queue
+        consumer = asyncio.create_task(
+            self._consume_websocket_events(queue, on_message_callback)
+        )
+
         try:
             # Set generous timeout for WebSocket connection (60s total, 30s for socket connect)
             timeout = aiohttp.ClientTimeout(total=60, sock_connect=30, sock_read=None)
@@ -472,14 +936,45 @@ class LinuxAudioServerApiClient:
                 heartbeat=30  # Send ping every 30s to keep connection alive
             ) as ws:
                 _LOGGER.info("WebSocket connected successfully")
+                self._ws_connected = True
+                self._ws_connected_before = True
+                if resuming and resume_seq is None:
+                    # Without sequence numbers there is nothing to replay from
+                    await self._queue_resync(queue, "no sequence number to resume from")
 
+                first_event = True
                 async for msg in ws:
                     if msg.type == aiohttp.WSMsgType.TEXT:
                         try:
-                            data = json.loads(msg.data)
-                            await on_message_callback(data)
-                        except json.JSONDecodeError as e:
+                            data = await self._codec.async_loads(msg.data)
+                        except self._codec.decode_errors as e:
                             _LOGGER.error(f"Failed to parse WebSocket message: {e}")
+                            continue
+                        self._ws_stats["received"] += 1
+
+                        if data.get("source") == "server" and data.get("event") == "replay_unavailable":
+                            await self._queue_resync(queue, "server cannot replay missed events")
+                            continue
+
+                        seq = data.get("seq")
+                        if isinstance(seq, int):
+                            last_seq = self._ws_last_seq
+                            if last_seq is not None:
+                                if first_event and seq <= last_seq:
+                                    # Sequence went backwards: the server restarted
+                                    await self._queue_resync(queue, "event sequence reset")
+                                elif seq <= last_seq:
+                                    # Already seen (replay overlapping live events)
+                                    self._ws_stats["duplicates"] += 1
+                                    continue
+                                elif seq > last_seq + 1:
+                                    await self._queue_resync(
+                                        queue, f"missed events {last_seq + 1}-{seq - 1}"
+                                    )
+                            self._ws_last_seq = seq
+                        first_event = False
+
+                        await queue.put(data)
                     elif msg.type == aiohttp.WSMsgType.ERROR:
                         _LOGGER.error(f"WebSocket error: {ws.exception()}")
                         break
@@ -491,6 +986,420 @@ class LinuxAudioServerApiClient:
             _LOGGER.error(f"WebSocket connection error: {e}")
             raise ApiClientError(f"WebSocket connection failed: {e}") from e
 
+        finally:
+            self._ws_connected = False
+            consumer.cancel()
+            self._ws_queue = None
+            _LOGGER.debug("WebSocket event queue stats: %s", self._ws_stats)
+
+    async def _queue_resync(self, queue: WebSocketEventQueue, reason: str) -> None:
+        """Ask the event handler for a full refresh."""
+        _LOGGER.info("WebSocket events may have been missed (%s), requesting resync", reason)
+        self._ws_stats["resyncs"] += 1
+        await queue.put(dict(WS_RESYNC_EVENT))
+
+    async def _consume_websocket_events(self, queue: WebSocketEventQueue, on_message_callback):
+        """Hand queued WebSocket events to the callback one at a time."""
+        while True:
+            data, lag = await queue.get()
+            self._ws_stats["processed"] += 1
+            self._ws_stats["last_lag"] = lag
+            self._ws_stats["max_lag"] = max(self._ws_stats["max_lag"], lag)
+            try:
+                await on_message_callback(data)
+            except Exception:  # pylint: disable=broad-except
+                # A failing handler must not stop event processing
+                _LOGGER.exception("Error handling WebSocket event")
+            seq = data.get("seq")
+            if isinstance(seq, int):
+                self._ws_handled_seq = seq
+
+
+@dataclass(frozen=True, slots=True)
+class ValidatedResponse:
+    """A decoded GET body and the conditional headers to revalidate it."""
+
+    headers: dict[str, str]
+    result: dict[str, Any]
+    size: int
+    decode_time: float
+
+
+class PooledConnectorMixin:
+    """Connector mixin counting new, reused, open and acquired connections."""
+
+    def __init__(self, **kwargs: Any) -> None:
+        """Initialize the connector."""
+        super().__init__(**kwargs)
+        # Protocols of connections opened by this connector; closed ones are
+        # skipped when counting and dropped once garbage collected
+        self._pool_protocols: weakref.WeakSet[Any] = weakref.WeakSet()
+        self._pool_acquired = 0
+        self._pool_created = 0
+        self._pool_reused = 0
+
+    @property
+    def stats(self) -> dict[str, Any]:
+        """Return open, idle and acquired connections and the reuse rate."""
+        open_conns = sum(1 for protocol in self._pool_protocols if protocol.is_connected())
+        total = self._pool_created + self._pool_reused
+        return {
+            "open": open_conns,
+            "idle": max(open_conns - self._pool_acquired, 0),
+            "acquired": self._pool_acquired,
+            "created": self._pool_created,
+            "reused": self._pool_reused,
+            "reuse_rate": round(self._pool_reused / total, 3) if total else 0.0,
+        }
+
+    async def connect(self, req, traces, timeout):
+        """Hand out a connection and track it until it is released."""
+        conn = await super().connect(req, traces, timeout)
+        protocol = conn.protocol
+        if protocol in self._pool_protocols:
+            self._pool_reused += 1
+        else:
+            self._pool_created += 1
+            self._pool_protocols.add(protocol)
+            # aiohttp already disables Nagle; set it explicitly so small
+            # command requests are never delayed behind an ACK
+            sock = conn.transport.get_extra_info("socket") if conn.transport else None
+            if sock is not None and sock.family in (socket.AF_INET, socket.AF_INET6):
+                sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+
+        self._pool_acquired += 1
+        conn.add_callback(self._release_callback())
+        return conn
+
+    def _release_callback(self):
+        """Return a callback decrementing the acquired count exactly once."""
+        released = False
+
+        def release() -> None:
+            nonlocal released
+            if not released:
+                released = True
+                self._pool_acquired -= 1
+
+        return release
+
+
+class PooledConnector(PooledConnectorMixin, aiohttp.TCPConnector):
+    """TCP connector with connection pool statistics."""
+
+
+class PooledUnixConnector(PooledConnectorMixin, aiohttp.UnixConnector):
+    """Unix domain socket connector with connection pool statistics."""
+
+
+def metrics_route(endpoint: str) -> str:
+    """Return the endpoint with its path parameters replaced by {id}."""
+    segments = endpoint.split("?", 1)[0].split("/")
+    for i in range(1, len(segments)):
+        if segments[i - 1] in METRICS_PARAM_PARENTS and segments[i] not in METRICS_ROUTE_LITERALS:
+            segments[i] = "{id}"
+    return "/".join(segments)
+
+
+class RouteMetrics:
+    """Latency histogram, recent latencies and counters for one route."""
+
+    def __init__(self, buckets: tuple[float, ...], window: int) -> None:
+        """Initialize empty metrics."""
+        self.buckets = buckets
+        # One count per bucket plus the overflow bucket
+        self.histogram = [0] * (len(buckets) + 1)
+        self.recent: deque[float] = deque(maxlen=window)
+        self.requests = 0
+        self.total_time = 0.0
+        self.counters: dict[str, int] = {}
+
+    def observe(self, latency: float) -> None:
+        """Record one request latency."""
+        self.requests += 1
+        self.total_time += latency
+        self.recent.append(latency)
+        for i, bound in enumerate(self.buckets):
+            if latency <= bound:
+                self.histogram[i] += 1
+                return
+        self.histogram[-1] += 1
+
+    def summary(self) -> dict[str, Any]:
+        """Return counts, the mean, rolling percentiles and the histogram."""
+        ordered = sorted(self.recent)
+        return {
+            "requests": self.requests,
+            "mean": round(self.total_time / self.requests, 4) if self.requests else None,
+            **{f"p{q}": percentile(ordered, q) for q in (50, 95, 99)},
+            "histogram": {
+                **{f"le_{bound}": count for bound, count in zip(self.buckets, self.histogram)},
+                "le_inf": self.histogram[-1],
+            },
+            **self.counters,
+        }
+
+
+def percentile(ordered: list[float], q: int) -> float | None:
+    """Return the nearest-rank q-th percentile of sorted values."""
+    if not ordered:
+        return None
+    rank = max(math.ceil(q / 100 * len(ordered)), 1)
+    return round(ordered[rank - 1], 4)
+
+
+class RequestMetrics:
+    """In-memory request metrics keyed by method and route.
+
+    Each route keeps a fixed-bucket latency histogram, the most recent
+    latencies for p50/p95/p99, and counters for HTTP status classes,
+    timeouts, retries, JSON and connection errors.
+    """
+
+    def __init__(
+        self, buckets: tuple[float, ...] = METRICS_BUCKETS, window: int = METRICS_WINDOW
+    ) -> None:
+        """Initialize the registry."""
+        self._buckets = buckets
+        self._window = window
+        self._routes: dict[str, RouteMetrics] = {}
+        self._overall = RouteMetrics(buckets, window)
+
+    def _route(self, method: str, endpoint: str) -> RouteMetrics:
+        """Return the metrics for a request, creating them on first use."""
+        key = f"{method} {metrics_route(endpoint)}"
+        metrics = self._routes.get(key)
+        if metrics is None:
+            metrics = self._routes[key] = RouteMetrics(self._buckets, self._window)
+        return metrics
+
+    def observe(
+        self,
+        method: str,
+        endpoint: str,
+        latency: float,
+        status: int | None,
+        error: str | None = None,
+    ) -> None:
+        """Record a finished request attempt."""
+        route = self._route(method, endpoint)
+        for metrics in (route, self._overall):
+            metrics.observe(latency)
+            if status is not None:
+                status_class = f"status_{status // 100}xx"
+                metrics.counters[status_class] = metrics.counters.get(status_class, 0) + 1
+            if error is not None:
+                metrics.counters[error] = metrics.counters.get(error, 0) + 1
+
+    def count(self, method: str, endpoint: str, counter: str) -> None:
+        """Increment a counter, such as retries, for a request."""
+        for metrics in (self._route(method, endpoint), self._overall):
+            metrics.counters[counter] = metrics.counters.get(counter, 0) + 1
+
+    def summary(self) -> dict[str, Any]:
+        """Return overall and per-route metrics."""
+        return {
+            "overall": self._overall.summary(),
+            "routes": {key: metrics.summary() for key, metrics in sorted(self._routes.items())},
+        }
+
+
+class RequestScheduler:
+    """Cap concurrent requests and admit waiting ones by priority."""
+
+    def __init__(self, max_in_flight: int) -> None:
+        """Initialize the scheduler."""
+        self._max_in_flight = max(1, max_in_flight)
+        self._in_flight = 0
+        # Heap of (priority, arrival order, future) for requests waiting on a slot
+        self._waiters: list[tuple[int, int, asyncio.Future]] = []
+        self._order = itertools.count()
+
+    @property
+    def in_flight(self) -> int:
+        """Return the number of requests holding a slot."""
+        return self._in_flight
+
+    @property
+    def queued(self) -> int:
+        """Return the number of requests waiting for a slot."""
+        return sum(1 for _, _, waiter in self._waiters if not waiter.done())
+
+    def _limit(self, priority: int) -> int:
+        """Return how many slots requests of this priority may use."""
+        if priority == PRIORITY_INTERACTIVE or self._max_in_flight == 1:
+            return self._max_in_flight
+        # Keep one slot free so user commands never queue behind background work
+        return self._max_in_flight - 1
+
+    def _wake_waiters(self) -> None:
+        """Hand free slots to the highest-priority waiters."""
+        while self._waiters:
+            priority, _, waiter = self._waiters[0]
+            if waiter.done():
+                heapq.heappop(self._waiters)
+                continue
+            if self._in_flight >= self._limit(priority):
+                return
+            heapq.heappop(self._waiters)
+            self._in_flight += 1
+            waiter.set_result(None)
+
+    @asynccontextmanager
+    async def slot(self, priority: int) -> AsyncIterator[None]:
+        """Hold a request slot for the duration of the block."""
+        if not self._waiters and self._in_flight < self._limit(priority):
+            self._in_flight += 1
+        else:
+            waiter = asyncio.get_running_loop().create_future()
+            heapq.heappush(self._waiters, (priority, next(self._order), waiter))
+            # A higher priority may use a slot that queued requests cannot
+            self._wake_waiters()
+            try:
+                await waiter
+            except asyncio.CancelledError:
+                if waiter.done() and not waiter.cancelled():
+                    # The slot was granted just before cancellation
+                    self._in_flight -= 1
+                    self._wake_waiters()
+                raise
+
+        try:
+            yield
+        finally:
+            self._in_flight -= 1
+            self._wake_waiters()
+
+
+class WebSocketEventQueue:
+    """Bounded FIFO of WebSocket events with a configurable overflow policy."""
+
+    def __init__(self, maxsize: int, overflow: str, stats: dict[str, Any]) -> None:
+        """Initialize the queue."""
+        self._maxsize = maxsize
+        self._overflow = overflow
+        self._stats = stats
+        # Entries are [key, enqueued_at, data]
+        self._items: deque[list[Any]] = deque()
+        self._changed = asyncio.Condition()
+        # Set when an event was dropped; a resync is handed out once the
+        # queue has drained, so older queued deltas cannot undo the refresh
+        self._resync_pending = False
+        self._resync_key = self._event_key(WS_RESYNC_EVENT)
+
+    def __len__(self) -> int:
+        """Return the number of queued events."""
+        return len(self._items)
+
+    @staticmethod
+    def _event_key(data: dict[str, Any]) -> tuple[Any, ...]:
+        """Return the key identifying events that supersede each other."""
+        payload = data.get("data") or {}
+        return (
+            data.get("source"),
+            data.get("event"),
+            data.get("player") or payload.get("player"),
+            payload.get("index", data.get("index")),
+        )
+
+    @staticmethod
+    def _event_target(key: tuple[Any, ...]) -> tuple[Any, ...]:
+        """Return the object an event key refers to, whatever the event type."""
+        source, event, player, index = key
+        return source, (event or "").rpartition(".")[0], player, index
+
+    @staticmethod
+    def _is_partial(data: dict[str, Any]) -> bool:
+        """Return whether an event only carries the fields that changed."""
+        return (data.get("event") or "").endswith(".change")
+
+    @staticmethod
+    def _merge_payload(older: dict[str, Any], newer: dict[str, Any]) -> dict[str, Any]:
+        """Return older updated with newer, merging nested dicts."""
+        merged = dict(older)
+        for name, value in newer.items():
+            if isinstance(value, dict) and isinstance(merged.get(name), dict):
+                value = WebSocketEventQueue._merge_payload(merged[name], value)
+            merged[name] = value
+        return merged
+
+    async def put(self, data: dict[str, Any]) -> None:
+        """Queue an event, applying the overflow policy when full."""
+        key = self._event_key(data)
+        async with self._changed:
+            if len(self._items) >= self._maxsize:
+                if self._overflow == WS_OVERFLOW_BLOCK:
+                    await self._changed.wait_for(lambda: len(self._items) < self._maxsize)
+                elif self._overflow == WS_OVERFLOW_COALESCE and self._coalesce(key, data):
+                    self._changed.notify_all()
+                    return
+                else:
+                    self._drop_oldest()
+
+            self._items.append([key, time.monotonic(), data])
+            self._stats["max_queue_depth"] = max(
+                self._stats["max_queue_depth"], len(self._items)
+            )
+            self._changed.notify_all()
+
+    def _coalesce(self, key: tuple[Any, ...], data: dict[str, Any]) -> bool:
+        """Fold a new event into a queued one with the same key.
+
+        The folded event moves to the tail so it is still handled after
+        every event queued before it. A full-state event replaces the queued
+        one. A partial change is merged into it, unless another event for
+        the same target is queued in between; the new event is then dropped
+        and a resync scheduled. Returns False when no event has the key.
+        """
+        for position, item in enumerate(self._items):
+            if item[0] == key:
+                break
+        else:
+            return False
+
+        if self._is_partial(data):
+            # Without a player or index the changed object is unknown
+            target = self._event_target(key)
+            later = itertools.islice(self._items, position + 1, None)
+            if target[2:] == (None, None) or any(
+                self._event_target(other[0]) == target for other in later
+            ):
+                self._stats["dropped"] += 1
+                self._resync_pending = True
+                return True
+            data = self._merge_payload(item[2], data)
+
+        del self._items[position]
+        self._items.append([key, item[1], data])
+        self._stats["coalesced"] += 1
+        return True
+
+    def _drop_oldest(self) -> None:
+        """Drop the oldest event other than a resync and schedule a resync."""
+        for position, item in enumerate(self._items):
+            if item[0] != self._resync_key:
+                del self._items[position]
+                self._stats["dropped"] += 1
+                self._resync_pending = True
+                return
+
+    async def get(self) -> tuple[dict[str, Any], float]:
+        """Return the oldest event and how long it waited in the queue.
+
+        After events were dropped, a WS_RESYNC_EVENT follows the last
+        queued event.
+        """
+        async with self._changed:
+            await self._changed.wait_for(lambda: len(self._items) > 0 or self._resync_pending)
+            if not self._items:
+                self._resync_pending = False
+                self._stats["resyncs"] += 1
+                _LOGGER.info("WebSocket events were dropped, requesting resync")
+                return dict(WS_RESYNC_EVENT), 0.0
+            _, enqueued_at, data = self._items.popleft()
+            self._changed.notify_all()
+        return data, time.monotonic() - enqueued_at
+
 
 class ApiClientError(Exception):
     """Exception raised for API client errors."""
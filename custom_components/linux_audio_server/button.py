@@ -70,6 +70,7 @@ class BluetoothScanButton(CoordinatorEntity, ButtonEntity):
             _LOGGER.info("Started Bluetooth scan for 10 seconds")
             # Wait for scan to complete
             await asyncio.sleep(2)
+            self.coordinator.invalidate_slices("bluetooth_devices")
             await self.coordinator.async_request_refresh()
         except Exception as err:
             _LOGGER.error("Failed to start Bluetooth scan: %s", err)
@@ -11,7 +11,7 @@ from homeassistant.core import HomeAssistant
 from homeassistant.data_entry_flow import FlowResult
 from homeassistant.helpers.aiohttp_client import async_get_clientsession
 
-from .api import ApiClientError, LinuxAudioServerApiClient
+from .api import ApiClientError, LinuxAudioServerApiClient, unix_socket_path
 from .const import DEFAULT_NAME, DEFAULT_PORT, DOMAIN
 
 _LOGGER = logging.getLogger(__name__)
@@ -29,15 +29,20 @@ async def validate_input(hass: HomeAssistant, data: dict[str, Any]) -> dict[str,
 
     Data has the keys from STEP_USER_DATA_SCHEMA with values provided by the user.
     """
-    session = async_get_clientsession(hass)
+    # A unix:// host cannot use the shared TCP session; the client opens
+    # its own socket connection instead
+    unix_socket = unix_socket_path(data[CONF_HOST]) is not None
     client = LinuxAudioServerApiClient(
         host=data[CONF_HOST],
         port=data[CONF_PORT],
-        session=session,
+        session=None if unix_socket else async_get_clientsession(hass),
     )
 
     # Test the connection
-    await client.health_check()
+    try:
+        await client.health_check()
+    finally:
+        await client.async_close()
 
     # Return info that you want to store in the config entry.
     return {"title": f"{DEFAULT_NAME} ({data[CONF_HOST]})"}
@@ -63,10 +68,12 @@ class ConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
                 _LOGGER.exception("Unexpected exception")
                 errors["base"] = "unknown"
             else:
-                # Check if already configured
-                await self.async_set_unique_id(
-                    f"{user_input[CONF_HOST]}:{user_input[CONF_PORT]}"
-                )
+                # Check if already configured; the port is unused for a socket
+                if unix_socket_path(user_input[CONF_HOST]) is not None:
+                    unique_id = user_input[CONF_HOST]
+                else:
+                    unique_id = f"{user_input[CONF_HOST]}:{user_input[CONF_PORT]}"
+                await self.async_set_unique_id(unique_id)
                 self._abort_if_unique_id_configured()
 
                 return self.async_create_entry(title=info["title"], data=user_input)
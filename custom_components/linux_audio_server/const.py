@@ -12,6 +12,54 @@ DEFAULT_NAME = "Linux Audio Server"
 SCAN_INTERVAL_SINKS = 5  # seconds
 SCAN_INTERVAL_STREAMS = 2  # seconds (more frequent for active streams)
 
+# Coordinator polling adapts to the WebSocket push channel (seconds): polls are
+# pure reconciliation while the socket is healthy, and tighten while it is down
+POLL_MODE_PUSH = "push"
+POLL_MODE_FALLBACK = "fallback"
+POLL_INTERVAL_PUSH = 90
+POLL_INTERVAL_FALLBACK = 5
+
+# Refresh cadence per coordinator data slice, in seconds.
+# SLICE_REFRESH_EVERY_UPDATE refetches the slice on every coordinator update.
+# Slow-changing slices are served from cache until their interval elapses or
+# they are invalidated (service call or relevant event).
+SLICE_REFRESH_EVERY_UPDATE = 0
+SLICE_REFRESH_INTERVALS: dict[str, int] = {
+    "sinks": SLICE_REFRESH_EVERY_UPDATE,
+    "sink_inputs": SLICE_REFRESH_EVERY_UPDATE,
+    "playback": SLICE_REFRESH_EVERY_UPDATE,
+    "players": SLICE_REFRESH_EVERY_UPDATE,
+    "bluetooth_devices": 60,  # Connection state feeds the device trackers
+    "player_assignments": 60,
+    "keep_alive": 300,
+    "radio_streams": 900,
+}
+
+# WebSocket events that need a refetch are coalesced: a refresh is issued once
+# no new event arrived for the window, but never later than the max delay
+# after the first event of the burst (seconds)
+EVENT_COALESCE_WINDOW = 0.15
+EVENT_COALESCE_MAX_DELAY = 1.0
+
+# WebSocket reconnect backoff (seconds): exponential from the min delay up to
+# the max delay, with jitter. Reset once a connection stayed up long enough.
+WS_RECONNECT_MIN_DELAY = 1
+WS_RECONNECT_MAX_DELAY = 60
+WS_STABLE_CONNECTION = 60
+
+# Data slices refetched for a WebSocket event, keyed by "<source>.<event>".
+# A key ending in ".*" matches every event with that prefix. Events without
+# a route fall back to a full refresh.
+EVENT_SLICE_ROUTES: dict[str, tuple[str, ...]] = {
+    "mopidy.playback_state_changed": ("players", "playback"),
+    "mopidy.track_playback_started": ("players", "playback"),
+    "mopidy.track_playback_ended": ("players", "playback"),
+    "mopidy.track_playback_paused": ("players", "playback"),
+    "mopidy.track_playback_resumed": ("players", "playback"),
+    "pulseaudio.sink_input.*": ("sink_inputs",),
+    "pulseaudio.sink.*": ("sinks",),
+}
+
 # API endpoints
 API_BASE = "/api"
 API_AUDIO_SINKS = f"{API_BASE}/audio/sinks"
@@ -21,6 +69,36 @@ API_AUDIO_SINK_DEFAULT = f"{API_BASE}/audio/sink/default"
 API_BLUETOOTH_DEVICES = f"{API_BASE}/bluetooth/devices"
 API_HEALTH = f"{API_BASE}/health"
 
+# Requested values are shown immediately and kept until the backend confirms
+# them, or rolled back once it still disagrees after this long (seconds)
+OPTIMISTIC_STATE_TTL = 5
+
+# The last good snapshot is persisted so entities can be created from it at
+# startup while the first live refresh runs; writes are batched (seconds)
+SNAPSHOT_STORAGE_VERSION = 1
+SNAPSHOT_SAVE_DELAY = 30
+
+# Entities of a sink or Bluetooth device that has been gone this long are
+# removed from Home Assistant (seconds)
+ENTITY_REMOVAL_GRACE = 120
+
+# Recent state resolutions kept per sink while decision tracing is enabled
+DECISION_TRACE_SIZE = 50
+
+# Logical audio sources, identified by their sink-input application name
+SOURCE_AIRPLAY = "airplay"
+SOURCE_TTS = "tts"
+SOURCE_SPOTIFY = "spotify"
+SINK_INPUT_SOURCE_PATTERNS = {
+    SOURCE_AIRPLAY: r"Shairport Sync",
+    SOURCE_TTS: r"Mopidy Player 1 \(TTS\)",
+    SOURCE_SPOTIFY: r"librespot",
+}
+
+# Mopidy sink-inputs, e.g. "Mopidy Player 2@unix:/run/pulse/native" -> player2
+MOPIDY_PLAYER_PATTERN = r"Mopidy Player (\d+)"
+MOPIDY_PLAYER_ID = "player{}"
+
 # Device classes
 DEVICE_CLASS_SPEAKER = "speaker"
 
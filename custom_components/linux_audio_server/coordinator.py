@@ -2,18 +2,114 @@
 from __future__ import annotations
 
 import asyncio
-from datetime import timedelta
+from collections import deque
+from dataclasses import fields, replace
+from datetime import datetime, timedelta
 import logging
+from operator import attrgetter
+import random
 import time
-from typing import Any
+from typing import Any, Awaitable, Callable
 
-from homeassistant.core import HomeAssistant
+from homeassistant.components.media_player import MediaPlayerState
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.storage import Store
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, UpdateFailed
 
-from .api import ApiClientError, LinuxAudioServerApiClient
+from .api import (
+    PRIORITY_BACKGROUND,
+    PRIORITY_EVENT,
+    REQUEST_PRIORITY,
+    ApiClientError,
+    LinuxAudioServerApiClient,
+)
+from .const import (
+    DECISION_TRACE_SIZE,
+    DOMAIN,
+    EVENT_COALESCE_MAX_DELAY,
+    EVENT_COALESCE_WINDOW,
+    EVENT_SLICE_ROUTES,
+    POLL_INTERVAL_FALLBACK,
+    POLL_INTERVAL_PUSH,
+    POLL_MODE_FALLBACK,
+    POLL_MODE_PUSH,
+    SLICE_REFRESH_EVERY_UPDATE,
+    SLICE_REFRESH_INTERVALS,
+    SNAPSHOT_SAVE_DELAY,
+    SNAPSHOT_STORAGE_VERSION,
+    WS_RECONNECT_MAX_DELAY,
+    WS_RECONNECT_MIN_DELAY,
+    WS_STABLE_CONNECTION,
+)
+from .lifecycle import EntityLifecycleManager
+from .matcher import SinkInputMatcher
+from .models import (
+    BluetoothDevice,
+    Player,
+    Sink,
+    SinkInput,
+    Track,
+    parse_models,
+)
 
 _LOGGER = logging.getLogger(__name__)
 
+# Mopidy player states mapped to media player states
+PLAYER_STATES = {
+    "playing": MediaPlayerState.PLAYING,
+    "paused": MediaPlayerState.PAUSED,
+    "stopped": MediaPlayerState.IDLE,
+}
+
+# PulseAudio sink states mapped to media player states (anything else is OFF)
+SINK_STATES = {
+    "RUNNING": MediaPlayerState.ON,
+    "IDLE": MediaPlayerState.IDLE,
+    "SUSPENDED": MediaPlayerState.IDLE,
+}
+
+# Slices the integration cannot work without; a failure fails the whole update
+CORE_SLICES = ("sinks", "sink_inputs", "playback")
+
+# Fallback responses used when an optional slice cannot be fetched
+OPTIONAL_SLICE_DEFAULTS: dict[str, dict[str, Any]] = {
+    "radio_streams": {"streams": {}},
+    "bluetooth_devices": {"devices": [], "available": False},
+    "keep_alive": {"enabled": False, "interval": 240, "enabled_sinks": []},
+    "players": {"players": []},
+    "player_assignments": {"assignments": {}},
+}
+
+# Raw data keys compared between snapshots; each is also a change key
+SNAPSHOT_KEYS = (
+    "sinks",
+    "default_sink",
+    "sink_inputs",
+    "playback",
+    "radio_streams",
+    "bluetooth_devices",
+    "keep_alive",
+    "players",
+    "player_assignments",
+)
+
+# Per-item change keys: (kind, index key, raw slice backing the index)
+SNAPSHOT_ITEM_INDEXES = (
+    ("sink", "sinks_by_name", "sinks"),
+    ("player", "players_by_id", "players"),
+    ("bluetooth_device", "bluetooth_devices_by_address", "bluetooth_devices"),
+    ("source", "sink_inputs_by_source", "sink_inputs"),
+    ("sink_playback", "sink_playback", None),
+)
+
+# Change key for sinks being added, removed or renamed
+SINK_LIST_KEY = "sink_list"
+
+
+def snapshot_storage_key(entry_id: str) -> str:
+    """Return the storage key of a config entry's persisted snapshot."""
+    return f"{DOMAIN}.{entry_id}.snapshot"
+
 
 class LinuxAudioServerCoordinator(DataUpdateCoordinator[dict[str, Any]]):
     """Class to manage fetching Linux Audio Server data."""
@@ -22,92 +118,577 @@ class LinuxAudioServerCoordinator(DataUpdateCoordinator[dict[str, Any]]):
         self,
         hass: HomeAssistant,
         client: LinuxAudioServerApiClient,
+        event_coalesce_window: float = EVENT_COALESCE_WINDOW,
+        event_coalesce_max_delay: float = EVENT_COALESCE_MAX_DELAY,
+        poll_interval_push: float = POLL_INTERVAL_PUSH,
+        poll_interval_fallback: float = POLL_INTERVAL_FALLBACK,
+        matcher: SinkInputMatcher | None = None,
+        entry_id: str | None = None,
     ) -> None:
         """Initialize coordinator."""
+        # Poll tightly until the WebSocket (primary update source) is up
         super().__init__(
             hass,
             _LOGGER,
             name="Linux Audio Server",
-            update_interval=timedelta(seconds=15),  # Reduced polling frequency (WebSocket is primary)
+            update_interval=timedelta(seconds=poll_interval_fallback),
         )
         self.client = client
+        self._poll_intervals = {
+            POLL_MODE_PUSH: timedelta(seconds=poll_interval_push),
+            POLL_MODE_FALLBACK: timedelta(seconds=poll_interval_fallback),
+        }
+        self.poll_mode = POLL_MODE_FALLBACK
         self._ws_task = None
-        self._ws_reconnect_delay = 5
+        self._ws_reconnect_attempt = 0
+
+        # Parsed data per slice, merged into coordinator.data on every update
+        self._slice_cache: dict[str, dict[str, Any]] = {}
+        self._slice_fetched_at: dict[str, float] = {}
+        self._invalidated_slices: set[str] = set()
+
+        # Raw responses behind the slice cache, persisted for fast startup
+        self._slice_responses: dict[str, dict[str, Any]] = {}
+        self._snapshot_store: Store | None = (
+            Store(hass, SNAPSHOT_STORAGE_VERSION, snapshot_storage_key(entry_id))
+            if entry_id
+            else None
+        )
+        # True while data comes from the persisted snapshot, until a live poll succeeds
+        self.snapshot_stale = False
+
+        # Classifies sink-inputs into logical sources and Mopidy players
+        self.matcher = matcher or SinkInputMatcher()
+
+        # Adds and removes per-sink and per-device entities for all platforms
+        self.entity_lifecycle = EntityLifecycleManager(hass, self)
+
+        # Playback resolved for sinks missing from the snapshot, on request
+        self._absent_sink_playback: dict[str, dict[str, Any]] = {}
+
+        # Keys changed by the latest snapshot (None: treat everything as changed)
+        self.changed_keys: set[str | tuple[str, Any]] | None = None
+
+        # Recent sink state resolutions, only recorded while enabled
+        self.decision_trace_enabled = False
+        self._decision_traces: dict[str, deque[dict[str, Any]]] = {}
+        self._entity_write_stats = {"written": 0, "skipped": 0}
+
+        # Slices requested by WebSocket events, refreshed once per burst
+        self._event_coalesce_window = event_coalesce_window
+        self._event_coalesce_max_delay = event_coalesce_max_delay
+        self._pending_event_slices: set[str] = set()
+        self._pending_full_refresh = False
+        self._last_event_time = 0.0
+        self._event_flush_task: asyncio.Task | None = None
+        self._event_stats = {
+            "events_received": 0,
+            "deltas_applied": 0,
+            "refreshes_issued": 0,
+        }
+
+    @property
+    def event_stats(self) -> dict[str, int]:
+        """Return counters for WebSocket event handling."""
+        return dict(self._event_stats)
+
+    @property
+    def entity_write_stats(self) -> dict[str, int]:
+        """Return how many entity updates were written or skipped as unchanged."""
+        return dict(self._entity_write_stats)
+
+    def set_decision_trace(self, enabled: bool) -> None:
+        """Start or stop recording sink state resolutions."""
+        self.decision_trace_enabled = enabled
+        if not enabled:
+            self._decision_traces.clear()
+
+    def decision_traces(self, sink_name: str | None = None) -> dict[str, list[dict[str, Any]]]:
+        """Return recorded state resolutions per sink, oldest first."""
+        if sink_name is not None:
+            return {sink_name: list(self._decision_traces.get(sink_name, ()))}
+        return {name: list(trace) for name, trace in self._decision_traces.items()}
+
+    def record_entity_update(self, written: bool) -> None:
+        """Count an entity's reaction to a coordinator update."""
+        self._entity_write_stats["written" if written else "skipped"] += 1
+
+    def _update_poll_mode(self) -> bool:
+        """Adapt the poll interval to WebSocket health, returning True on change."""
+        mode = POLL_MODE_PUSH if self.client.websocket_connected else POLL_MODE_FALLBACK
+        if mode == self.poll_mode:
+            return False
+
+        self.poll_mode = mode
+        self.update_interval = self._poll_intervals[mode]
+        _LOGGER.info(
+            "Polling switched to %s mode (every %ss)",
+            mode, self.update_interval.total_seconds()
+        )
+        return True
+
+    def invalidate_slices(self, *slices: str) -> None:
+        """Force the given slices to be refetched on the next update."""
+        self._invalidated_slices.update(slices)
+
+    def _due_slices(self) -> list[str]:
+        """Return the slices whose refresh policy requires a fetch now."""
+        now = time.monotonic()
+        due = []
+        for name in self._slice_fetchers():
+            interval = SLICE_REFRESH_INTERVALS.get(name, SLICE_REFRESH_EVERY_UPDATE)
+            if (
+                name not in self._slice_cache
+                or name in self._invalidated_slices
+                or now - self._slice_fetched_at[name] >= interval
+            ):
+                due.append(name)
+        return due
+
+    def _slice_fetchers(self) -> dict[str, Callable[[], Awaitable[dict[str, Any]]]]:
+        """Return the API call used to fetch each data slice."""
+        return {
+            "sinks": self.client.get_sinks,
+            "sink_inputs": self.client.get_sink_inputs,
+            "playback": self.client.get_playback_status,
+            "radio_streams": self.client.get_radio_streams,
+            "bluetooth_devices": self.client.get_bluetooth_devices,
+            "keep_alive": self.client.get_keep_alive_status,
+            "players": self.client.get_players,
+            "player_assignments": self.client.get_player_assignments,
+        }
+
+    async def _async_fetch_slice(
+        self,
+        name: str,
+        fetch: Callable[[], Awaitable[dict[str, Any]]],
+    ) -> tuple[dict[str, Any] | None, ApiClientError | None, float]:
+        """Fetch a single data slice, capturing its error and duration."""
+        start = time.time()
+        try:
+            response = await fetch()
+        except ApiClientError as err:
+            return None, err, time.time() - start
+        return response, None, time.time() - start
 
     async def _async_update_data(self) -> dict[str, Any]:
         """Fetch data from API."""
         poll_start = time.time()
         _LOGGER.debug("Starting data update poll cycle")
+        self._update_poll_mode()
 
+        # Fetch every due slice in parallel; slow-changing slices that are
+        # not due are served from cache. Errors are isolated per slice so a
+        # failing optional feature (radio, Bluetooth, ...) never fails the
+        # others; only the core slices are required for the update to succeed.
+        # Note: the sinks slice already contains default_sink AND combined sinks
+        fetchers = self._slice_fetchers()
+        due = self._due_slices()
+        self._invalidated_slices.difference_update(due)
+        fetch_time = time.monotonic()
+        # Polls yield to user commands and event-triggered refreshes
+        token = REQUEST_PRIORITY.set(PRIORITY_BACKGROUND)
         try:
-            # Fetch core data in parallel
-            # Note: sinks_data already contains default_sink AND combined sinks
-            core_start = time.time()
-            sinks_data, sink_inputs_data, playback_data = await asyncio.gather(
-                self.client.get_sinks(),
-                self.client.get_sink_inputs(),
-                self.client.get_playback_status(),
+            results = await asyncio.gather(
+                *(self._async_fetch_slice(name, fetchers[name]) for name in due)
             )
-            core_time = time.time() - core_start
-            _LOGGER.debug("Core data fetched in %.3fs", core_time)
+        finally:
+            REQUEST_PRIORITY.reset(token)
+        responses = dict(zip(due, results))
 
-            # Gracefully fetch optional features (radio and Bluetooth)
-            # If these fail, the integration continues to work
-            radio_data = {}
-            try:
-                radio_data = await self.client.get_radio_streams()
-            except ApiClientError as err:
-                _LOGGER.debug("Failed to fetch radio streams: %s", err)
-                radio_data = {"streams": {}}
+        timings = ", ".join(
+            f"{name}: {elapsed:.3f}s{' (failed)' if err else ''}"
+            for name, (_, err, elapsed) in responses.items()
+        )
 
-            bluetooth_data = {}
-            try:
-                bluetooth_data = await self.client.get_bluetooth_devices()
-                # Check if Bluetooth is available (new field from backend)
-                if not bluetooth_data.get("available", True):
-                    _LOGGER.debug("Bluetooth service not yet available, will retry on next update")
-            except ApiClientError as err:
-                _LOGGER.debug("Failed to fetch Bluetooth devices: %s", err)
-                bluetooth_data = {"devices": [], "available": False}
+        for name in CORE_SLICES:
+            if name not in responses:
+                continue
+            _, err, _ = responses[name]
+            if err is not None:
+                self._invalidated_slices.update(due)
+                elapsed = time.time() - poll_start
+                _LOGGER.error(
+                    "Data update poll cycle failed after %.3fs: %s (%s)",
+                    elapsed, err, timings
+                )
+                raise UpdateFailed(f"Error communicating with API: {err}") from err
 
-            keep_alive_data = {}
-            try:
-                keep_alive_data = await self.client.get_keep_alive_status()
-            except ApiClientError as err:
-                _LOGGER.debug("Failed to fetch keep-alive status: %s", err)
-                keep_alive_data = {"enabled": False, "interval": 240, "enabled_sinks": []}
+        for name, (response, err, _) in responses.items():
+            if err is None:
+                self._store_slice(name, response, fetch_time)
+                continue
 
-            # Fetch multi-player data (optional feature)
-            players_data = {}
-            player_assignments_data = {}
-            try:
-                players_data = await self.client.get_players()
-                player_assignments_data = await self.client.get_player_assignments()
-            except ApiClientError as err:
-                _LOGGER.debug("Failed to fetch player data: %s", err)
-                players_data = {"players": []}
-                player_assignments_data = {"assignments": {}}
-
-            result = {
-                "sinks": sinks_data.get("sinks", []),
-                "default_sink": sinks_data.get("default_sink"),
-                "sink_inputs": sink_inputs_data.get("sink_inputs", []),
-                "playback": playback_data,
-                "radio_streams": radio_data.get("streams", {}),
-                "bluetooth_devices": bluetooth_data.get("devices", []),
-                "keep_alive": keep_alive_data,
-                "players": players_data.get("players", []),
-                "player_assignments": player_assignments_data.get("assignments", {}),
-            }
+            # Retry a failed slice on the next update, keeping any cached
+            # value until then. Optional features without one degrade
+            # gracefully to empty data.
+            self._invalidated_slices.add(name)
+            if name in self._slice_cache:
+                _LOGGER.debug("Failed to fetch %s, keeping cached data: %s", name, err)
+            else:
+                _LOGGER.debug("Failed to fetch %s: %s", name, err)
+
+        total_time = time.time() - poll_start
+        _LOGGER.debug(
+            "Data update poll cycle completed in %.3fs, fetched %d/%d slices (%s)",
+            total_time, len(due), len(fetchers), timings
+        )
+        if self.snapshot_stale:
+            _LOGGER.info("First live update replaced the cached snapshot")
+            self.snapshot_stale = False
+        return self._index_snapshot(self._merge_slices())
 
-            total_time = time.time() - poll_start
-            _LOGGER.debug("Data update poll cycle completed in %.3fs", total_time)
-            return result
+    def _merge_slices(self) -> dict[str, Any]:
+        """Merge the slice cache into coordinator data, with defaults for missing slices."""
+        result: dict[str, Any] = {}
+        for name in self._slice_fetchers():
+            if name in self._slice_cache:
+                result.update(self._slice_cache[name])
+            else:
+                result.update(self._parse_slice(name, OPTIONAL_SLICE_DEFAULTS[name]))
+        return result
 
-        except ApiClientError as err:
-            elapsed = time.time() - poll_start
-            _LOGGER.error("Data update poll cycle failed after %.3fs: %s", elapsed, err)
-            raise UpdateFailed(f"Error communicating with API: {err}") from err
+    async def async_load_snapshot(self) -> bool:
+        """Populate data from the persisted snapshot, returning True if one existed.
+
+        The restored slices are marked invalid, so the first live update
+        refetches all of them; until then snapshot_stale is True.
+        """
+        if self._snapshot_store is None:
+            return False
+
+        stored = await self._snapshot_store.async_load()
+        if not stored or not all(name in stored["slices"] for name in CORE_SLICES):
+            return False
+
+        for name, response in stored["slices"].items():
+            if name in self._slice_fetchers():
+                self._slice_responses[name] = response
+                self._slice_cache[name] = self._parse_slice(name, response)
+                self._invalidated_slices.add(name)
+
+        self.snapshot_stale = True
+        self.data = self._index_snapshot(self._merge_slices())
+        _LOGGER.debug("Loaded cached snapshot saved at %s", stored.get("saved_at"))
+        return True
+
+    def _snapshot_to_store(self) -> dict[str, Any]:
+        """Return the raw slice responses to persist."""
+        return {
+            "saved_at": datetime.now().isoformat(),
+            "slices": self._slice_responses,
+        }
+
+    @callback
+    def async_set_updated_data(self, data: dict[str, Any]) -> None:
+        """Index and publish data produced outside a poll (events, targeted refreshes)."""
+        super().async_set_updated_data(self._index_snapshot(data))
+
+    @callback
+    def _async_publish_event_data(self, data: dict[str, Any]) -> None:
+        """Index and publish event-driven data without rescheduling the poll.
+
+        async_set_updated_data restarts the refresh timer, so events arriving
+        more often than update_interval would postpone the reconciliation
+        poll (the only refresh of bluetooth_devices, keep_alive, ...) forever.
+        """
+        self.data = self._index_snapshot(data)
+        self.async_update_listeners()
+
+    def _index_snapshot(self, data: dict[str, Any]) -> dict[str, Any]:
+        """Add lookup indexes and resolved sink playback, built once per update."""
+        sinks_by_name = {}
+        sinks_by_description = {}
+        for sink in data.get("sinks", []):
+            sinks_by_name[sink.name] = sink
+            sinks_by_description.setdefault(sink.description, sink)
+
+        sink_inputs = data.get("sink_inputs", [])
+        sink_inputs_by_sink: dict[str, list[SinkInput]] = {}
+        sink_inputs_by_source = {}
+        active_player_by_sink = {}
+        for sink_input in sink_inputs:
+            sink_inputs_by_sink.setdefault(sink_input.sink, []).append(sink_input)
+            match = self.matcher.match(sink_input)
+            if match.source is not None:
+                sink_inputs_by_source.setdefault(match.source, sink_input)
+            if match.player is not None:
+                active_player_by_sink.setdefault(sink_input.sink, match.player)
+        self.matcher.prune(sink_inputs)
+
+        data["sinks_by_name"] = sinks_by_name
+        data["sinks_by_description"] = sinks_by_description
+        data["sink_inputs_by_sink"] = sink_inputs_by_sink
+        data["sink_inputs_by_source"] = sink_inputs_by_source
+        data["active_player_by_sink"] = active_player_by_sink
+        data["players_by_id"] = {
+            player.id: player for player in data.get("players", [])
+        }
+        data["bluetooth_devices_by_address"] = {
+            device.address: device for device in data.get("bluetooth_devices", [])
+        }
+        data["sink_playback"] = {
+            name: self._resolve_sink_playback(data, name, sink)
+            for name, sink in sinks_by_name.items()
+        }
+        self.changed_keys = self._diff_snapshots(self.data, data)
+
+        # Re-resolve the absent sinks entities asked about against the new data
+        absent_playback = {
+            name: self._resolve_sink_playback(data, name, None)
+            for name in self._absent_sink_playback
+            if name not in sinks_by_name
+        }
+        if self.changed_keys is not None:
+            self.changed_keys.update(
+                ("sink_playback", name)
+                for name, resolved in absent_playback.items()
+                if self._absent_sink_playback[name] != resolved
+            )
+        self._absent_sink_playback = absent_playback
+        return data
+
+    @staticmethod
+    def _diff_snapshots(
+        old: dict[str, Any] | None, new: dict[str, Any]
+    ) -> set[str | tuple[str, Any]] | None:
+        """Return the change keys that differ between two indexed snapshots."""
+        if old is None:
+            return None
+
+        changed: set[str | tuple[str, Any]] = {
+            key for key in SNAPSHOT_KEYS if old.get(key) != new.get(key)
+        }
+        for kind, index_key, source in SNAPSHOT_ITEM_INDEXES:
+            if source is not None and source not in changed:
+                continue
+            old_items = old.get(index_key, {})
+            new_items = new.get(index_key, {})
+            for ident in old_items.keys() | new_items.keys():
+                if old_items.get(ident) != new_items.get(ident):
+                    changed.add((kind, ident))
+
+        if "sinks" in changed:
+            old_list = [(sink.name, sink.description) for sink in old.get("sinks", [])]
+            new_list = [(sink.name, sink.description) for sink in new.get("sinks", [])]
+            if old_list != new_list:
+                changed.add(SINK_LIST_KEY)
+        return changed
+
+    def sink_playback(self, sink_name: str) -> dict[str, Any]:
+        """Return the resolved state, active player and track for a sink."""
+        resolved = self.data.get("sink_playback", {}).get(sink_name)
+        if resolved is None:
+            # Sinks that are gone (e.g. a disconnected Bluetooth speaker) still
+            # get the assignment/global fallbacks; resolve them on first use,
+            # outside the published snapshot so it is never mutated
+            resolved = self._absent_sink_playback.get(sink_name)
+            if resolved is None:
+                resolved = self._resolve_sink_playback(self.data, sink_name, None)
+                self._absent_sink_playback[sink_name] = resolved
+        return resolved
+
+    def _resolve_sink_playback(
+        self, data: dict[str, Any], sink_name: str, sink: Sink | None
+    ) -> dict[str, Any]:
+        """Resolve what is playing on a sink.
+
+        The player actually routing audio to the sink (from sink-inputs) wins,
+        then the player assigned to the sink, then the global playback
+        (player1). The PulseAudio sink state is the last resort for the state.
+        """
+        players_by_id = data.get("players_by_id", {})
+        sink_inputs = data.get("sink_inputs_by_sink", {}).get(sink_name, [])
+        active_player = data.get("active_player_by_sink", {}).get(sink_name)
+        assigned_player = data.get("player_assignments", {}).get(sink_name)
+        playback = data.get("playback", {})
+
+        state = None
+        priority = None
+        track = None
+        track_source = None
+        for player_priority, player_id in ((1, active_player), (2, assigned_player)):
+            player = players_by_id.get(player_id) if player_id else None
+            if player is None:
+                continue
+            if track_source is None:
+                track = player.current_track
+                track_source = player_id
+            if state is None:
+                state = PLAYER_STATES.get(player.state)
+                if state is not None:
+                    priority = player_priority
+
+        if track_source is None:
+            track = playback.get("track")
+        if sink is None:
+            state = MediaPlayerState.OFF
+            priority = None
+        elif state is None:
+            state = PLAYER_STATES.get(playback.get("state"))
+            priority = 3
+            if state is None:
+                sink_state = sink.state if sink.state is not None else "IDLE"
+                state = SINK_STATES.get(sink_state, MediaPlayerState.OFF)
+                priority = 4
+
+        if self.decision_trace_enabled:
+            self._record_decision(
+                sink_name,
+                {
+                    "time": datetime.now().isoformat(),
+                    "result": state.value,
+                    "priority": priority,
+                    "sink_exists": sink is not None,
+                    "sink_inputs": [sink_input.name for sink_input in sink_inputs],
+                    "active_player": active_player,
+                    "active_player_state": self._player_state(players_by_id, active_player),
+                    "assigned_player": assigned_player,
+                    "assigned_player_state": self._player_state(players_by_id, assigned_player),
+                    "playback_state": playback.get("state"),
+                    "sink_state": sink.state if sink is not None else None,
+                    "track_from": track_source or "playback",
+                },
+            )
+        return {
+            "state": state,
+            "active_player": active_player,
+            "track": track,
+        }
+
+    @staticmethod
+    def _player_state(players_by_id: dict[str, Player], player_id: str | None) -> str | None:
+        """Return a player's reported state for a decision trace."""
+        player = players_by_id.get(player_id) if player_id else None
+        return player.state if player is not None else None
+
+    def _record_decision(self, sink_name: str, decision: dict[str, Any]) -> None:
+        """Append a state resolution to the sink's trace."""
+        trace = self._decision_traces.get(sink_name)
+        if trace is None:
+            trace = self._decision_traces[sink_name] = deque(maxlen=DECISION_TRACE_SIZE)
+        trace.append(decision)
+
+    def _store_slice(self, name: str, response: dict[str, Any], fetch_time: float) -> None:
+        """Parse a fetched slice into the cache and schedule persisting changes."""
+        self._slice_fetched_at[name] = fetch_time
+        previous = self._slice_responses.get(name)
+        if response is previous and name in self._slice_cache:
+            # A 304 or cached GET hands back the object parsed last time
+            return
+
+        self._slice_cache[name] = self._parse_slice(name, response)
+        # Keep the latest object so the next 304 can be recognized by identity
+        self._slice_responses[name] = response
+        if previous != response and self._snapshot_store is not None:
+            self._snapshot_store.async_delay_save(self._snapshot_to_store, SNAPSHOT_SAVE_DELAY)
+
+    async def async_refresh_slices(self, *slices: str) -> None:
+        """Refetch only the given slices and push the merged data to listeners."""
+        if self.data is None:
+            await self.async_request_refresh()
+            return
+
+        refresh_start = time.time()
+        fetchers = self._slice_fetchers()
+        fetch_time = time.monotonic()
+        token = REQUEST_PRIORITY.set(PRIORITY_EVENT)
+        try:
+            results = await asyncio.gather(
+                *(self._async_fetch_slice(name, fetchers[name]) for name in slices)
+            )
+        finally:
+            REQUEST_PRIORITY.reset(token)
+
+        data = dict(self.data)
+        updated = []
+        for name, (response, err, _) in zip(slices, results):
+            if err is not None:
+                # Leave the current data in place; the next update retries
+                _LOGGER.debug("Failed to refresh %s: %s", name, err)
+                self._invalidated_slices.add(name)
+                continue
+            self._store_slice(name, response, fetch_time)
+            data.update(self._slice_cache[name])
+            updated.append(name)
+
+        if updated:
+            self._async_publish_event_data(data)
+        _LOGGER.debug(
+            "Targeted refresh of %s completed in %.3fs",
+            ", ".join(updated) or "no slices", time.time() - refresh_start
+        )
+
+    @staticmethod
+    def _slices_for_event(event_source: str, event_type: str) -> tuple[str, ...] | None:
+        """Return the slices affected by a WebSocket event, if it is routed."""
+        key = f"{event_source}.{event_type}"
+        if key in EVENT_SLICE_ROUTES:
+            return EVENT_SLICE_ROUTES[key]
+        for pattern, slices in EVENT_SLICE_ROUTES.items():
+            if pattern.endswith(".*") and key.startswith(pattern[:-1]):
+                return slices
+        return None
+
+    def _parse_slice(self, name: str, response: dict[str, Any]) -> dict[str, Any]:
+        """Map a raw API response onto the coordinator data keys it provides.
+
+        Lists are parsed into models, reusing the cached objects for items
+        that did not change since the last fetch of the slice.
+        """
+        previous = self._slice_cache.get(name, {})
+        if name == "sinks":
+            return {
+                "sinks": parse_models(
+                    Sink.from_dict,
+                    attrgetter("name"),
+                    response.get("sinks", []),
+                    previous.get("sinks"),
+                ),
+                "default_sink": response.get("default_sink"),
+            }
+        if name == "sink_inputs":
+            return {
+                "sink_inputs": parse_models(
+                    SinkInput.from_dict,
+                    attrgetter("index"),
+                    response.get("sink_inputs", []),
+                    previous.get("sink_inputs"),
+                )
+            }
+        if name == "radio_streams":
+            return {"radio_streams": response.get("streams", {})}
+        if name == "bluetooth_devices":
+            # Check if Bluetooth is available (new field from backend)
+            if not response.get("available", True):
+                _LOGGER.debug("Bluetooth service not yet available, will retry on next update")
+            return {
+                "bluetooth_devices": parse_models(
+                    BluetoothDevice.from_dict,
+                    attrgetter("address"),
+                    response.get("devices", []),
+                    previous.get("bluetooth_devices"),
+                )
+            }
+        if name == "players":
+            return {
+                "players": parse_models(
+                    Player.from_dict,
+                    attrgetter("id"),
+                    response.get("players", []),
+                    previous.get("players"),
+                )
+            }
+        if name == "player_assignments":
+            return {"player_assignments": response.get("assignments", {})}
+        if name == "playback":
+            track = Track.from_dict(response.get("track"))
+            previous_track = previous.get("playback", {}).get("track")
+            if track == previous_track:
+                track = previous_track
+            return {"playback": {**response, "track": track}}
+        # keep_alive is stored as returned by the API
+        return {name: response}
 
     async def async_start_websocket(self):
         """Start WebSocket listener for real-time updates."""
@@ -120,6 +701,8 @@ class LinuxAudioServerCoordinator(DataUpdateCoordinator[dict[str, Any]]):
 
     async def async_stop_websocket(self):
         """Stop WebSocket listener."""
+        if self._event_flush_task and not self._event_flush_task.done():
+            self._event_flush_task.cancel()
         if self._ws_task and not self._ws_task.done():
             _LOGGER.info("Stopping WebSocket listener")
             self._ws_task.cancel()
@@ -131,6 +714,7 @@ class LinuxAudioServerCoordinator(DataUpdateCoordinator[dict[str, Any]]):
     async def _websocket_listener(self):
         """Listen to WebSocket events and trigger updates."""
         while True:
+            connect_start = time.monotonic()
             try:
                 _LOGGER.info("Connecting to WebSocket event stream...")
                 await self.client.connect_websocket(self._handle_websocket_event)
@@ -145,9 +729,29 @@ class LinuxAudioServerCoordinator(DataUpdateCoordinator[dict[str, Any]]):
             except Exception as err:
                 _LOGGER.error(f"Unexpected WebSocket error: {err}")
 
+            # Tighten polling right away while the push channel is down
+            if self._update_poll_mode():
+                await self.async_request_refresh()
+
+            # A connection that stayed up long enough resets the backoff
+            if time.monotonic() - connect_start >= WS_STABLE_CONNECTION:
+                self._ws_reconnect_attempt = 0
+
             # Wait before reconnecting
-            _LOGGER.info(f"Reconnecting WebSocket in {self._ws_reconnect_delay} seconds...")
-            await asyncio.sleep(self._ws_reconnect_delay)
+            delay = self._next_reconnect_delay()
+            _LOGGER.info(f"Reconnecting WebSocket in {delay:.1f} seconds...")
+            await asyncio.sleep(delay)
+
+    def _next_reconnect_delay(self) -> float:
+        """Return the next capped exponential reconnect delay with jitter."""
+        delay = min(
+            WS_RECONNECT_MAX_DELAY,
+            WS_RECONNECT_MIN_DELAY * 2 ** self._ws_reconnect_attempt,
+        )
+        self._ws_reconnect_attempt += 1
+        # Keep half the delay and randomize the rest so that several
+        # instances do not reconnect in lockstep
+        return delay / 2 + random.uniform(0, delay / 2)
 
     async def _handle_websocket_event(self, event_data: dict):
         """Handle incoming WebSocket event."""
@@ -155,8 +759,138 @@ class LinuxAudioServerCoordinator(DataUpdateCoordinator[dict[str, Any]]):
         event_type = event_data.get("event")
 
         _LOGGER.debug(f"WebSocket event: {event_source}.{event_type}")
+        self._event_stats["events_received"] += 1
 
-        # For any relevant event, trigger a data refresh
-        if event_source in ("mopidy", "pulseaudio"):
-            _LOGGER.info(f"Triggering update from WebSocket event: {event_source}.{event_type}")
-            await self.async_request_refresh()
+        # Events that carry the new state are applied without an HTTP round trip;
+        # periodic polling reconciles anything the delta could not express
+        if self.data is not None:
+            data = self._apply_event_delta(event_source, event_type, event_data)
+            if data is not None:
+                _LOGGER.debug(f"Applied WebSocket event in place: {event_source}.{event_type}")
+                self._event_stats["deltas_applied"] += 1
+                self._async_publish_event_data(data)
+                return
+
+        # For any relevant event, queue a refresh of the slices it affects.
+        # Client resync events have no route and so trigger a full refresh.
+        if event_source in ("mopidy", "pulseaudio", "client"):
+            # Responses cached or in flight from before the event are stale
+            self.client.invalidate_gets()
+            if event_source == "client":
+                # Missed events may have changed any slice, cached ones included
+                self.invalidate_slices(*self._slice_fetchers())
+            slices = self._slices_for_event(event_source, event_type)
+            if slices is None:
+                self._pending_full_refresh = True
+            else:
+                self._pending_event_slices.update(slices)
+
+            self._last_event_time = time.monotonic()
+            if self._event_flush_task is None or self._event_flush_task.done():
+                self._event_flush_task = asyncio.create_task(self._async_flush_event_refresh())
+
+    async def _async_flush_event_refresh(self) -> None:
+        """Issue one refresh for all events received during the coalescing window."""
+        # Events arriving while a refresh is in flight start the next window
+        while self._pending_event_slices or self._pending_full_refresh:
+            deadline = time.monotonic() + self._event_coalesce_max_delay
+            while True:
+                wait = min(
+                    self._last_event_time + self._event_coalesce_window, deadline
+                ) - time.monotonic()
+                if wait <= 0:
+                    break
+                await asyncio.sleep(wait)
+
+            slices = sorted(self._pending_event_slices)
+            full_refresh = self._pending_full_refresh
+            self._pending_event_slices.clear()
+            self._pending_full_refresh = False
+            self._event_stats["refreshes_issued"] += 1
+
+            if full_refresh:
+                _LOGGER.info("Triggering update from WebSocket events")
+                await self.async_request_refresh()
+            else:
+                _LOGGER.info(f"Refreshing {', '.join(slices)} from WebSocket events")
+                await self.async_refresh_slices(*slices)
+
+            _LOGGER.debug("WebSocket event stats: %s", self._event_stats)
+
+    def _apply_event_delta(
+        self, event_source: str | None, event_type: str | None, event_data: dict
+    ) -> dict[str, Any] | None:
+        """Patch a copy of coordinator.data from an event payload.
+
+        Returns None when the payload does not carry enough state, in which
+        case the affected slices must be refetched.
+        """
+        payload = event_data.get("data") or {}
+
+        if event_source == "mopidy" and event_type == "playback_state_changed":
+            player_id = payload.get("player") or event_data.get("player")
+            new_state = payload.get("new_state")
+            if not player_id or not new_state:
+                return None
+
+            players = self.data.get("players", [])
+            for position, player in enumerate(players):
+                if player.id == player_id:
+                    break
+            else:
+                return None
+
+            data = dict(self.data)
+            players = list(players)
+            players[position] = replace(players[position], state=new_state)
+            self._patch_slice(data, "players", {"players": players})
+            # Global playback status mirrors player1
+            if player_id == "player1":
+                playback = {**data.get("playback", {}), "state": new_state}
+                self._patch_slice(data, "playback", {"playback": playback})
+            return data
+
+        if event_source == "pulseaudio" and event_type in (
+            "sink_input.new",
+            "sink_input.change",
+            "sink_input.remove",
+        ):
+            index = payload.get("index", event_data.get("index"))
+            if index is None:
+                return None
+
+            current = self.data.get("sink_inputs", [])
+            existing = next((item for item in current if item.index == index), None)
+            sink_inputs = [item for item in current if item.index != index]
+            if event_type != "sink_input.remove":
+                raw = payload.get("sink_input", payload)
+                changes = {
+                    field.name: raw[field.name] for field in fields(SinkInput) if field.name in raw
+                }
+                if "sink" in raw:
+                    # The description follows the sink, not the old payload
+                    sink = self.data.get("sinks_by_name", {}).get(raw["sink"])
+                    if sink is not None:
+                        changes["sink_description"] = sink.description
+                if event_type == "sink_input.change" and existing is not None:
+                    # Changes may carry only some fields; keep the others
+                    sink_input = replace(existing, **changes)
+                elif "name" in raw and "sink" in raw:
+                    # Only add a stream when the payload carries all of it
+                    sink_input = SinkInput.from_dict(changes)
+                else:
+                    return None
+                sink_inputs.append(sink_input)
+                sink_inputs.sort(key=lambda item: item.index or 0)
+
+            data = dict(self.data)
+            self._patch_slice(data, "sink_inputs", {"sink_inputs": sink_inputs})
+            return data
+
+        return None
+
+    def _patch_slice(self, data: dict[str, Any], name: str, values: dict[str, Any]) -> None:
+        """Apply patched slice values to data and keep the slice cache in step."""
+        data.update(values)
+        if name in self._slice_cache:
+            self._slice_cache[name] = {**self._slice_cache[name], **values}
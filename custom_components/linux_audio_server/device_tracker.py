@@ -13,6 +13,9 @@ from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
 from .const import DOMAIN
 from .coordinator import LinuxAudioServerCoordinator
+from .entity import ChangeFilterMixin
+from .lifecycle import KIND_BLUETOOTH_DEVICE
+from .models import BluetoothDevice
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -25,30 +28,16 @@ async def async_setup_entry(
     """Set up Linux Audio Server device tracker entities."""
     coordinator: LinuxAudioServerCoordinator = hass.data[DOMAIN][entry.entry_id]
 
-    # Create device tracker for each Bluetooth device
-    entities = []
-    for device in coordinator.data.get("bluetooth_devices", []):
-        entities.append(BluetoothDeviceTracker(coordinator, entry, device))
+    # Create a device tracker for each Bluetooth device, following device changes
+    coordinator.entity_lifecycle.async_register_platform(
+        "device_tracker",
+        KIND_BLUETOOTH_DEVICE,
+        lambda device: BluetoothDeviceTracker(coordinator, entry, device),
+        async_add_entities,
+    )
 
-    async_add_entities(entities)
 
-    # Set up listener to add new devices dynamically
-    async def async_update_entities() -> None:
-        """Update entities when coordinator data changes."""
-        current_entities = {entity.unique_id for entity in entities}
-        new_devices = coordinator.data.get("bluetooth_devices", [])
-
-        for device in new_devices:
-            unique_id = f"{entry.entry_id}_bluetooth_{device['address'].replace(':', '_')}"
-            if unique_id not in current_entities:
-                new_entity = BluetoothDeviceTracker(coordinator, entry, device)
-                entities.append(new_entity)
-                async_add_entities([new_entity])
-
-    coordinator.async_add_listener(async_update_entities)
-
-
-class BluetoothDeviceTracker(CoordinatorEntity, ScannerEntity):
+class BluetoothDeviceTracker(ChangeFilterMixin, CoordinatorEntity, ScannerEntity):
     """Bluetooth device tracker entity."""
 
     _attr_has_entity_name = True
@@ -58,21 +47,25 @@ class BluetoothDeviceTracker(CoordinatorEntity, ScannerEntity):
         self,
         coordinator: LinuxAudioServerCoordinator,
         entry: ConfigEntry,
-        device: dict[str, Any],
+        device: BluetoothDevice,
     ) -> None:
         """Initialize the device tracker."""
         super().__init__(coordinator)
         self._entry = entry
-        self._device_address = device["address"]
-        safe_address = device["address"].replace(":", "_")
+        self._device_address = device.address
+        safe_address = device.address.replace(":", "_")
         self._attr_unique_id = f"{entry.entry_id}_bluetooth_{safe_address}"
-        self._attr_name = device.get("name", device["address"])
+        self._attr_name = device.name
+
+    def _change_keys(self) -> list[Any]:
+        """Return the coordinator change keys this entity renders from."""
+        return [("bluetooth_device", self._device_address)]
 
     @property
     def device_info(self) -> dict[str, Any]:
         """Return device information."""
         device = self._device_data
-        device_name = device.get("name", self._device_address) if device else self._device_address
+        device_name = device.name if device else self._device_address
 
         return {
             "identifiers": {(DOMAIN, f"bluetooth_{self._device_address}")},
@@ -87,12 +80,11 @@ class BluetoothDeviceTracker(CoordinatorEntity, ScannerEntity):
         return self.coordinator.last_update_success and self._device_data is not None
 
     @property
-    def _device_data(self) -> dict[str, Any] | None:
+    def _device_data(self) -> BluetoothDevice | None:
         """Get current device data from coordinator."""
-        for device in self.coordinator.data.get("bluetooth_devices", []):
-            if device["address"] == self._device_address:
-                return device
-        return None
+        return self.coordinator.data.get("bluetooth_devices_by_address", {}).get(
+            self._device_address
+        )
 
     @property
     def source_type(self) -> SourceType:
@@ -103,7 +95,7 @@ class BluetoothDeviceTracker(CoordinatorEntity, ScannerEntity):
     def is_connected(self) -> bool:
         """Return if device is connected."""
         device = self._device_data
-        return device.get("connected", False) if device else False
+        return device.connected if device else False
 
     @property
     def extra_state_attributes(self) -> dict[str, Any]:
@@ -113,7 +105,7 @@ class BluetoothDeviceTracker(CoordinatorEntity, ScannerEntity):
             return {}
 
         return {
-            "address": device.get("address"),
-            "paired": device.get("paired", False),
-            "trusted": device.get("trusted", False),
+            "address": device.address,
+            "paired": device.paired,
+            "trusted": device.trusted,
         }
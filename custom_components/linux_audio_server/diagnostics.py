@@ -0,0 +1,53 @@
+"""Diagnostics support for Linux Audio Server."""
+from __future__ import annotations
+
+from typing import Any
+
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.core import HomeAssistant
+
+from .const import DOMAIN
+from .coordinator import LinuxAudioServerCoordinator
+
+
+async def async_get_config_entry_diagnostics(
+    hass: HomeAssistant, entry: ConfigEntry
+) -> dict[str, Any]:
+    """Return diagnostics for a config entry."""
+    coordinator: LinuxAudioServerCoordinator = hass.data[DOMAIN][entry.entry_id]
+    data = coordinator.data or {}
+
+    return {
+        "entry": {
+            "title": entry.title,
+            "data": dict(entry.data),
+        },
+        "coordinator": {
+            "last_update_success": coordinator.last_update_success,
+            "snapshot_stale": coordinator.snapshot_stale,
+            "poll_mode": coordinator.poll_mode,
+            "update_interval": coordinator.update_interval.total_seconds(),
+            "event_stats": coordinator.event_stats,
+            "entity_write_stats": coordinator.entity_write_stats,
+        },
+        "client": {
+            "websocket_connected": coordinator.client.websocket_connected,
+            "websocket_stats": coordinator.client.websocket_stats,
+            "request_stats": coordinator.client.request_stats,
+            "request_metrics": coordinator.client.request_metrics,
+            "json_codec": coordinator.client.json_codec,
+            "validation_stats": coordinator.client.validation_stats,
+            "pool_stats": coordinator.client.pool_stats,
+        },
+        "snapshot": {
+            "sinks": len(data.get("sinks", [])),
+            "sink_inputs": len(data.get("sink_inputs", [])),
+            "players": len(data.get("players", [])),
+            "bluetooth_devices": len(data.get("bluetooth_devices", [])),
+            "default_sink": data.get("default_sink"),
+        },
+        "decision_trace": {
+            "enabled": coordinator.decision_trace_enabled,
+            "sinks": coordinator.decision_traces(),
+        },
+    }
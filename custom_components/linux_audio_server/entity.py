@@ -0,0 +1,158 @@
+"""Shared entity helpers for Linux Audio Server."""
+from __future__ import annotations
+
+from datetime import datetime
+from functools import partial
+import logging
+import math
+import time
+from typing import Any, Iterable
+
+from homeassistant.core import CALLBACK_TYPE, callback
+from homeassistant.helpers.event import async_call_later
+
+from .const import OPTIMISTIC_STATE_TTL
+
+_LOGGER = logging.getLogger(__name__)
+
+
+class ChangeFilterMixin:
+    """Skip coordinator updates that did not touch the data an entity shows.
+
+    Entities return the change keys they render from in _change_keys()
+    (plain slice names like "default_sink" or item keys like
+    ("sink", name)). Updates whose changed keys miss all of them are
+    dropped unless availability changed, the state stopped being assumed
+    or optimistic values are pending.
+
+    While the coordinator still serves the snapshot restored from disk,
+    the state is flagged as assumed until the first live update.
+    """
+
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
+        """Initialize the availability tracker."""
+        super().__init__(*args, **kwargs)
+        self._last_update_success_written: bool | None = None
+        self._assumed_state_written: bool | None = None
+
+    @property
+    def assumed_state(self) -> bool:
+        """Return True while the state comes from the cached snapshot."""
+        return self.coordinator.snapshot_stale
+
+    def _change_keys(self) -> Iterable[str | tuple[str, Any]] | None:
+        """Return the change keys this entity depends on (None: always write)."""
+        return None
+
+    def _handle_coordinator_update(self) -> None:
+        """Write state only if this entity's data changed."""
+        changed = self.coordinator.changed_keys
+        keys = self._change_keys()
+        if (
+            changed is not None
+            and keys is not None
+            and self.coordinator.last_update_success == self._last_update_success_written
+            and self.coordinator.snapshot_stale == self._assumed_state_written
+            and not getattr(self, "_optimistic", None)
+            and changed.isdisjoint(keys)
+        ):
+            self.coordinator.record_entity_update(written=False)
+            return
+
+        self._last_update_success_written = self.coordinator.last_update_success
+        self._assumed_state_written = self.coordinator.snapshot_stale
+        self.coordinator.record_entity_update(written=True)
+        super()._handle_coordinator_update()
+
+
+class OptimisticStateMixin:
+    """Show the value a command requested until coordinator data confirms it.
+
+    Entities set a pending value per key before sending a command, read
+    their properties through _optimistic_value(), and implement
+    _actual_value() to return what the coordinator data currently says.
+    A value the backend has not confirmed within OPTIMISTIC_STATE_TTL is
+    rolled back when it expires, without waiting for the next update.
+    """
+
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
+        """Initialize the pending value table."""
+        super().__init__(*args, **kwargs)
+        # key -> (requested value, monotonic expiry)
+        self._optimistic: dict[str, tuple[Any, float]] = {}
+        self._optimistic_timers: dict[str, CALLBACK_TYPE] = {}
+
+    def _actual_value(self, key: str) -> Any:
+        """Return the authoritative value for a key from coordinator data."""
+        raise NotImplementedError
+
+    @staticmethod
+    def _values_match(requested: Any, actual: Any) -> bool:
+        """Return True if the backend value confirms the requested one."""
+        if isinstance(requested, float) and isinstance(actual, (int, float)):
+            # The backend reports volume rounded to whole percent
+            return math.isclose(requested, actual, abs_tol=0.01)
+        return requested == actual
+
+    def _set_optimistic(self, key: str, value: Any) -> None:
+        """Show a requested value immediately."""
+        self._clear_optimistic(key)
+        self._optimistic[key] = (value, time.monotonic() + OPTIMISTIC_STATE_TTL)
+        self._optimistic_timers[key] = async_call_later(
+            self.hass, OPTIMISTIC_STATE_TTL, partial(self._async_optimistic_expired, key)
+        )
+        self.async_write_ha_state()
+
+    def _clear_optimistic(self, key: str) -> tuple[Any, float] | None:
+        """Drop a pending value and its expiry timer, returning the value."""
+        if (cancel := self._optimistic_timers.pop(key, None)) is not None:
+            cancel()
+        return self._optimistic.pop(key, None)
+
+    def _rollback_optimistic(self, key: str) -> None:
+        """Drop a pending value after its command failed."""
+        if self._clear_optimistic(key) is not None:
+            self.async_write_ha_state()
+
+    def _optimistic_value(self, key: str, actual: Any) -> Any:
+        """Return the pending value for a key while it is valid, else actual."""
+        pending = self._optimistic.get(key)
+        if pending is None or time.monotonic() >= pending[1]:
+            return actual
+        return pending[0]
+
+    def _reconcile_optimistic(self, key: str, expired: bool) -> None:
+        """Drop a pending value once confirmed, or roll it back once expired."""
+        requested, _ = self._optimistic[key]
+        actual = self._actual_value(key)
+        if self._values_match(requested, actual):
+            self._clear_optimistic(key)
+        elif expired:
+            self._clear_optimistic(key)
+            _LOGGER.warning(
+                "%s: backend reports %s=%s instead of requested %s, rolling back",
+                self.entity_id, key, actual, requested
+            )
+
+    @callback
+    def _async_optimistic_expired(self, key: str, _now: datetime) -> None:
+        """Reconcile a pending value whose TTL ran out and write the result."""
+        self._optimistic_timers.pop(key, None)
+        if key in self._optimistic:
+            self._reconcile_optimistic(key, expired=True)
+            self.async_write_ha_state()
+
+    def _handle_coordinator_update(self) -> None:
+        """Reconcile pending values with fresh coordinator data."""
+        now = time.monotonic()
+        for key, (_, expires) in list(self._optimistic.items()):
+            self._reconcile_optimistic(key, expired=now >= expires)
+
+        super()._handle_coordinator_update()
+
+    async def async_will_remove_from_hass(self) -> None:
+        """Cancel pending expiry timers."""
+        for cancel in self._optimistic_timers.values():
+            cancel()
+        self._optimistic_timers.clear()
+        await super().async_will_remove_from_hass()
@@ -0,0 +1,190 @@
+"""Entity lifecycle management for Linux Audio Server."""
+from __future__ import annotations
+
+from collections.abc import Callable, Collection
+from dataclasses import dataclass, field
+import logging
+import time
+from typing import TYPE_CHECKING, Any
+
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
+from homeassistant.helpers import entity_registry as er
+from homeassistant.helpers.entity import Entity
+from homeassistant.helpers.entity_platform import AddEntitiesCallback
+
+from .const import DOMAIN, ENTITY_REMOVAL_GRACE
+
+if TYPE_CHECKING:
+    from .coordinator import LinuxAudioServerCoordinator
+
+_LOGGER = logging.getLogger(__name__)
+
+# Entity kinds and the coordinator index holding their live items
+KIND_SINK = "sink"
+KIND_BLUETOOTH_DEVICE = "bluetooth_device"
+KIND_INDEXES = {
+    KIND_SINK: "sinks_by_name",
+    KIND_BLUETOOTH_DEVICE: "bluetooth_devices_by_address",
+}
+
+
+@dataclass
+class _PlatformRegistration:
+    """Entities one platform creates per item of one kind."""
+
+    domain: str
+    kind: str
+    factory: Callable[[Any], Entity]
+    async_add_entities: AddEntitiesCallback
+    keep: Callable[[Entity], bool] | None
+    entities: dict[Any, Entity] = field(default_factory=dict)
+
+
+class EntityLifecycleManager:
+    """Add and remove per-sink and per-device entities for every platform.
+
+    Platforms register a factory for a kind of item (sinks or Bluetooth
+    devices). On each coordinator update the live keys are diffed once per
+    kind; new items get entities on every platform in one batch per
+    platform, and items gone for longer than the removal grace period have
+    their entities removed everywhere, including the entity registry.
+    """
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        coordinator: LinuxAudioServerCoordinator,
+        removal_grace: float = ENTITY_REMOVAL_GRACE,
+    ) -> None:
+        """Initialize the manager."""
+        self.hass = hass
+        self.coordinator = coordinator
+        self._removal_grace = removal_grace
+        self._registrations: list[_PlatformRegistration] = []
+        self._known_keys: dict[str, set[Any]] = {kind: set() for kind in KIND_INDEXES}
+        # kind -> key -> monotonic time the item was first seen missing
+        self._missing_since: dict[str, dict[Any, float]] = {kind: {} for kind in KIND_INDEXES}
+        self._unsub_listener: CALLBACK_TYPE | None = None
+
+    @callback
+    def async_register_platform(
+        self,
+        domain: str,
+        kind: str,
+        factory: Callable[[Any], Entity],
+        async_add_entities: AddEntitiesCallback,
+        keep: Callable[[Entity], bool] | None = None,
+    ) -> None:
+        """Create entities for the current items and track future changes.
+
+        keep, if given, is asked before removing an entity whose item is
+        gone; returning True keeps it (e.g. a paired but disconnected
+        Bluetooth speaker).
+        """
+        registration = _PlatformRegistration(domain, kind, factory, async_add_entities, keep)
+        self._registrations.append(registration)
+
+        items = self._live_items(kind)
+        self._known_keys[kind].update(items)
+        new_entities = [registration.factory(item) for item in items.values()]
+        registration.entities.update(zip(items, new_entities))
+        async_add_entities(new_entities)
+
+        if self._unsub_listener is None:
+            self._unsub_listener = self.coordinator.async_add_listener(self._async_update)
+
+    @callback
+    def async_shutdown(self) -> None:
+        """Stop tracking coordinator updates."""
+        if self._unsub_listener is not None:
+            self._unsub_listener()
+            self._unsub_listener = None
+
+    def _live_items(self, kind: str) -> dict[Any, Any]:
+        """Return the current items of a kind keyed by their identity."""
+        return (self.coordinator.data or {}).get(KIND_INDEXES[kind], {})
+
+    @callback
+    def _async_update(self) -> None:
+        """Diff the live keys against the tracked entities."""
+        self.async_sync()
+
+    @callback
+    def async_sync(self, force_removal_kinds: Collection[str] = ()) -> None:
+        """Add entities for new items and remove those for stale ones.
+
+        force_removal_kinds skips the grace period for gone items of those
+        kinds; other kinds still wait it out.
+        """
+        now = time.monotonic()
+        for kind in KIND_INDEXES:
+            items = self._live_items(kind)
+            live_keys = items.keys()
+            known_keys = self._known_keys[kind]
+            missing_since = self._missing_since[kind]
+            registrations = [reg for reg in self._registrations if reg.kind == kind]
+
+            for key in live_keys & missing_since.keys():
+                del missing_since[key]
+            for key in known_keys - live_keys:
+                missing_since.setdefault(key, now)
+
+            stale_keys = {
+                key
+                for key, since in missing_since.items()
+                if kind in force_removal_kinds or now - since >= self._removal_grace
+            }
+            # Checked per platform: an item whose entity one platform kept
+            # while another removed it is known but still needs re-adding
+            if not stale_keys and all(
+                live_keys <= reg.entities.keys() for reg in registrations
+            ):
+                continue
+
+            added, removed = self._async_apply(registrations, items, stale_keys)
+            known_keys.update(live_keys)
+            for key in stale_keys:
+                if not any(key in reg.entities for reg in registrations):
+                    known_keys.discard(key)
+                    del missing_since[key]
+
+            if added or removed:
+                _LOGGER.info(
+                    "Entity lifecycle for %s: added %d entities, removed %d entities",
+                    kind, added, removed
+                )
+
+    def _async_apply(
+        self,
+        registrations: list[_PlatformRegistration],
+        items: dict[Any, Any],
+        stale_keys: set[Any],
+    ) -> tuple[int, int]:
+        """Batch-add and remove entities on every platform for one kind."""
+        entity_reg = er.async_get(self.hass)
+        added = removed = 0
+        for registration in registrations:
+            new_entities = []
+            for key in items.keys() - registration.entities.keys():
+                entity = registration.factory(items[key])
+                registration.entities[key] = entity
+                new_entities.append(entity)
+            if new_entities:
+                registration.async_add_entities(new_entities)
+                added += len(new_entities)
+
+            for key in stale_keys:
+                entity = registration.entities.get(key)
+                if entity is None or (registration.keep and registration.keep(entity)):
+                    continue
+                del registration.entities[key]
+                removed += 1
+                entity_id = entity_reg.async_get_entity_id(
+                    registration.domain, DOMAIN, entity.unique_id
+                )
+                if entity_id:
+                    # Removing the registry entry also removes the entity
+                    entity_reg.async_remove(entity_id)
+                else:
+                    self.hass.async_create_task(entity.async_remove())
+        return added, removed
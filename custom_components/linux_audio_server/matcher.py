@@ -0,0 +1,57 @@
+"""Sink-input classification for Linux Audio Server."""
+from __future__ import annotations
+
+import re
+from typing import Iterable
+
+from .const import MOPIDY_PLAYER_ID, MOPIDY_PLAYER_PATTERN, SINK_INPUT_SOURCE_PATTERNS
+from .models import SinkInput, SinkInputMatch
+
+NO_MATCH = SinkInputMatch(source=None, player=None)
+
+
+class SinkInputMatcher:
+    """Map sink-input application names to logical sources and Mopidy players.
+
+    Patterns are compiled once and results are memoized per sink-input
+    (index, name), so a stream is only classified when it first appears or
+    is renamed.
+    """
+
+    def __init__(
+        self,
+        source_patterns: dict[str, str] = SINK_INPUT_SOURCE_PATTERNS,
+        player_pattern: str = MOPIDY_PLAYER_PATTERN,
+    ) -> None:
+        """Compile the source and player patterns."""
+        self._sources = [
+            (source, re.compile(pattern)) for source, pattern in source_patterns.items()
+        ]
+        self._player = re.compile(player_pattern)
+        self._cache: dict[tuple[int | None, str], SinkInputMatch] = {}
+
+    def match(self, sink_input: SinkInput) -> SinkInputMatch:
+        """Return the source and player a sink-input belongs to."""
+        key = (sink_input.index, sink_input.name)
+        result = self._cache.get(key)
+        if result is None:
+            result = self._cache[key] = self._classify(sink_input.name)
+        return result
+
+    def _classify(self, name: str) -> SinkInputMatch:
+        """Run the patterns against an application name."""
+        source = next(
+            (source for source, pattern in self._sources if pattern.search(name)),
+            None,
+        )
+        player_match = self._player.search(name)
+        player = MOPIDY_PLAYER_ID.format(player_match.group(1)) if player_match else None
+        if source is None and player is None:
+            return NO_MATCH
+        return SinkInputMatch(source=source, player=player)
+
+    def prune(self, sink_inputs: Iterable[SinkInput]) -> None:
+        """Forget results for sink-inputs that no longer exist."""
+        live = {(sink_input.index, sink_input.name) for sink_input in sink_inputs}
+        for key in self._cache.keys() - live:
+            del self._cache[key]
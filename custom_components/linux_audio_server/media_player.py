@@ -15,12 +15,15 @@ from homeassistant.components.media_player import (
 )
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import HomeAssistant
-from homeassistant.helpers import entity_registry as er
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
+from .api import ApiClientError
 from .const import DOMAIN
-from .coordinator import LinuxAudioServerCoordinator
+from .coordinator import SINK_LIST_KEY, LinuxAudioServerCoordinator
+from .entity import ChangeFilterMixin, OptimisticStateMixin
+from .lifecycle import KIND_SINK
+from .models import Sink, Track
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -32,83 +35,29 @@ async def async_setup_entry(
 ) -> None:
     """Set up Linux Audio Server media player entities."""
     coordinator: LinuxAudioServerCoordinator = hass.data[DOMAIN][entry.entry_id]
-    entity_reg = er.async_get(hass)
-
-    # Create media player entities for each sink
-    entities = []
-    for sink in coordinator.data.get("sinks", []):
-        entities.append(AudioSinkMediaPlayer(coordinator, entry, sink))
-
-    async_add_entities(entities)
-
-    # Set up a listener to add new sinks dynamically and remove stale entities
-    async def async_update_entities() -> None:
-        """Update entities when coordinator data changes."""
-        current_entities = {entity.unique_id for entity in entities}
-        new_sinks = coordinator.data.get("sinks", [])
-
-        # Get current Bluetooth devices
-        bluetooth_devices = coordinator.data.get("bluetooth_devices", [])
-        paired_addresses = {dev.get("address") for dev in bluetooth_devices if dev.get("paired", False)}
-
-        # Add new sinks
-        for sink in new_sinks:
-            unique_id = f"{entry.entry_id}_{sink['name']}"
-            if unique_id not in current_entities:
-                new_entity = AudioSinkMediaPlayer(coordinator, entry, sink)
-                entities.append(new_entity)
-                async_add_entities([new_entity])
-
-        # Remove stale Bluetooth speaker entities
-        # An entity is stale if:
-        # 1. It's a Bluetooth device (sink name starts with bluez_output.)
-        # 2. The Bluetooth device is no longer paired
-        # 3. The sink no longer exists
-        current_sink_names = {sink["name"] for sink in new_sinks}
-
-        entities_to_remove = []
-        for entity in entities:
-            # Check if this is a Bluetooth entity
-            if not entity._sink_name.startswith("bluez_output."):
-                continue
-
-            # Extract Bluetooth address
-            bt_address = entity._bluetooth_address
-            if not bt_address:
-                continue
-
-            # Check if device is still paired
-            is_paired = bt_address in paired_addresses
-            sink_exists = entity._sink_name in current_sink_names
-
-            # Remove entity if device is no longer paired AND sink doesn't exist
-            if not is_paired and not sink_exists:
-                _LOGGER.info(
-                    "Removing stale Bluetooth speaker entity: %s (address: %s, paired: %s, sink exists: %s)",
-                    entity._attr_name,
-                    bt_address,
-                    is_paired,
-                    sink_exists,
-                )
-                entities_to_remove.append(entity)
-
-                # Remove from entity registry
-                entity_id = entity_reg.async_get_entity_id(
-                    "media_player",
-                    DOMAIN,
-                    entity.unique_id,
-                )
-                if entity_id:
-                    entity_reg.async_remove(entity_id)
 
-        # Remove from our entities list
-        for entity in entities_to_remove:
-            entities.remove(entity)
+    def keep_paired_bluetooth_speaker(entity: AudioSinkMediaPlayer) -> bool:
+        """Keep a Bluetooth speaker's entity while it is paired, even without a sink."""
+        if not entity._bluetooth_address:
+            return False
+        device = coordinator.data.get("bluetooth_devices_by_address", {}).get(
+            entity._bluetooth_address
+        )
+        return device is not None and device.paired
 
-    coordinator.async_add_listener(async_update_entities)
+    # Create a media player for each sink, following sink changes
+    coordinator.entity_lifecycle.async_register_platform(
+        "media_player",
+        KIND_SINK,
+        lambda sink: AudioSinkMediaPlayer(coordinator, entry, sink),
+        async_add_entities,
+        keep=keep_paired_bluetooth_speaker,
+    )
 
 
-class AudioSinkMediaPlayer(CoordinatorEntity, MediaPlayerEntity):
+class AudioSinkMediaPlayer(
+    ChangeFilterMixin, OptimisticStateMixin, CoordinatorEntity, MediaPlayerEntity
+):
     """Representation of an audio sink as a media player."""
 
     _attr_has_entity_name = False
@@ -118,14 +67,14 @@ class AudioSinkMediaPlayer(CoordinatorEntity, MediaPlayerEntity):
         self,
         coordinator: LinuxAudioServerCoordinator,
         entry: ConfigEntry,
-        sink: dict[str, Any],
+        sink: Sink,
     ) -> None:
         """Initialize the media player."""
         super().__init__(coordinator)
         self._entry = entry
-        self._sink_name = sink["name"]
-        self._attr_unique_id = f"{entry.entry_id}_{sink['name']}"
-        self._attr_name = sink["description"]
+        self._sink_name = sink.name
+        self._attr_unique_id = f"{entry.entry_id}_{sink.name}"
+        self._attr_name = sink.description
 
         # Check if this is a Bluetooth sink
         self._is_bluetooth = self._sink_name.startswith("bluez_output.")
@@ -146,6 +95,18 @@ class AudioSinkMediaPlayer(CoordinatorEntity, MediaPlayerEntity):
             _LOGGER.warning("Failed to extract Bluetooth address from %s: %s", self._sink_name, err)
         return None
 
+    def _change_keys(self) -> list[Any]:
+        """Return the coordinator change keys this entity renders from."""
+        keys = [
+            ("sink", self._sink_name),
+            ("sink_playback", self._sink_name),
+            "playback",
+            SINK_LIST_KEY,
+        ]
+        if self._bluetooth_address:
+            keys.append(("bluetooth_device", self._bluetooth_address))
+        return keys
+
     @property
     def supported_features(self) -> MediaPlayerEntityFeature:
         """Return supported features."""
@@ -172,7 +133,7 @@ class AudioSinkMediaPlayer(CoordinatorEntity, MediaPlayerEntity):
     def device_info(self) -> dict[str, Any]:
         """Return device information about this entity."""
         sink = self._sink_data
-        device_name = sink.get("description", self._sink_name) if sink else self._sink_name
+        device_name = sink.description if sink else self._sink_name
         return {
             "identifiers": {(DOMAIN, self._sink_name)},
             "name": device_name,
@@ -195,23 +156,24 @@ class AudioSinkMediaPlayer(CoordinatorEntity, MediaPlayerEntity):
             sink_exists = self._sink_data is not None
 
             # Check if this Bluetooth device exists in device tracker data
-            bluetooth_devices = self.coordinator.data.get("bluetooth_devices", [])
-            for device in bluetooth_devices:
-                if device.get("address") == self._bluetooth_address:
-                    # Device is paired - keep entity available even if disconnected
-                    is_paired = device.get("paired", False)
-                    _LOGGER.debug(
-                        "Bluetooth device %s (%s) found: paired=%s, sink_exists=%s",
-                        self._attr_name,
-                        self._bluetooth_address,
-                        is_paired,
-                        sink_exists,
-                    )
-                    # Available if paired OR if sink exists (handles race condition)
-                    if is_paired or sink_exists:
-                        return True
-                    # If found but not paired AND no sink, entity should be unavailable
-                    return False
+            device = self.coordinator.data.get("bluetooth_devices_by_address", {}).get(
+                self._bluetooth_address
+            )
+            if device is not None:
+                # Device is paired - keep entity available even if disconnected
+                is_paired = device.paired
+                _LOGGER.debug(
+                    "Bluetooth device %s (%s) found: paired=%s, sink_exists=%s",
+                    self._attr_name,
+                    self._bluetooth_address,
+                    is_paired,
+                    sink_exists,
+                )
+                # Available if paired OR if sink exists (handles race condition)
+                if is_paired or sink_exists:
+                    return True
+                # If found but not paired AND no sink, entity should be unavailable
+                return False
 
             # If Bluetooth device not found in device list, check if sink exists
             # This handles the case where the device was just discovered or paired
@@ -227,256 +189,57 @@ class AudioSinkMediaPlayer(CoordinatorEntity, MediaPlayerEntity):
         return self._sink_data is not None
 
     @property
-    def _sink_data(self) -> dict[str, Any] | None:
+    def _sink_data(self) -> Sink | None:
         """Get the current sink data from coordinator."""
-        for sink in self.coordinator.data.get("sinks", []):
-            if sink["name"] == self._sink_name:
-                return sink
-        return None
+        return self.coordinator.data.get("sinks_by_name", {}).get(self._sink_name)
 
-    def _get_active_player_for_sink(self) -> str | None:
-        """Get the player actually routing audio to this sink (ground truth from sink-inputs)."""
-        sink_inputs = self.coordinator.data.get("sink_inputs", [])
+    def _get_assigned_player_track(self) -> Track | None:
+        """Get current track info from the player feeding this sink."""
+        return self.coordinator.sink_playback(self._sink_name)["track"]
 
-        _LOGGER.debug(
-            "[%s] Checking sink-inputs for active player. Total sink_inputs: %d",
-            self._sink_name,
-            len(sink_inputs)
-        )
-
-        # Look for Mopidy sink-inputs routing to this sink
-        for sink_input in sink_inputs:
-            if sink_input.get("sink") == self._sink_name:
-                app_name = sink_input.get("name", "")
-                _LOGGER.debug(
-                    "[%s] Found sink-input: name='%s', sink='%s'",
-                    self._sink_name,
-                    app_name,
-                    sink_input.get("sink")
-                )
-                # Match "Mopidy Player 2@unix:/run/pulse/native" -> "player2"
-                # Match "Mopidy Player 1 (TTS)@unix:/run/pulse/native" -> "player1"
-                if "Mopidy Player" in app_name:
-                    # Extract player number
-                    if "Player 1" in app_name:
-                        _LOGGER.debug("[%s] Active player from sink-input: player1", self._sink_name)
-                        return "player1"
-                    elif "Player 2" in app_name:
-                        _LOGGER.debug("[%s] Active player from sink-input: player2", self._sink_name)
-                        return "player2"
-                    elif "Player 3" in app_name:
-                        _LOGGER.debug("[%s] Active player from sink-input: player3", self._sink_name)
-                        return "player3"
-                    elif "Player 4" in app_name:
-                        _LOGGER.debug("[%s] Active player from sink-input: player4", self._sink_name)
-                        return "player4"
-
-        _LOGGER.debug("[%s] No active player found in sink-inputs", self._sink_name)
-        return None
-
-    def _get_assigned_player_track(self) -> dict[str, Any] | None:
-        """Get current track info from the player assigned to this sink."""
-        # First check which player is ACTUALLY routing audio to this sink (ground truth)
-        active_player = self._get_active_player_for_sink()
-
-        if active_player:
-            # Get track from the active player
-            players = self.coordinator.data.get("players", [])
-            _LOGGER.debug(
-                "[%s] Track fetch - Priority 1: Active player '%s', total players: %d",
-                self._sink_name,
-                active_player,
-                len(players)
-            )
-            for player in players:
-                if player.get("id") == active_player:
-                    track = player.get("current_track")
-                    _LOGGER.debug(
-                        "[%s] Track fetch - Found player '%s', current_track: %s",
-                        self._sink_name,
-                        active_player,
-                        track
-                    )
-                    return track
-            _LOGGER.debug(
-                "[%s] Track fetch - Player '%s' not found in players array",
-                self._sink_name,
-                active_player
-            )
-
-        # Fallback: check player assignments (might be stale but better than nothing)
-        player_assignments = self.coordinator.data.get("player_assignments", {})
-        assigned_player = player_assignments.get(self._sink_name)
-
-        if assigned_player:
-            _LOGGER.debug(
-                "[%s] Track fetch - Priority 2: Assigned player '%s'",
-                self._sink_name,
-                assigned_player
-            )
-            # Get the assigned player's data
-            players = self.coordinator.data.get("players", [])
-            for player in players:
-                if player.get("id") == assigned_player:
-                    track = player.get("current_track")
-                    _LOGGER.debug(
-                        "[%s] Track fetch - Found assigned player '%s', current_track: %s",
-                        self._sink_name,
-                        assigned_player,
-                        track
-                    )
-                    return track
-
-        # Fallback to global playback data (player1)
-        playback = self.coordinator.data.get("playback", {})
-        track = playback.get("track")
-        _LOGGER.debug(
-            "[%s] Track fetch - Priority 3: Global playback track: %s",
-            self._sink_name,
-            track
-        )
-        return track
+    def _actual_value(self, key: str) -> Any:
+        """Return the authoritative value for an optimistic key."""
+        if key == "state":
+            return self._resolve_state()
+        sink = self._sink_data
+        if key == "volume":
+            return sink.volume if sink else None
+        return sink.muted if sink else None
 
     @property
     def state(self) -> MediaPlayerState:
         """Return the state of the device."""
-        sink = self._sink_data
-        if sink is None:
-            return MediaPlayerState.OFF
-
-        _LOGGER.debug("[%s] === Determining state ===", self._sink_name)
+        return self._optimistic_value("state", self._resolve_state())
 
-        # For multi-player setups, check which player is ACTUALLY routing audio to this sink
-        # This is the ground truth from sink-inputs, not just assignments which can be stale
-        active_player = self._get_active_player_for_sink()
-
-        if active_player:
-            # Get the state of the active player
-            players = self.coordinator.data.get("players", [])
-            _LOGGER.debug(
-                "[%s] Priority 1: Active player from sink-inputs: %s, total players: %d",
-                self._sink_name,
-                active_player,
-                len(players)
-            )
-            for player in players:
-                if player.get("id") == active_player:
-                    player_state = player.get("state")
-                    _LOGGER.debug(
-                        "[%s] Found active player %s with state: %s",
-                        self._sink_name,
-                        active_player,
-                        player_state
-                    )
-                    if player_state == "playing":
-                        _LOGGER.debug("[%s] Returning PLAYING from active player", self._sink_name)
-                        return MediaPlayerState.PLAYING
-                    elif player_state == "paused":
-                        _LOGGER.debug("[%s] Returning PAUSED from active player", self._sink_name)
-                        return MediaPlayerState.PAUSED
-                    elif player_state == "stopped":
-                        _LOGGER.debug("[%s] Returning IDLE from active player (stopped)", self._sink_name)
-                        return MediaPlayerState.IDLE
-                    break
-        else:
-            _LOGGER.debug("[%s] Priority 1: No active player found in sink-inputs", self._sink_name)
-
-        # Fallback: check player assignments (might be stale but better than nothing)
-        player_assignments = self.coordinator.data.get("player_assignments", {})
-        assigned_player = player_assignments.get(self._sink_name)
-
-        _LOGGER.debug(
-            "[%s] Priority 2: Checking player assignments. Assigned player: %s",
-            self._sink_name,
-            assigned_player
-        )
-
-        if assigned_player:
-            # Get the state of the assigned player
-            players = self.coordinator.data.get("players", [])
-            for player in players:
-                if player.get("id") == assigned_player:
-                    player_state = player.get("state")
-                    _LOGGER.debug(
-                        "[%s] Found assigned player %s with state: %s",
-                        self._sink_name,
-                        assigned_player,
-                        player_state
-                    )
-                    if player_state == "playing":
-                        _LOGGER.debug("[%s] Returning PLAYING from assigned player", self._sink_name)
-                        return MediaPlayerState.PLAYING
-                    elif player_state == "paused":
-                        _LOGGER.debug("[%s] Returning PAUSED from assigned player", self._sink_name)
-                        return MediaPlayerState.PAUSED
-                    elif player_state == "stopped":
-                        _LOGGER.debug("[%s] Returning IDLE from assigned player (stopped)", self._sink_name)
-                        return MediaPlayerState.IDLE
-                    break
-
-        # Fallback to global playback state (player1)
-        playback = self.coordinator.data.get("playback", {})
-        playback_state = playback.get("state")
-
-        _LOGGER.debug(
-            "[%s] Priority 3: Checking global playback state: %s",
-            self._sink_name,
-            playback_state
-        )
-
-        if playback_state == "playing":
-            _LOGGER.debug("[%s] Returning PLAYING from global playback", self._sink_name)
-            return MediaPlayerState.PLAYING
-        elif playback_state == "paused":
-            _LOGGER.debug("[%s] Returning PAUSED from global playback", self._sink_name)
-            return MediaPlayerState.PAUSED
-        elif playback_state == "stopped":
-            _LOGGER.debug("[%s] Returning IDLE from global playback (stopped)", self._sink_name)
-            return MediaPlayerState.IDLE
-
-        # Fallback to sink state if no playback info
-        pa_state = sink.get("state", "IDLE")
-        _LOGGER.debug(
-            "[%s] Priority 4: Falling back to PulseAudio sink state: %s",
-            self._sink_name,
-            pa_state
-        )
-
-        if pa_state == "RUNNING":
-            _LOGGER.debug("[%s] Returning ON from PA sink state", self._sink_name)
-            return MediaPlayerState.ON
-        elif pa_state in ("IDLE", "SUSPENDED"):
-            _LOGGER.debug("[%s] Returning IDLE from PA sink state", self._sink_name)
-            return MediaPlayerState.IDLE
-        else:
-            _LOGGER.debug("[%s] Returning OFF from PA sink state", self._sink_name)
-            return MediaPlayerState.OFF
+    def _resolve_state(self) -> MediaPlayerState:
+        """Determine the state of the device from coordinator data."""
+        return self.coordinator.sink_playback(self._sink_name)["state"]
 
     @property
     def volume_level(self) -> float | None:
         """Volume level of the media player (0..1)."""
         sink = self._sink_data
-        return sink.get("volume") if sink else None
+        return self._optimistic_value("volume", sink.volume if sink else None)
 
     @property
     def is_volume_muted(self) -> bool | None:
         """Return boolean if volume is currently muted."""
         sink = self._sink_data
-        return sink.get("muted") if sink else None
+        return self._optimistic_value("muted", sink.muted if sink else None)
 
     @property
     def source(self) -> str | None:
         """Return the current input source."""
         # The current sink is the "source" from media player perspective
         sink = self._sink_data
-        return sink.get("description") if sink else None
+        return sink.description if sink else None
 
     @property
     def source_list(self) -> list[str]:
         """List of available input sources."""
         # All available sinks
         return [
-            sink["description"]
+            sink.description
             for sink in self.coordinator.data.get("sinks", [])
         ]
 
@@ -493,7 +256,7 @@ class AudioSinkMediaPlayer(CoordinatorEntity, MediaPlayerEntity):
         """Return the title of current playing media."""
         track = self._get_assigned_player_track()
         if track:
-            return track.get("name")
+            return track.name
         return None
 
     @property
@@ -501,7 +264,7 @@ class AudioSinkMediaPlayer(CoordinatorEntity, MediaPlayerEntity):
         """Return the artist of current playing media."""
         track = self._get_assigned_player_track()
         if track:
-            return track.get("artist")
+            return track.artist
         return None
 
     @property
@@ -509,7 +272,7 @@ class AudioSinkMediaPlayer(CoordinatorEntity, MediaPlayerEntity):
         """Return the album name of current playing media."""
         track = self._get_assigned_player_track()
         if track:
-            return track.get("album")
+            return track.album
         return None
 
     @property
@@ -529,35 +292,49 @@ class AudioSinkMediaPlayer(CoordinatorEntity, MediaPlayerEntity):
             return {}
 
         return {
-            "sink_name": sink.get("name"),
-            "sink_index": sink.get("index"),
-            "sink_state": sink.get("state"),
-            "is_default": sink.get("is_default", False),
+            "sink_name": sink.name,
+            "sink_index": sink.index,
+            "sink_state": sink.state,
+            "is_default": sink.is_default,
         }
 
     async def async_set_volume_level(self, volume: float) -> None:
         """Set volume level, range 0..1."""
-        await self.coordinator.client.set_sink_volume(self._sink_name, volume)
-        await self.coordinator.async_request_refresh()
+        self._set_optimistic("volume", volume)
+        try:
+            result = await self.coordinator.client.set_sink_volume(self._sink_name, volume)
+        except ApiClientError:
+            self._rollback_optimistic("volume")
+            raise
+        # Intermediate values of a slider drag are superseded; only the
+        # final one refreshes
+        if result is not None:
+            await self.coordinator.async_request_refresh()
 
     async def async_mute_volume(self, mute: bool) -> None:
         """Mute or unmute the media player."""
-        await self.coordinator.client.set_sink_mute(self._sink_name, mute)
+        self._set_optimistic("muted", mute)
+        try:
+            await self.coordinator.client.set_sink_mute(self._sink_name, mute)
+        except ApiClientError:
+            self._rollback_optimistic("muted")
+            raise
         await self.coordinator.async_request_refresh()
 
     async def async_select_source(self, source: str) -> None:
         """Select input source (set as default sink)."""
         # Find the sink name from description
-        for sink in self.coordinator.data.get("sinks", []):
-            if sink["description"] == source:
-                await self.coordinator.client.set_default_sink(sink["name"])
-                await self.coordinator.async_request_refresh()
-                return
+        sink = self.coordinator.data.get("sinks_by_description", {}).get(source)
+        if sink is not None:
+            await self.coordinator.client.set_default_sink(sink.name)
+            await self.coordinator.async_request_refresh()
+            return
 
         _LOGGER.warning("Source '%s' not found in available sinks", source)
 
     async def async_media_play(self) -> None:
         """Send play command to this sink's assigned player."""
+        self._set_optimistic("state", MediaPlayerState.PLAYING)
         try:
             # Use sink-based playback control (routes to correct player automatically)
             await self.coordinator.client.play_sink(self._sink_name)
@@ -565,11 +342,13 @@ class AudioSinkMediaPlayer(CoordinatorEntity, MediaPlayerEntity):
         except Exception as err:
             # If no player is assigned (404), this is expected - user needs to play media first
             _LOGGER.debug("Play command failed for sink %s: %s", self._sink_name, err)
+            self._rollback_optimistic("state")
             # Silently ignore - playback control requires active media
         await self.coordinator.async_request_refresh()
 
     async def async_media_pause(self) -> None:
         """Send pause command to this sink's assigned player."""
+        self._set_optimistic("state", MediaPlayerState.PAUSED)
         try:
             # Use sink-based playback control (routes to correct player automatically)
             await self.coordinator.client.pause_sink(self._sink_name)
@@ -577,10 +356,12 @@ class AudioSinkMediaPlayer(CoordinatorEntity, MediaPlayerEntity):
         except Exception as err:
             # If no player is assigned (404), this is expected
             _LOGGER.debug("Pause command failed for sink %s: %s", self._sink_name, err)
+            self._rollback_optimistic("state")
         await self.coordinator.async_request_refresh()
 
     async def async_media_stop(self) -> None:
         """Send stop command to this sink's assigned player."""
+        self._set_optimistic("state", MediaPlayerState.IDLE)
         try:
             # Use sink-based playback control (routes to correct player automatically)
             await self.coordinator.client.stop_sink(self._sink_name)
@@ -588,6 +369,7 @@ class AudioSinkMediaPlayer(CoordinatorEntity, MediaPlayerEntity):
         except Exception as err:
             # If no player is assigned (404), this is expected
             _LOGGER.debug("Stop command failed for sink %s: %s", self._sink_name, err)
+            self._rollback_optimistic("state")
         await self.coordinator.async_request_refresh()
 
     async def async_media_next_track(self) -> None:
@@ -645,6 +427,7 @@ class AudioSinkMediaPlayer(CoordinatorEntity, MediaPlayerEntity):
             _LOGGER.debug("Playing URI: %s", media_id)
             await self.coordinator.client.play_radio_url(media_id, sink=self._sink_name)
 
+        self.coordinator.invalidate_slices("player_assignments")
         await self.coordinator.async_request_refresh()
 
     async def async_browse_media(
@@ -693,6 +476,7 @@ class AudioSinkMediaPlayer(CoordinatorEntity, MediaPlayerEntity):
         try:
             # Just connect - use switch/source selector to set as default
             await self.coordinator.client.connect_bluetooth(self._bluetooth_address)
+            self.coordinator.invalidate_slices("bluetooth_devices")
             await self.coordinator.async_request_refresh()
         except Exception as err:
             _LOGGER.error("Failed to turn on %s: %s", self._attr_name, err)
@@ -708,6 +492,7 @@ class AudioSinkMediaPlayer(CoordinatorEntity, MediaPlayerEntity):
         try:
             # Disconnect Bluetooth device
             await self.coordinator.client.disconnect_bluetooth(self._bluetooth_address)
+            self.coordinator.invalidate_slices("bluetooth_devices")
             await self.coordinator.async_request_refresh()
         except Exception as err:
             _LOGGER.error("Failed to turn off %s: %s", self._attr_name, err)
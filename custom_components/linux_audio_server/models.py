@@ -0,0 +1,161 @@
+"""Typed snapshot models for Linux Audio Server data."""
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Any, Callable, TypeVar
+
+_ModelT = TypeVar("_ModelT")
+
+
+@dataclass(frozen=True, slots=True)
+class Track:
+    """A track reported by Mopidy."""
+
+    name: str | None
+    artist: Any
+    album: Any
+    uri: str | None
+    length: int | None
+
+    @classmethod
+    def from_dict(cls, raw: dict[str, Any] | None) -> Track | None:
+        """Parse a track, returning None for a missing or empty one."""
+        if not raw:
+            return None
+        return cls(
+            name=raw.get("name"),
+            artist=raw.get("artist"),
+            album=raw.get("album"),
+            uri=raw.get("uri"),
+            length=raw.get("length"),
+        )
+
+
+@dataclass(frozen=True, slots=True)
+class Sink:
+    """A PulseAudio output."""
+
+    name: str
+    description: str
+    index: int | None
+    state: str | None
+    volume: float | None
+    muted: bool | None
+    is_default: bool
+
+    @classmethod
+    def from_dict(cls, raw: dict[str, Any]) -> Sink:
+        """Parse a sink from the API."""
+        return cls(
+            name=raw["name"],
+            description=raw.get("description", raw["name"]),
+            index=raw.get("index"),
+            state=raw.get("state"),
+            volume=raw.get("volume"),
+            muted=raw.get("muted"),
+            is_default=raw.get("is_default", False),
+        )
+
+
+@dataclass(frozen=True, slots=True)
+class SinkInput:
+    """A PulseAudio stream playing into a sink."""
+
+    index: int | None
+    name: str
+    sink: str | None
+    sink_description: str | None
+    volume: float | None
+    muted: bool | None
+
+    @classmethod
+    def from_dict(cls, raw: dict[str, Any]) -> SinkInput:
+        """Parse a sink-input from the API."""
+        return cls(
+            index=raw.get("index"),
+            name=raw.get("name", ""),
+            sink=raw.get("sink"),
+            sink_description=raw.get("sink_description"),
+            volume=raw.get("volume"),
+            muted=raw.get("muted"),
+        )
+
+
+@dataclass(frozen=True, slots=True)
+class SinkInputMatch:
+    """The logical source and Mopidy player a sink-input belongs to."""
+
+    source: str | None
+    player: str | None
+
+
+@dataclass(frozen=True, slots=True)
+class Player:
+    """A Mopidy player instance."""
+
+    id: str | None
+    name: str | None
+    active: bool
+    status: str | None
+    state: str | None
+    current_track: Track | None
+
+    @classmethod
+    def from_dict(cls, raw: dict[str, Any]) -> Player:
+        """Parse a player from the API."""
+        return cls(
+            id=raw.get("id"),
+            name=raw.get("name"),
+            active=raw.get("active", False),
+            status=raw.get("status"),
+            state=raw.get("state"),
+            current_track=Track.from_dict(raw.get("current_track")),
+        )
+
+
+@dataclass(frozen=True, slots=True)
+class BluetoothDevice:
+    """A Bluetooth device known to the server."""
+
+    address: str
+    name: str
+    paired: bool
+    trusted: bool
+    connected: bool
+
+    @classmethod
+    def from_dict(cls, raw: dict[str, Any]) -> BluetoothDevice:
+        """Parse a Bluetooth device from the API."""
+        return cls(
+            address=raw["address"],
+            name=raw.get("name", raw["address"]),
+            paired=raw.get("paired", False),
+            trusted=raw.get("trusted", False),
+            connected=raw.get("connected", False),
+        )
+
+
+def parse_models(
+    parse: Callable[[dict[str, Any]], _ModelT],
+    key: Callable[[_ModelT], Any],
+    raw_items: list[dict[str, Any]],
+    previous: list[_ModelT] | None,
+) -> list[_ModelT]:
+    """Parse a list of API items, reusing unchanged objects from the previous list.
+
+    A model equal to the previous one with the same key is replaced by that
+    instance, and the previous list itself is returned when nothing changed,
+    so snapshots share structure and unchanged data compares by identity.
+    """
+    reusable = {key(item): item for item in previous} if previous else {}
+    models = []
+    for raw in raw_items:
+        model = parse(raw)
+        old = reusable.get(key(model))
+        models.append(old if old is not None and old == model else model)
+
+    if previous is not None and len(models) == len(previous) and all(
+        model is old for model, old in zip(models, previous)
+    ):
+        return previous
+    return models
@@ -10,8 +10,10 @@ from homeassistant.core import HomeAssistant
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
-from .const import DOMAIN
+from .const import DOMAIN, SOURCE_AIRPLAY, SOURCE_SPOTIFY, SOURCE_TTS
 from .coordinator import LinuxAudioServerCoordinator
+from .entity import ChangeFilterMixin, OptimisticStateMixin
+from .models import SinkInput
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -34,7 +36,7 @@ async def async_setup_entry(
     async_add_entities(entities)
 
 
-class SourceVolumeNumber(CoordinatorEntity, NumberEntity):
+class SourceVolumeNumber(ChangeFilterMixin, OptimisticStateMixin, CoordinatorEntity, NumberEntity):
     """Base class for source volume control."""
 
     _attr_has_entity_name = False
@@ -49,16 +51,20 @@ class SourceVolumeNumber(CoordinatorEntity, NumberEntity):
         coordinator: LinuxAudioServerCoordinator,
         entry: ConfigEntry,
         source_name: str,
-        source_identifier: str,
+        source: str,
     ) -> None:
         """Initialize the source volume number entity."""
         super().__init__(coordinator)
         self._entry = entry
         self._source_name = source_name
-        self._source_identifier = source_identifier
+        self._source = source
         self._attr_unique_id = f"{entry.entry_id}_{source_name.lower().replace(' ', '_')}_volume"
         self._attr_name = f"{source_name} Volume"
 
+    def _change_keys(self) -> list[Any]:
+        """Return the coordinator change keys this entity renders from."""
+        return [("source", self._source)]
+
     @property
     def device_info(self) -> dict[str, Any]:
         """Return device information."""
@@ -69,26 +75,26 @@ class SourceVolumeNumber(CoordinatorEntity, NumberEntity):
             "model": "Audio Controller",
         }
 
-    def _find_sink_input(self) -> dict[str, Any] | None:
+    def _find_sink_input(self) -> SinkInput | None:
         """Find the sink-input for this source."""
-        sink_inputs = self.coordinator.data.get("sink_inputs", [])
-        for sink_input in sink_inputs:
-            if self._source_identifier in sink_input.get("name", ""):
-                return sink_input
-        return None
+        return self.coordinator.data.get("sink_inputs_by_source", {}).get(self._source)
 
     @property
     def available(self) -> bool:
         """Return if entity is available (source is active)."""
         return self.coordinator.last_update_success and self._find_sink_input() is not None
 
-    @property
-    def native_value(self) -> float | None:
-        """Return current volume level."""
+    def _actual_value(self, key: str) -> Any:
+        """Return the source volume from coordinator data."""
         sink_input = self._find_sink_input()
         if not sink_input:
             return None
-        return sink_input.get("volume", 0.0)
+        return sink_input.volume if sink_input.volume is not None else 0.0
+
+    @property
+    def native_value(self) -> float | None:
+        """Return current volume level."""
+        return self._optimistic_value("value", self._actual_value("value"))
 
     async def async_set_native_value(self, value: float) -> None:
         """Set the volume level."""
@@ -99,13 +105,18 @@ class SourceVolumeNumber(CoordinatorEntity, NumberEntity):
                 return
 
             _LOGGER.info("Setting %s volume to %.2f", self._source_name, value)
-            await self.coordinator.client.set_stream_volume(
-                sink_input["index"],
+            self._set_optimistic("value", value)
+            result = await self.coordinator.client.set_stream_volume(
+                sink_input.index,
                 value
             )
-            await self.coordinator.async_request_refresh()
+            # Intermediate values of a slider drag are superseded; only the
+            # final one refreshes
+            if result is not None:
+                await self.coordinator.async_request_refresh()
 
         except Exception as err:
+            self._rollback_optimistic("value")
             _LOGGER.error(
                 "Failed to set %s volume: %s",
                 self._source_name,
@@ -122,7 +133,7 @@ class AirplayVolumeNumber(SourceVolumeNumber):
         entry: ConfigEntry,
     ) -> None:
         """Initialize Airplay volume control."""
-        super().__init__(coordinator, entry, "Airplay", "Shairport Sync")
+        super().__init__(coordinator, entry, "Airplay", SOURCE_AIRPLAY)
 
 
 class TTSVolumeNumber(SourceVolumeNumber):
@@ -134,7 +145,7 @@ class TTSVolumeNumber(SourceVolumeNumber):
         entry: ConfigEntry,
     ) -> None:
         """Initialize TTS volume control."""
-        super().__init__(coordinator, entry, "TTS", "Mopidy Player 1 (TTS)")
+        super().__init__(coordinator, entry, "TTS", SOURCE_TTS)
 
 
 class SpotifyVolumeNumber(SourceVolumeNumber):
@@ -146,4 +157,4 @@ class SpotifyVolumeNumber(SourceVolumeNumber):
         entry: ConfigEntry,
     ) -> None:
         """Initialize Spotify volume control."""
-        super().__init__(coordinator, entry, "Spotify", "librespot")
+        super().__init__(coordinator, entry, "Spotify", SOURCE_SPOTIFY)
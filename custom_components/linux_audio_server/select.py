@@ -10,8 +10,11 @@ from homeassistant.core import HomeAssistant
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
-from .const import DOMAIN
-from .coordinator import LinuxAudioServerCoordinator
+from .const import DOMAIN, SOURCE_AIRPLAY, SOURCE_SPOTIFY, SOURCE_TTS
+from .coordinator import SINK_LIST_KEY, LinuxAudioServerCoordinator
+from .entity import ChangeFilterMixin, OptimisticStateMixin
+from .lifecycle import KIND_SINK
+from .models import Sink, SinkInput
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -29,10 +32,6 @@ async def async_setup_entry(
     # Create ONE global radio station selector
     entities.append(RadioStationSelect(coordinator, entry))
 
-    # Create per-sink radio station selectors
-    for sink in coordinator.data.get("sinks", []):
-        entities.append(SinkRadioStationSelect(coordinator, entry, sink))
-
     # Create source routing selectors (Airplay, TTS, Spotify)
     entities.append(AirplaySinkSelect(coordinator, entry))
     entities.append(TTSSinkSelect(coordinator, entry))
@@ -40,23 +39,16 @@ async def async_setup_entry(
 
     async_add_entities(entities)
 
-    # Set up a listener to add selectors for new sinks dynamically
-    async def async_update_entities() -> None:
-        """Update entities when coordinator data changes."""
-        current_entities = {entity.unique_id for entity in entities}
-        new_sinks = coordinator.data.get("sinks", [])
-
-        for sink in new_sinks:
-            unique_id = f"{entry.entry_id}_{sink['name']}_radio_selector"
-            if unique_id not in current_entities:
-                new_entity = SinkRadioStationSelect(coordinator, entry, sink)
-                entities.append(new_entity)
-                async_add_entities([new_entity])
+    # Create per-sink radio station selectors, following sink changes
+    coordinator.entity_lifecycle.async_register_platform(
+        "select",
+        KIND_SINK,
+        lambda sink: SinkRadioStationSelect(coordinator, entry, sink),
+        async_add_entities,
+    )
 
-    coordinator.async_add_listener(async_update_entities)
 
-
-class RadioStationSelect(CoordinatorEntity, SelectEntity):
+class RadioStationSelect(ChangeFilterMixin, CoordinatorEntity, SelectEntity):
     """Select entity for choosing radio stations."""
 
     _attr_has_entity_name = False
@@ -73,6 +65,10 @@ class RadioStationSelect(CoordinatorEntity, SelectEntity):
         self._attr_unique_id = f"{entry.entry_id}_radio_station_selector"
         self._attr_name = "Radio Station"
 
+    def _change_keys(self) -> list[Any]:
+        """Return the coordinator change keys this entity renders from."""
+        return ["radio_streams", "playback", "default_sink"]
+
     @property
     def device_info(self) -> dict[str, Any]:
         """Return device information."""
@@ -104,9 +100,9 @@ class RadioStationSelect(CoordinatorEntity, SelectEntity):
     def current_option(self) -> str | None:
         """Return currently playing station if any."""
         playback = self.coordinator.data.get("playback", {})
-        track = playback.get("track", {})
+        track = playback.get("track")
         # Check if current track is from radio
-        title = track.get("name")
+        title = track.name if track else None
         if title and title in self.options:
             return title
         return None
@@ -119,6 +115,7 @@ class RadioStationSelect(CoordinatorEntity, SelectEntity):
 
             # Play on default sink to avoid ambiguity
             await self.coordinator.client.play_radio_stream(option, sink=default_sink)
+            self.coordinator.invalidate_slices("player_assignments")
             await self.coordinator.async_request_refresh()
 
             if default_sink:
@@ -129,7 +126,7 @@ class RadioStationSelect(CoordinatorEntity, SelectEntity):
             _LOGGER.error("Failed to play radio station %s: %s", option, err)
 
 
-class SinkRadioStationSelect(CoordinatorEntity, SelectEntity):
+class SinkRadioStationSelect(ChangeFilterMixin, CoordinatorEntity, SelectEntity):
     """Per-sink radio station selector."""
 
     _attr_has_entity_name = False
@@ -139,20 +136,24 @@ class SinkRadioStationSelect(CoordinatorEntity, SelectEntity):
         self,
         coordinator: LinuxAudioServerCoordinator,
         entry: ConfigEntry,
-        sink: dict[str, Any],
+        sink: Sink,
     ) -> None:
         """Initialize the per-sink select entity."""
         super().__init__(coordinator)
         self._entry = entry
-        self._sink_name = sink["name"]
-        self._attr_unique_id = f"{entry.entry_id}_{sink['name']}_radio_selector"
-        self._attr_name = f"{sink['description']} Radio"
+        self._sink_name = sink.name
+        self._attr_unique_id = f"{entry.entry_id}_{sink.name}_radio_selector"
+        self._attr_name = f"{sink.description} Radio"
+
+    def _change_keys(self) -> list[Any]:
+        """Return the coordinator change keys this entity renders from."""
+        return [("sink", self._sink_name), "radio_streams", "player_assignments", "players"]
 
     @property
     def device_info(self) -> dict[str, Any]:
         """Return device information about this entity."""
         sink = self._sink_data
-        device_name = sink.get("description", self._sink_name) if sink else self._sink_name
+        device_name = sink.description if sink else self._sink_name
         return {
             "identifiers": {(DOMAIN, self._sink_name)},
             "name": device_name,
@@ -161,12 +162,9 @@ class SinkRadioStationSelect(CoordinatorEntity, SelectEntity):
         }
 
     @property
-    def _sink_data(self) -> dict[str, Any] | None:
+    def _sink_data(self) -> Sink | None:
         """Get current sink data from coordinator."""
-        for sink in self.coordinator.data.get("sinks", []):
-            if sink["name"] == self._sink_name:
-                return sink
-        return None
+        return self.coordinator.data.get("sinks_by_name", {}).get(self._sink_name)
 
     @property
     def available(self) -> bool:
@@ -199,15 +197,15 @@ class SinkRadioStationSelect(CoordinatorEntity, SelectEntity):
             return "Off"
 
         # Get playback status for this player
-        players_data = self.coordinator.data.get("players", {})
-        player_data = players_data.get(assigned_player, {})
+        players_by_id = self.coordinator.data.get("players_by_id", {})
+        player = players_by_id.get(assigned_player)
 
-        if player_data.get("state") not in ["playing", "paused"]:
+        if player is None or player.state not in ["playing", "paused"]:
             return "Off"
 
         # Check if current track title matches a radio station name
-        track = player_data.get("current_track", {})
-        title = track.get("name")
+        track = player.current_track
+        title = track.name if track else None
 
         if title and title in self.options:
             return title
@@ -227,6 +225,7 @@ class SinkRadioStationSelect(CoordinatorEntity, SelectEntity):
                 _LOGGER.info("Playing radio station %s on sink: %s", option, self._sink_name)
                 await self.coordinator.client.play_radio_stream(option, sink=self._sink_name)
 
+            self.coordinator.invalidate_slices("player_assignments")
             await self.coordinator.async_request_refresh()
         except Exception as err:
             _LOGGER.error(
@@ -237,7 +236,9 @@ class SinkRadioStationSelect(CoordinatorEntity, SelectEntity):
             )
 
 
-class SourceSinkRouterSelect(CoordinatorEntity, SelectEntity):
+class SourceSinkRouterSelect(
+    ChangeFilterMixin, OptimisticStateMixin, CoordinatorEntity, SelectEntity
+):
     """Base class for routing audio sources to sinks."""
 
     _attr_has_entity_name = False
@@ -248,16 +249,20 @@ class SourceSinkRouterSelect(CoordinatorEntity, SelectEntity):
         coordinator: LinuxAudioServerCoordinator,
         entry: ConfigEntry,
         source_name: str,
-        source_identifier: str,
+        source: str,
     ) -> None:
         """Initialize the source router select entity."""
         super().__init__(coordinator)
         self._entry = entry
         self._source_name = source_name
-        self._source_identifier = source_identifier
+        self._source = source
         self._attr_unique_id = f"{entry.entry_id}_{source_name.lower().replace(' ', '_')}_sink_router"
         self._attr_name = f"{source_name} Output"
 
+    def _change_keys(self) -> list[Any]:
+        """Return the coordinator change keys this entity renders from."""
+        return [("source", self._source), SINK_LIST_KEY]
+
     @property
     def device_info(self) -> dict[str, Any]:
         """Return device information."""
@@ -268,13 +273,9 @@ class SourceSinkRouterSelect(CoordinatorEntity, SelectEntity):
             "model": "Audio Controller",
         }
 
-    def _find_sink_input(self) -> dict[str, Any] | None:
+    def _find_sink_input(self) -> SinkInput | None:
         """Find the sink-input for this source."""
-        sink_inputs = self.coordinator.data.get("sink_inputs", [])
-        for sink_input in sink_inputs:
-            if self._source_identifier in sink_input.get("name", ""):
-                return sink_input
-        return None
+        return self.coordinator.data.get("sink_inputs_by_source", {}).get(self._source)
 
     @property
     def available(self) -> bool:
@@ -285,16 +286,20 @@ class SourceSinkRouterSelect(CoordinatorEntity, SelectEntity):
     def options(self) -> list[str]:
         """Return list of available sink descriptions."""
         sinks = self.coordinator.data.get("sinks", [])
-        return [sink.get("description", sink["name"]) for sink in sinks]
+        return [sink.description for sink in sinks]
 
-    @property
-    def current_option(self) -> str | None:
-        """Return currently selected sink description."""
+    def _actual_value(self, key: str) -> Any:
+        """Return the sink description the source plays on."""
         sink_input = self._find_sink_input()
         if not sink_input:
             return None
 
-        return sink_input.get("sink_description")
+        return sink_input.sink_description
+
+    @property
+    def current_option(self) -> str | None:
+        """Return currently selected sink description."""
+        return self._optimistic_value("option", self._actual_value("option"))
 
     async def async_select_option(self, option: str) -> None:
         """Route source to the selected sink."""
@@ -306,12 +311,8 @@ class SourceSinkRouterSelect(CoordinatorEntity, SelectEntity):
                 return
 
             # Find the sink by description
-            sinks = self.coordinator.data.get("sinks", [])
-            target_sink = None
-            for sink in sinks:
-                if sink.get("description", sink["name"]) == option:
-                    target_sink = sink["name"]
-                    break
+            sink = self.coordinator.data.get("sinks_by_description", {}).get(option)
+            target_sink = sink.name if sink else None
 
             if not target_sink:
                 _LOGGER.error("Cannot find sink with description: %s", option)
@@ -319,13 +320,15 @@ class SourceSinkRouterSelect(CoordinatorEntity, SelectEntity):
 
             # Move the stream
             _LOGGER.info("Moving %s to sink: %s", self._source_name, target_sink)
+            self._set_optimistic("option", option)
             await self.coordinator.client.move_stream(
-                sink_input["index"],
+                sink_input.index,
                 target_sink
             )
             await self.coordinator.async_request_refresh()
 
         except Exception as err:
+            self._rollback_optimistic("option")
             _LOGGER.error(
                 "Failed to route %s to sink %s: %s",
                 self._source_name,
@@ -343,7 +346,7 @@ class AirplaySinkSelect(SourceSinkRouterSelect):
         entry: ConfigEntry,
     ) -> None:
         """Initialize Airplay sink router."""
-        super().__init__(coordinator, entry, "Airplay", "Shairport Sync")
+        super().__init__(coordinator, entry, "Airplay", SOURCE_AIRPLAY)
         self._attr_icon = "mdi:cast-audio"
 
 
@@ -356,7 +359,7 @@ class TTSSinkSelect(SourceSinkRouterSelect):
         entry: ConfigEntry,
     ) -> None:
         """Initialize TTS sink router."""
-        super().__init__(coordinator, entry, "TTS", "Mopidy Player 1 (TTS)")
+        super().__init__(coordinator, entry, "TTS", SOURCE_TTS)
         self._attr_icon = "mdi:text-to-speech"
 
 
@@ -369,5 +372,5 @@ class SpotifySinkSelect(SourceSinkRouterSelect):
         entry: ConfigEntry,
     ) -> None:
         """Initialize Spotify sink router."""
-        super().__init__(coordinator, entry, "Spotify", "librespot")
+        super().__init__(coordinator, entry, "Spotify", SOURCE_SPOTIFY)
         self._attr_icon = "mdi:spotify"
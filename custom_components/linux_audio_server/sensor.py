@@ -5,17 +5,26 @@ from datetime import datetime
 import logging
 from typing import Any
 
-from homeassistant.components.sensor import SensorEntity
+from homeassistant.components.sensor import (
+    SensorDeviceClass,
+    SensorEntity,
+    SensorStateClass,
+)
 from homeassistant.config_entries import ConfigEntry
+from homeassistant.const import EntityCategory, UnitOfTime
 from homeassistant.core import HomeAssistant
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
 from .const import DOMAIN
 from .coordinator import LinuxAudioServerCoordinator
+from .entity import ChangeFilterMixin
 
 _LOGGER = logging.getLogger(__name__)
 
+# Request metrics counters reported as errors
+API_ERROR_COUNTERS = ("timeouts", "json_errors", "connection_errors", "status_4xx", "status_5xx")
+
 
 async def async_setup_entry(
     hass: HomeAssistant,
@@ -31,12 +40,15 @@ async def async_setup_entry(
         BluetoothKeepAliveSensor(coordinator, entry),
         MopidyPlayersSensor(coordinator, entry),
         PlayedTracksHistorySensor(coordinator, entry),
+        PollingModeSensor(coordinator, entry),
+        ApiLatencySensor(coordinator, entry),
+        ApiErrorsSensor(coordinator, entry),
     ]
 
     async_add_entities(entities)
 
 
-class ActiveStreamsSensor(CoordinatorEntity, SensorEntity):
+class ActiveStreamsSensor(ChangeFilterMixin, CoordinatorEntity, SensorEntity):
     """Sensor showing the number of active audio streams."""
 
     _attr_has_entity_name = True
@@ -53,6 +65,10 @@ class ActiveStreamsSensor(CoordinatorEntity, SensorEntity):
         self._attr_unique_id = f"{entry.entry_id}_active_streams"
         self._attr_name = "Active Streams"
 
+    def _change_keys(self) -> list[Any]:
+        """Return the coordinator change keys this entity renders from."""
+        return ["sink_inputs"]
+
     @property
     def device_info(self) -> dict[str, Any]:
         """Return device information about this entity."""
@@ -80,18 +96,18 @@ class ActiveStreamsSensor(CoordinatorEntity, SensorEntity):
         return {
             "streams": [
                 {
-                    "index": stream.get("index"),
-                    "name": stream.get("name"),
-                    "sink": stream.get("sink_description"),
-                    "volume": stream.get("volume"),
-                    "muted": stream.get("muted"),
+                    "index": stream.index,
+                    "name": stream.name,
+                    "sink": stream.sink_description,
+                    "volume": stream.volume,
+                    "muted": stream.muted,
                 }
                 for stream in streams
             ]
         }
 
 
-class BluetoothKeepAliveSensor(CoordinatorEntity, SensorEntity):
+class BluetoothKeepAliveSensor(ChangeFilterMixin, CoordinatorEntity, SensorEntity):
     """Sensor showing Bluetooth keep-alive status."""
 
     _attr_has_entity_name = True
@@ -108,6 +124,10 @@ class BluetoothKeepAliveSensor(CoordinatorEntity, SensorEntity):
         self._attr_unique_id = f"{entry.entry_id}_bluetooth_keep_alive"
         self._attr_name = "Bluetooth Keep-Alive"
 
+    def _change_keys(self) -> list[Any]:
+        """Return the coordinator change keys this entity renders from."""
+        return ["keep_alive"]
+
     @property
     def device_info(self) -> dict[str, Any]:
         """Return device information about this entity."""
@@ -139,7 +159,7 @@ class BluetoothKeepAliveSensor(CoordinatorEntity, SensorEntity):
         }
 
 
-class MopidyPlayersSensor(CoordinatorEntity, SensorEntity):
+class MopidyPlayersSensor(ChangeFilterMixin, CoordinatorEntity, SensorEntity):
     """Sensor showing Mopidy player instances and assignments."""
 
     _attr_has_entity_name = True
@@ -156,6 +176,10 @@ class MopidyPlayersSensor(CoordinatorEntity, SensorEntity):
         self._attr_unique_id = f"{entry.entry_id}_mopidy_players"
         self._attr_name = "Mopidy Players"
 
+    def _change_keys(self) -> list[Any]:
+        """Return the coordinator change keys this entity renders from."""
+        return ["players", "player_assignments"]
+
     @property
     def device_info(self) -> dict[str, Any]:
         """Return device information about this entity."""
@@ -175,7 +199,7 @@ class MopidyPlayersSensor(CoordinatorEntity, SensorEntity):
     def native_value(self) -> int:
         """Return the number of active players."""
         players = self.coordinator.data.get("players", [])
-        return len([p for p in players if p.get("active", False)])
+        return len([p for p in players if p.active])
 
     @property
     def extra_state_attributes(self) -> dict[str, Any]:
@@ -185,9 +209,9 @@ class MopidyPlayersSensor(CoordinatorEntity, SensorEntity):
         return {
             "players": [
                 {
-                    "name": player.get("name"),
-                    "active": player.get("active", False),
-                    "status": player.get("status"),
+                    "name": player.name,
+                    "active": player.active,
+                    "status": player.status,
                 }
                 for player in players
             ],
@@ -195,7 +219,7 @@ class MopidyPlayersSensor(CoordinatorEntity, SensorEntity):
         }
 
 
-class PlayedTracksHistorySensor(CoordinatorEntity, SensorEntity):
+class PlayedTracksHistorySensor(ChangeFilterMixin, CoordinatorEntity, SensorEntity):
     """Sensor tracking recently played tracks history."""
 
     _attr_has_entity_name = True
@@ -215,6 +239,10 @@ class PlayedTracksHistorySensor(CoordinatorEntity, SensorEntity):
         self._last_track_uri: str | None = None
         self._max_history = 50  # Keep last 50 tracks
 
+    def _change_keys(self) -> list[Any]:
+        """Return the coordinator change keys this entity renders from."""
+        return ["playback", "players"]
+
     @property
     def device_info(self) -> dict[str, Any]:
         """Return device information about this entity."""
@@ -259,16 +287,16 @@ class PlayedTracksHistorySensor(CoordinatorEntity, SensorEntity):
             # No track playing, check all players
             players = self.coordinator.data.get("players", [])
             for player in players:
-                player_track = player.get("current_track")
+                player_track = player.current_track
                 if player_track:
                     track = player_track
                     break
 
         if track:
             # Create a unique identifier for the track
-            track_uri = track.get("uri", "")
-            track_name = track.get("name", "")
-            track_artist = track.get("artist", "")
+            track_uri = track.uri or ""
+            track_name = track.name or ""
+            track_artist = track.artist or ""
 
             # Use URI or fallback to name+artist combination
             track_id = track_uri or f"{track_artist}|{track_name}"
@@ -285,10 +313,10 @@ class PlayedTracksHistorySensor(CoordinatorEntity, SensorEntity):
                 self._history.insert(0, {
                     "title": track_name,
                     "artist": track_artist,
-                    "album": track.get("album", ""),
+                    "album": track.album or "",
                     "uri": track_uri,
                     "timestamp": datetime.now().isoformat(),
-                    "duration": track.get("length"),  # Duration in ms
+                    "duration": track.length,  # Duration in ms
                 })
 
                 # Trim history to max size
@@ -299,3 +327,162 @@ class PlayedTracksHistorySensor(CoordinatorEntity, SensorEntity):
 
         # Call parent to trigger entity update
         super()._handle_coordinator_update()
+
+
+class PollingModeSensor(CoordinatorEntity, SensorEntity):
+    """Sensor showing whether updates are pushed or polled."""
+
+    _attr_has_entity_name = True
+    _attr_icon = "mdi:sync"
+    _attr_entity_category = EntityCategory.DIAGNOSTIC
+
+    def __init__(
+        self,
+        coordinator: LinuxAudioServerCoordinator,
+        entry: ConfigEntry,
+    ) -> None:
+        """Initialize the sensor."""
+        super().__init__(coordinator)
+        self._entry = entry
+        self._attr_unique_id = f"{entry.entry_id}_polling_mode"
+        self._attr_name = "Polling Mode"
+
+    @property
+    def device_info(self) -> dict[str, Any]:
+        """Return device information about this entity."""
+        return {
+            "identifiers": {(DOMAIN, self._entry.entry_id)},
+            "name": "Linux Audio Server",
+            "manufacturer": "Linux Audio Server",
+            "model": "Audio Hub",
+        }
+
+    @property
+    def native_value(self) -> str:
+        """Return the current polling mode."""
+        return self.coordinator.poll_mode
+
+    @property
+    def extra_state_attributes(self) -> dict[str, Any]:
+        """Return the current poll interval and WebSocket state."""
+        return {
+            "update_interval": self.coordinator.update_interval.total_seconds(),
+            "websocket_connected": self.coordinator.client.websocket_connected,
+            "cached_snapshot": self.coordinator.snapshot_stale,
+        }
+
+
+class ApiLatencySensor(CoordinatorEntity, SensorEntity):
+    """Sensor showing the rolling p95 latency of requests to the server."""
+
+    _attr_has_entity_name = True
+    _attr_icon = "mdi:timer-outline"
+    _attr_entity_category = EntityCategory.DIAGNOSTIC
+    _attr_device_class = SensorDeviceClass.DURATION
+    _attr_state_class = SensorStateClass.MEASUREMENT
+    _attr_native_unit_of_measurement = UnitOfTime.MILLISECONDS
+    # Every request moves these, so recording them would store a new
+    # attributes row on each coordinator update
+    _unrecorded_attributes = frozenset({"endpoints", "p50", "p99", "requests"})
+
+    def __init__(
+        self,
+        coordinator: LinuxAudioServerCoordinator,
+        entry: ConfigEntry,
+    ) -> None:
+        """Initialize the sensor."""
+        super().__init__(coordinator)
+        self._entry = entry
+        self._attr_unique_id = f"{entry.entry_id}_api_latency"
+        self._attr_name = "API Latency"
+
+    @property
+    def device_info(self) -> dict[str, Any]:
+        """Return device information about this entity."""
+        return {
+            "identifiers": {(DOMAIN, self._entry.entry_id)},
+            "name": "Linux Audio Server",
+            "manufacturer": "Linux Audio Server",
+            "model": "Audio Hub",
+        }
+
+    @property
+    def native_value(self) -> float | None:
+        """Return the p95 latency over recent requests in milliseconds."""
+        p95 = self.coordinator.client.request_metrics["overall"]["p95"]
+        return round(p95 * 1000, 1) if p95 is not None else None
+
+    @property
+    def extra_state_attributes(self) -> dict[str, Any]:
+        """Return overall percentiles and p95 per endpoint in milliseconds."""
+        metrics = self.coordinator.client.request_metrics
+        overall = metrics["overall"]
+        return {
+            "p50": _to_ms(overall["p50"]),
+            "p99": _to_ms(overall["p99"]),
+            "requests": overall["requests"],
+            "endpoints": {
+                route: _to_ms(route_metrics["p95"])
+                for route, route_metrics in metrics["routes"].items()
+            },
+        }
+
+
+class ApiErrorsSensor(CoordinatorEntity, SensorEntity):
+    """Sensor counting failed requests to the server."""
+
+    _attr_has_entity_name = True
+    _attr_icon = "mdi:alert-circle-outline"
+    _attr_entity_category = EntityCategory.DIAGNOSTIC
+    _attr_state_class = SensorStateClass.TOTAL_INCREASING
+    _unrecorded_attributes = frozenset({"endpoints"})
+
+    def __init__(
+        self,
+        coordinator: LinuxAudioServerCoordinator,
+        entry: ConfigEntry,
+    ) -> None:
+        """Initialize the sensor."""
+        super().__init__(coordinator)
+        self._entry = entry
+        self._attr_unique_id = f"{entry.entry_id}_api_errors"
+        self._attr_name = "API Errors"
+
+    @property
+    def device_info(self) -> dict[str, Any]:
+        """Return device information about this entity."""
+        return {
+            "identifiers": {(DOMAIN, self._entry.entry_id)},
+            "name": "Linux Audio Server",
+            "manufacturer": "Linux Audio Server",
+            "model": "Audio Hub",
+        }
+
+    @property
+    def native_value(self) -> int:
+        """Return the number of failed requests since startup."""
+        overall = self.coordinator.client.request_metrics["overall"]
+        return sum(overall.get(counter, 0) for counter in API_ERROR_COUNTERS)
+
+    @property
+    def extra_state_attributes(self) -> dict[str, Any]:
+        """Return error and retry counters, overall and per failing endpoint."""
+        metrics = self.coordinator.client.request_metrics
+        counters = (*API_ERROR_COUNTERS, "retries")
+        return {
+            **{counter: metrics["overall"].get(counter, 0) for counter in counters},
+            "endpoints": {
+                route: {
+                    counter: route_metrics[counter]
+                    for counter in counters
+                    if counter in route_metrics
+                }
+                for route, route_metrics in metrics["routes"].items()
+                if any(counter in route_metrics for counter in counters)
+            },
+        }
+
+
+def _to_ms(seconds: float | None) -> float | None:
+    """Convert a latency in seconds to milliseconds."""
+    return round(seconds * 1000, 1) if seconds is not None else None
@@ -10,8 +10,12 @@ from homeassistant.core import HomeAssistant
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
+from .api import ApiClientError
 from .const import DOMAIN
 from .coordinator import LinuxAudioServerCoordinator
+from .entity import ChangeFilterMixin, OptimisticStateMixin
+from .lifecycle import KIND_SINK
+from .models import Sink
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -24,30 +28,16 @@ async def async_setup_entry(
     """Set up Linux Audio Server switch entities."""
     coordinator: LinuxAudioServerCoordinator = hass.data[DOMAIN][entry.entry_id]
 
-    # Create switch entities for setting default sink
-    entities = []
-    for sink in coordinator.data.get("sinks", []):
-        entities.append(DefaultSinkSwitch(coordinator, entry, sink))
+    # Create a switch for setting each sink as default, following sink changes
+    coordinator.entity_lifecycle.async_register_platform(
+        "switch",
+        KIND_SINK,
+        lambda sink: DefaultSinkSwitch(coordinator, entry, sink),
+        async_add_entities,
+    )
 
-    async_add_entities(entities)
 
-    # Set up a listener to add new sinks dynamically
-    async def async_update_entities() -> None:
-        """Update entities when coordinator data changes."""
-        current_entities = {entity.unique_id for entity in entities}
-        new_sinks = coordinator.data.get("sinks", [])
-
-        for sink in new_sinks:
-            unique_id = f"{entry.entry_id}_{sink['name']}_default_switch"
-            if unique_id not in current_entities:
-                new_entity = DefaultSinkSwitch(coordinator, entry, sink)
-                entities.append(new_entity)
-                async_add_entities([new_entity])
-
-    coordinator.async_add_listener(async_update_entities)
-
-
-class DefaultSinkSwitch(CoordinatorEntity, SwitchEntity):
+class DefaultSinkSwitch(ChangeFilterMixin, OptimisticStateMixin, CoordinatorEntity, SwitchEntity):
     """Switch to set a sink as the default."""
 
     _attr_has_entity_name = False
@@ -56,24 +46,25 @@ class DefaultSinkSwitch(CoordinatorEntity, SwitchEntity):
         self,
         coordinator: LinuxAudioServerCoordinator,
         entry: ConfigEntry,
-        sink: dict[str, Any],
+        sink: Sink,
     ) -> None:
         """Initialize the switch."""
         super().__init__(coordinator)
         self._entry = entry
-        self._sink_name = sink["name"]
-        self._attr_unique_id = f"{entry.entry_id}_{sink['name']}_default_switch"
-        self._attr_name = f"{sink['description']} Default"
+        self._sink_name = sink.name
+        self._attr_unique_id = f"{entry.entry_id}_{sink.name}_default_switch"
+        self._attr_name = f"{sink.description} Default"
+
+    def _change_keys(self) -> list[Any]:
+        """Return the coordinator change keys this entity renders from."""
+        return [("sink", self._sink_name), "default_sink"]
 
     @property
     def device_info(self) -> dict[str, Any]:
         """Return device information about this entity."""
         # Find sink description for consistent device naming
-        device_name = self._sink_name
-        for sink in self.coordinator.data.get("sinks", []):
-            if sink["name"] == self._sink_name:
-                device_name = sink.get("description", self._sink_name)
-                break
+        sink = self.coordinator.data.get("sinks_by_name", {}).get(self._sink_name)
+        device_name = sink.description if sink else self._sink_name
 
         return {
             "identifiers": {(DOMAIN, self._sink_name)},
@@ -86,20 +77,27 @@ class DefaultSinkSwitch(CoordinatorEntity, SwitchEntity):
     def available(self) -> bool:
         """Return if entity is available."""
         # Check if sink still exists in coordinator data
-        for sink in self.coordinator.data.get("sinks", []):
-            if sink["name"] == self._sink_name:
-                return self.coordinator.last_update_success
-        return False
+        if self._sink_name not in self.coordinator.data.get("sinks_by_name", {}):
+            return False
+        return self.coordinator.last_update_success
+
+    def _actual_value(self, key: str) -> Any:
+        """Return whether coordinator data has this sink as the default."""
+        return self.coordinator.data.get("default_sink") == self._sink_name
 
     @property
     def is_on(self) -> bool:
         """Return true if this sink is the default."""
-        default_sink = self.coordinator.data.get("default_sink")
-        return default_sink == self._sink_name
+        return self._optimistic_value("is_on", self._actual_value("is_on"))
 
     async def async_turn_on(self, **kwargs: Any) -> None:
         """Set this sink as the default."""
-        await self.coordinator.client.set_default_sink(self._sink_name)
+        self._set_optimistic("is_on", True)
+        try:
+            await self.coordinator.client.set_default_sink(self._sink_name)
+        except ApiClientError:
+            self._rollback_optimistic("is_on")
+            raise
         await self.coordinator.async_request_refresh()
 
     async def async_turn_off(self, **kwargs: Any) -> None:
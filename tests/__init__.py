@@ -0,0 +1 @@
+"""Tests for the Linux Audio Server integration."""
@@ -0,0 +1,102 @@
+"""Fixtures for Linux Audio Server tests."""
+from __future__ import annotations
+
+from collections.abc import AsyncIterator, Awaitable, Callable
+from unittest.mock import AsyncMock, MagicMock
+
+from aiohttp import web
+from aiohttp.test_utils import TestServer
+import pytest
+import pytest_socket
+
+from custom_components.linux_audio_server.coordinator import LinuxAudioServerCoordinator
+
+SINKS = {
+    "sinks": [
+        {
+            "name": "living_room",
+            "description": "Living Room",
+            "index": 1,
+            "state": "RUNNING",
+            "volume": 0.5,
+            "muted": False,
+            "is_default": True,
+        },
+        {
+            "name": "kitchen",
+            "description": "Kitchen",
+            "index": 2,
+            "state": "SUSPENDED",
+            "volume": 0.3,
+            "muted": False,
+            "is_default": False,
+        },
+    ],
+    "default_sink": "living_room",
+}
+
+SINK_INPUTS = {
+    "sink_inputs": [
+        {
+            "index": 7,
+            "name": "Mopidy Player 1",
+            "sink": "living_room",
+            "sink_description": "Living Room",
+            "volume": 0.8,
+            "muted": False,
+        },
+    ]
+}
+
+PLAYBACK = {"state": "playing", "track": None}
+
+
+@pytest.fixture
+def client() -> MagicMock:
+    """Return an API client serving a fixed server state."""
+    client = MagicMock()
+    client.websocket_connected = False
+    client.get_sinks = AsyncMock(return_value=SINKS)
+    client.get_sink_inputs = AsyncMock(return_value=SINK_INPUTS)
+    client.get_playback_status = AsyncMock(return_value=PLAYBACK)
+    client.get_radio_streams = AsyncMock(return_value={"streams": {}})
+    client.get_bluetooth_devices = AsyncMock(return_value={"devices": []})
+    client.get_keep_alive_status = AsyncMock(return_value={})
+    client.get_players = AsyncMock(return_value={"players": []})
+    client.get_player_assignments = AsyncMock(return_value={"assignments": {}})
+    return client
+
+
+@pytest.fixture
+async def coordinator(hass, client) -> LinuxAudioServerCoordinator:
+    """Return a coordinator that completed its first refresh."""
+    coordinator = LinuxAudioServerCoordinator(hass, client)
+    await coordinator.async_refresh()
+    assert coordinator.last_update_success
+    return coordinator
+
+
+@pytest.fixture
+async def stand_in_server(
+    socket_enabled,
+) -> AsyncIterator[Callable[..., Awaitable[TestServer]]]:
+    """Return a factory serving an aiohttp app as a local stand-in backend.
+
+    The app listens on a loopback TCP port, and also on unix_socket when a
+    path is given.
+    """
+    servers: list[TestServer] = []
+
+    async def start(app: web.Application, unix_socket: str | None = None) -> TestServer:
+        server = TestServer(app, access_log=None)
+        await server.start_server()
+        servers.append(server)
+        if unix_socket is not None:
+            # Home Assistant's test plugin only lets sockets reach 127.0.0.1
+            pytest_socket.socket_allow_hosts(["127.0.0.1"], allow_unix_socket=True)
+            await web.UnixSite(server.runner, unix_socket).start()
+        return server
+
+    yield start
+    for server in servers:
+        await server.close()
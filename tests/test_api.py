@@ -0,0 +1,278 @@
+"""Tests for the Linux Audio Server API client."""
+from __future__ import annotations
+
+import asyncio
+from typing import Any
+
+from aiohttp import web
+
+from custom_components.linux_audio_server.api import (
+    PRIORITY_BACKGROUND,
+    PRIORITY_INTERACTIVE,
+    REQUEST_PRIORITY,
+    WS_OVERFLOW_COALESCE,
+    WS_OVERFLOW_DROP_OLDEST,
+    WS_RESYNC_EVENT,
+    LinuxAudioServerApiClient,
+    RequestScheduler,
+    WebSocketEventQueue,
+)
+
+
+def _event(index: int) -> dict:
+    """Return a sink-input change event."""
+    return {"source": "pulseaudio", "event": "sink_input.change", "data": {"index": index}}
+
+
+async def test_dropped_events_request_one_resync() -> None:
+    """Dropping events queues a resync after the remaining events."""
+    stats = {"dropped": 0, "coalesced": 0, "resyncs": 0, "max_queue_depth": 0}
+    queue = WebSocketEventQueue(2, WS_OVERFLOW_DROP_OLDEST, stats)
+    for index in range(4):
+        await queue.put(_event(index))
+
+    received = [(await queue.get())[0] for _ in range(3)]
+
+    assert received == [_event(2), _event(3), WS_RESYNC_EVENT]
+    assert stats["dropped"] == 2
+    assert stats["resyncs"] == 1
+    assert len(queue) == 0
+
+
+async def test_resync_is_never_dropped() -> None:
+    """A queued resync survives overflow."""
+    stats = {"dropped": 0, "coalesced": 0, "resyncs": 0, "max_queue_depth": 0}
+    queue = WebSocketEventQueue(2, WS_OVERFLOW_DROP_OLDEST, stats)
+    await queue.put(dict(WS_RESYNC_EVENT))
+    for index in range(3):
+        await queue.put(_event(index))
+
+    assert (await queue.get())[0] == WS_RESYNC_EVENT
+    assert (await queue.get())[0] == _event(2)
+
+
+async def test_coalesced_event_keeps_its_place_after_older_events() -> None:
+    """A coalesced full-state event is still handled after a later remove."""
+    stats = {"dropped": 0, "coalesced": 0, "resyncs": 0, "max_queue_depth": 0}
+    queue = WebSocketEventQueue(2, WS_OVERFLOW_COALESCE, stats)
+    new = {"source": "pulseaudio", "event": "sink_input.new", "seq": 1, "data": {"index": 5}}
+    remove = {"source": "pulseaudio", "event": "sink_input.remove", "data": {"index": 5}}
+    newer = {"source": "pulseaudio", "event": "sink_input.new", "seq": 3, "data": {"index": 5}}
+    for event in (new, remove, newer):
+        await queue.put(event)
+
+    assert [(await queue.get())[0] for _ in range(2)] == [remove, newer]
+    assert stats["coalesced"] == 1
+    assert stats["dropped"] == 0
+
+
+async def test_coalesced_partial_changes_are_merged() -> None:
+    """Two partial changes of one stream keep the fields of both."""
+    stats = {"dropped": 0, "coalesced": 0, "resyncs": 0, "max_queue_depth": 0}
+    queue = WebSocketEventQueue(2, WS_OVERFLOW_COALESCE, stats)
+    await queue.put({**_event(5), "seq": 1, "data": {"index": 5, "volume": 0.4}})
+    await queue.put(_event(6))
+    await queue.put({**_event(5), "seq": 3, "data": {"index": 5, "muted": True}})
+
+    assert (await queue.get())[0] == _event(6)
+    assert (await queue.get())[0] == {
+        **_event(5),
+        "seq": 3,
+        "data": {"index": 5, "volume": 0.4, "muted": True},
+    }
+    assert stats["coalesced"] == 1
+
+
+async def test_unsafe_partial_change_requests_resync() -> None:
+    """A change that cannot move past a later event is dropped for a resync."""
+    stats = {"dropped": 0, "coalesced": 0, "resyncs": 0, "max_queue_depth": 0}
+    queue = WebSocketEventQueue(2, WS_OVERFLOW_COALESCE, stats)
+    remove = {"source": "pulseaudio", "event": "sink_input.remove", "data": {"index": 5}}
+    await queue.put(_event(5))
+    await queue.put(remove)
+    await queue.put(_event(5))
+
+    received = [(await queue.get())[0] for _ in range(3)]
+
+    assert received == [_event(5), remove, WS_RESYNC_EVENT]
+    assert stats["dropped"] == 1
+
+
+async def test_dedicated_pool_reuses_connections(stand_in_server) -> None:
+    """Sequential requests share one kept-alive connection of the own pool."""
+
+    async def health(request: web.Request) -> web.Response:
+        return web.json_response({"status": "ok"})
+
+    app = web.Application()
+    app.router.add_get("/api/health", health)
+    server = await stand_in_server(app)
+    client = LinuxAudioServerApiClient(host=server.host, port=server.port, get_cache_ttl=0)
+    try:
+        for _ in range(3):
+            assert await client.health_check() == {"status": "ok"}
+        stats = client.pool_stats
+    finally:
+        await client.async_close()
+
+    assert stats["created"] == 1
+    assert stats["reused"] == 2
+    assert stats["acquired"] == 0
+    assert stats["open"] == stats["idle"] == 1
+
+
+async def test_reconnect_replays_events_left_in_queue(stand_in_server) -> None:
+    """Events received but not handled before a disconnect are replayed."""
+    since_requested: list[str | None] = []
+    first_handled = asyncio.Event()
+    replay_handled = asyncio.Event()
+
+    async def events(request: web.Request) -> web.WebSocketResponse:
+        ws = web.WebSocketResponse()
+        await ws.prepare(request)
+        since = request.query.get("since")
+        since_requested.append(since)
+        if since is None:
+            await ws.send_json({"source": "mopidy", "event": "e", "seq": 1})
+            await first_handled.wait()
+            await ws.send_json({"source": "mopidy", "event": "e", "seq": 2})
+            await ws.send_json({"source": "mopidy", "event": "e", "seq": 3})
+        else:
+            for seq in range(int(since) + 1, 4):
+                await ws.send_json({"source": "mopidy", "event": "e", "seq": seq})
+            await replay_handled.wait()
+        await ws.close()
+        return ws
+
+    app = web.Application()
+    app.router.add_get("/api/events/ws", events)
+    server = await stand_in_server(app)
+    client = LinuxAudioServerApiClient(host=server.host, port=server.port)
+    handled: list[int] = []
+
+    async def handle_first_connection(event: dict) -> None:
+        if event["seq"] == 1:
+            handled.append(1)
+            first_handled.set()
+        else:
+            # Still queued or being handled when the connection closes
+            await asyncio.Event().wait()
+
+    async def handle(event: dict) -> None:
+        handled.append(event["seq"])
+        if event["seq"] == 3:
+            replay_handled.set()
+
+    try:
+        await asyncio.wait_for(client.connect_websocket(handle_first_connection), 5)
+        await asyncio.wait_for(client.connect_websocket(handle), 5)
+    finally:
+        await client.async_close()
+
+    assert since_requested == [None, "1"]
+    assert handled == [1, 2, 3]
+
+
+async def test_invalidated_get_is_refetched(stand_in_server) -> None:
+    """A GET after invalidation neither uses the cache nor joins an older request."""
+    served = 0
+
+    async def sink_inputs(request: web.Request) -> web.Response:
+        nonlocal served
+        served += 1
+        return web.json_response({"sink_inputs": [], "served": served})
+
+    app = web.Application()
+    app.router.add_get("/api/audio/sink-inputs", sink_inputs)
+    server = await stand_in_server(app)
+    client = LinuxAudioServerApiClient(host=server.host, port=server.port)
+    try:
+        first = await client.get_sink_inputs()
+        cached = await client.get_sink_inputs()
+        client.invalidate_gets()
+        refetched = await client.get_sink_inputs()
+    finally:
+        await client.async_close()
+
+    assert first["served"] == cached["served"] == 1
+    assert refetched["served"] == 2
+
+
+async def test_interactive_request_skips_queued_background_work() -> None:
+    """The reserved slot admits a user command while background work queues."""
+    scheduler = RequestScheduler(4)
+    release = asyncio.Event()
+    started: list[str] = []
+
+    async def request(name: str, priority: int) -> None:
+        async with scheduler.slot(priority):
+            started.append(name)
+            if priority == PRIORITY_BACKGROUND:
+                await release.wait()
+
+    background = [
+        asyncio.create_task(request(f"background{i}", PRIORITY_BACKGROUND)) for i in range(5)
+    ]
+    await asyncio.sleep(0)
+    assert scheduler.in_flight == 3
+    assert scheduler.queued == 2
+
+    await asyncio.wait_for(request("interactive", PRIORITY_INTERACTIVE), 1)
+    assert started[-1] == "interactive"
+
+    release.set()
+    await asyncio.gather(*background)
+    assert scheduler.in_flight == 0
+
+
+async def test_urgent_get_does_not_join_background_get(stand_in_server) -> None:
+    """A GET only joins an in-flight one started at the same or higher priority."""
+
+    async def sinks(request: web.Request) -> web.Response:
+        return web.json_response({"sinks": []})
+
+    app = web.Application()
+    app.router.add_get("/api/audio/sinks", sinks)
+    server = await stand_in_server(app)
+    client = LinuxAudioServerApiClient(host=server.host, port=server.port)
+    try:
+        token = REQUEST_PRIORITY.set(PRIORITY_BACKGROUND)
+        background = asyncio.create_task(client.get_sinks())
+        REQUEST_PRIORITY.reset(token)
+        await asyncio.sleep(0)
+        interactive = asyncio.create_task(client.get_sinks())
+        await asyncio.sleep(0)
+        token = REQUEST_PRIORITY.set(PRIORITY_BACKGROUND)
+        joined = asyncio.create_task(client.get_sinks())
+        REQUEST_PRIORITY.reset(token)
+        await asyncio.gather(background, interactive, joined)
+    finally:
+        await client.async_close()
+
+    assert client.request_stats["misses"] == 2
+    assert client.request_stats["inflight_hits"] == 1
+
+
+async def test_put_and_delete_send_their_body(stand_in_server) -> None:
+    """PUT requests are issued and DELETE requests carry their JSON body."""
+    received: list[tuple[str, Any]] = []
+
+    async def record(request: web.Request) -> web.Response:
+        received.append((request.method, await request.json()))
+        return web.json_response({"status": "ok"})
+
+    app = web.Application()
+    app.router.add_put("/api/radio/stream/{name}", record)
+    app.router.add_delete("/api/bluetooth/keep-alive/sink", record)
+    server = await stand_in_server(app)
+    client = LinuxAudioServerApiClient(host=server.host, port=server.port)
+    try:
+        assert await client.update_radio_stream("Jazz FM", "http://jazz") == {"status": "ok"}
+        assert await client.disable_keep_alive_for_sink("kitchen") == {"status": "ok"}
+    finally:
+        await client.async_close()
+
+    assert received == [
+        ("PUT", {"url": "http://jazz"}),
+        ("DELETE", {"sink_name": "kitchen"}),
+    ]
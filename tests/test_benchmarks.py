@@ -0,0 +1,451 @@
+"""Benchmarks for coordinator snapshot processing and the API client.
+
+Each benchmark checks that the optimized path gives the same results as
+the straightforward one and prints both measurements; run with
+``pytest tests/test_benchmarks.py -s`` to see them.
+"""
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Awaitable, Callable, Iterator
+from contextlib import contextmanager
+import json
+import time
+import tracemalloc
+from typing import Any
+from unittest.mock import AsyncMock, MagicMock
+
+from aiohttp import web
+from homeassistant.components.media_player import MediaPlayerState
+import pytest
+
+from custom_components.linux_audio_server.api import (
+    JSON_EXECUTOR_THRESHOLD,
+    JsonCodec,
+    LinuxAudioServerApiClient,
+)
+from custom_components.linux_audio_server.coordinator import LinuxAudioServerCoordinator
+
+SINK_COUNTS = (50, 100, 200)
+ROUNDS = 5
+REQUESTS_PER_ROUND = 100
+# About 13 KiB, 270 KiB and 1 MiB of sinks JSON, on both sides of JSON_EXECUTOR_THRESHOLD
+CODEC_SINK_COUNTS = (100, 2000, 8000)
+# Properties of a media player state write that each resolved the playback
+# before it was precomputed: state, media_title, media_artist, media_album_name
+READS_PER_WRITE = 4
+
+LEGACY_PLAYER_STATES = {
+    "playing": MediaPlayerState.PLAYING,
+    "paused": MediaPlayerState.PAUSED,
+    "stopped": MediaPlayerState.IDLE,
+}
+
+
+def server_state(sink_count: int) -> dict[str, dict[str, Any]]:
+    """Return API responses for a server with the given number of sinks."""
+    sinks = [
+        {
+            "name": f"sink_{i}",
+            "description": f"Speaker {i}",
+            "index": i,
+            "state": ("RUNNING", "IDLE", "SUSPENDED")[i % 3],
+            "volume": 0.5,
+            "muted": False,
+            "is_default": i == 0,
+        }
+        for i in range(sink_count)
+    ]
+    sink_inputs = [
+        {
+            "index": 1000 + i,
+            "name": f"Mopidy Player {i % 4 + 1}" if i % 2 else f"Spotify stream {i}",
+            "sink": f"sink_{i}",
+            "sink_description": f"Speaker {i}",
+            "volume": 0.8,
+            "muted": False,
+        }
+        for i in range(0, sink_count, 3)
+    ]
+    players = [
+        {
+            "id": f"player{i}",
+            "name": f"Player {i}",
+            "active": True,
+            "status": "ok",
+            "state": ("playing", "paused", "stopped", None)[i % 4],
+            "current_track": {"name": f"Track {i}", "artist": "Artist", "album": "Album"},
+        }
+        for i in range(1, 5)
+    ]
+    return {
+        "sinks": {"sinks": sinks, "default_sink": "sink_0"},
+        "sink_inputs": {"sink_inputs": sink_inputs},
+        "playback": {"state": "paused", "track": {"name": "Global", "artist": "A"}},
+        "radio_streams": {"streams": {}},
+        "bluetooth_devices": {
+            "devices": [
+                {"address": f"00:00:00:00:00:{i:02X}", "name": f"BT {i}", "paired": True}
+                for i in range(sink_count // 4)
+            ]
+        },
+        "keep_alive": {},
+        "players": {"players": players},
+        "player_assignments": {
+            "assignments": {f"sink_{i}": f"player{i % 4 + 1}" for i in range(1, sink_count, 5)}
+        },
+    }
+
+
+async def build_coordinator(hass, sink_count: int) -> LinuxAudioServerCoordinator:
+    """Return a coordinator refreshed from a server with sink_count sinks."""
+    state = server_state(sink_count)
+    client = MagicMock()
+    client.websocket_connected = False
+    client.get_sinks = AsyncMock(return_value=state["sinks"])
+    client.get_sink_inputs = AsyncMock(return_value=state["sink_inputs"])
+    client.get_playback_status = AsyncMock(return_value=state["playback"])
+    client.get_radio_streams = AsyncMock(return_value=state["radio_streams"])
+    client.get_bluetooth_devices = AsyncMock(return_value=state["bluetooth_devices"])
+    client.get_keep_alive_status = AsyncMock(return_value=state["keep_alive"])
+    client.get_players = AsyncMock(return_value=state["players"])
+    client.get_player_assignments = AsyncMock(return_value=state["player_assignments"])
+    coordinator = LinuxAudioServerCoordinator(hass, client)
+    await coordinator.async_refresh()
+    assert coordinator.last_update_success
+    return coordinator
+
+
+def best_time(func: Callable[[], Any]) -> float:
+    """Return the fastest of ROUNDS runs of func in seconds."""
+    timings = []
+    for _ in range(ROUNDS):
+        start = time.perf_counter()
+        func()
+        timings.append(time.perf_counter() - start)
+    return min(timings)
+
+
+async def best_async_time(func: Callable[[], Awaitable[Any]]) -> float:
+    """Return the fastest of ROUNDS runs of the coroutine function in seconds."""
+    timings = []
+    for _ in range(ROUNDS):
+        start = time.perf_counter()
+        await func()
+        timings.append(time.perf_counter() - start)
+    return min(timings)
+
+
+@contextmanager
+def loop_debug_disabled() -> Iterator[None]:
+    """Run the block without the test loop's debug mode, which skews I/O timings."""
+    loop = asyncio.get_running_loop()
+    debug = loop.get_debug()
+    loop.set_debug(False)
+    try:
+        yield
+    finally:
+        loop.set_debug(debug)
+
+
+def raw_snapshot(coordinator: LinuxAudioServerCoordinator) -> dict[str, Any]:
+    """Return the merged slices without any indexes."""
+    data: dict[str, Any] = {}
+    for values in coordinator._slice_cache.values():
+        data.update(values)
+    return data
+
+
+def linear_lookups(data: dict[str, Any]) -> list[Any]:
+    """Look up every entity's data by scanning the snapshot lists."""
+    results = []
+    for sink in data["sinks"]:
+        results.append(next(item for item in data["sinks"] if item.name == sink.name))
+        results.append(next(
+            (item for item in data["sinks"] if item.description == sink.description), None
+        ))
+        results.append([item for item in data["sink_inputs"] if item.sink == sink.name])
+    for player in data["players"]:
+        results.append(next(item for item in data["players"] if item.id == player.id))
+    for device in data["bluetooth_devices"]:
+        results.append(next(
+            item for item in data["bluetooth_devices"] if item.address == device.address
+        ))
+    return results
+
+
+def indexed_lookups(data: dict[str, Any]) -> list[Any]:
+    """Look up every entity's data through the snapshot indexes."""
+    results = []
+    for sink in data["sinks"]:
+        results.append(data["sinks_by_name"][sink.name])
+        results.append(data["sinks_by_description"].get(sink.description))
+        results.append(data["sink_inputs_by_sink"].get(sink.name, []))
+    for player in data["players"]:
+        results.append(data["players_by_id"][player.id])
+    for device in data["bluetooth_devices"]:
+        results.append(data["bluetooth_devices_by_address"][device.address])
+    return results
+
+
+@pytest.mark.parametrize("sink_count", SINK_COUNTS)
+async def test_benchmark_indexed_lookups(hass, sink_count: int) -> None:
+    """Indexes built once per update beat per-entity scans."""
+    coordinator = await build_coordinator(hass, sink_count)
+    data = coordinator.data
+    assert indexed_lookups(data) == linear_lookups(data)
+
+    linear = best_time(lambda: linear_lookups(raw_snapshot(coordinator)))
+    # Charge the indexed path with building the whole indexed snapshot
+    indexed = best_time(
+        lambda: indexed_lookups(coordinator._index_snapshot(raw_snapshot(coordinator)))
+    )
+
+    print(
+        f"\n{sink_count} sinks: linear scans {linear * 1000:.2f} ms, "
+        f"indexed {indexed * 1000:.2f} ms per update"
+    )
+    if sink_count == max(SINK_COUNTS):
+        assert indexed < linear
+
+
+def legacy_active_player(data: dict[str, Any], sink_name: str) -> str | None:
+    """Return the Mopidy player routing to a sink, as entities used to."""
+    for sink_input in data["sink_inputs"]:
+        if sink_input.sink != sink_name or "Mopidy Player" not in sink_input.name:
+            continue
+        for number in range(1, 5):
+            if f"Player {number}" in sink_input.name:
+                return f"player{number}"
+    return None
+
+
+def legacy_player(data: dict[str, Any], player_id: str | None) -> Any:
+    """Return a player by scanning the player list."""
+    return next((player for player in data["players"] if player.id == player_id), None)
+
+
+def legacy_state(data: dict[str, Any], sink_name: str) -> MediaPlayerState:
+    """Resolve a sink's state the way the media player property used to."""
+    sink = next((sink for sink in data["sinks"] if sink.name == sink_name), None)
+    if sink is None:
+        return MediaPlayerState.OFF
+    for player_id in (
+        legacy_active_player(data, sink_name),
+        data["player_assignments"].get(sink_name),
+    ):
+        player = legacy_player(data, player_id) if player_id else None
+        if player is not None and player.state in LEGACY_PLAYER_STATES:
+            return LEGACY_PLAYER_STATES[player.state]
+    playback_state = data["playback"].get("state")
+    if playback_state in LEGACY_PLAYER_STATES:
+        return LEGACY_PLAYER_STATES[playback_state]
+    pa_state = sink.state if sink.state is not None else "IDLE"
+    if pa_state == "RUNNING":
+        return MediaPlayerState.ON
+    if pa_state in ("IDLE", "SUSPENDED"):
+        return MediaPlayerState.IDLE
+    return MediaPlayerState.OFF
+
+
+def legacy_track(data: dict[str, Any], sink_name: str) -> Any:
+    """Resolve a sink's track the way the media player properties used to."""
+    for player_id in (
+        legacy_active_player(data, sink_name),
+        data["player_assignments"].get(sink_name),
+    ):
+        player = legacy_player(data, player_id) if player_id else None
+        if player is not None:
+            return player.current_track
+    return data["playback"].get("track")
+
+
+def legacy_writes(data: dict[str, Any], sink_names: list[str]) -> None:
+    """Resolve playback in every property read of one write per sink."""
+    for name in sink_names:
+        legacy_state(data, name)
+        for _ in range(READS_PER_WRITE - 1):
+            legacy_track(data, name)
+
+
+def precomputed_writes(
+    coordinator: LinuxAudioServerCoordinator, data: dict[str, Any], sink_names: list[str]
+) -> None:
+    """Resolve playback once per sink, then read it in every property."""
+    resolved = {
+        name: coordinator._resolve_sink_playback(data, name, data["sinks_by_name"][name])
+        for name in data["sinks_by_name"]
+    }
+    for name in sink_names:
+        for _ in range(READS_PER_WRITE):
+            resolved[name]["state"]
+
+
+@pytest.mark.parametrize("sink_count", SINK_COUNTS)
+async def test_benchmark_precomputed_sink_playback(hass, sink_count: int) -> None:
+    """Precomputed playback matches the per-property resolution and is faster."""
+    coordinator = await build_coordinator(hass, sink_count)
+    data = coordinator.data
+    sink_names = [sink.name for sink in data["sinks"]]
+
+    for name in [*sink_names, "absent_sink"]:
+        resolved = coordinator.sink_playback(name)
+        assert resolved["state"] == legacy_state(data, name), name
+        assert resolved["track"] == legacy_track(data, name), name
+
+    legacy = best_time(lambda: legacy_writes(data, sink_names))
+    precomputed = best_time(lambda: precomputed_writes(coordinator, data, sink_names))
+
+    print(
+        f"\n{sink_count} sinks: per-property resolution {legacy * 1000:.2f} ms, "
+        f"precomputed {precomputed * 1000:.2f} ms per update"
+    )
+    if sink_count == max(SINK_COUNTS):
+        assert precomputed < legacy
+
+
+def decoded_responses(sink_count: int) -> dict[str, dict[str, Any]]:
+    """Return freshly decoded API responses, as every poll produces them."""
+    return json.loads(json.dumps(server_state(sink_count)))
+
+
+def dict_snapshot(responses: dict[str, dict[str, Any]]) -> dict[str, Any]:
+    """Map responses onto coordinator data keys as plain dicts, without models."""
+    return {
+        "sinks": responses["sinks"]["sinks"],
+        "default_sink": responses["sinks"]["default_sink"],
+        "sink_inputs": responses["sink_inputs"]["sink_inputs"],
+        "playback": responses["playback"],
+        "radio_streams": responses["radio_streams"]["streams"],
+        "bluetooth_devices": responses["bluetooth_devices"]["devices"],
+        "keep_alive": responses["keep_alive"],
+        "players": responses["players"]["players"],
+        "player_assignments": responses["player_assignments"]["assignments"],
+    }
+
+
+def model_snapshot(
+    coordinator: LinuxAudioServerCoordinator, responses: dict[str, dict[str, Any]]
+) -> dict[str, Any]:
+    """Parse responses into models, sharing unchanged ones with the slice cache."""
+    data: dict[str, Any] = {}
+    for name, response in responses.items():
+        data.update(coordinator._parse_slice(name, response))
+    return data
+
+
+def changed(old: dict[str, Any], new: dict[str, Any]) -> set[str]:
+    """Return the data keys whose values differ between two snapshots."""
+    return {key for key in new if old.get(key) != new[key]}
+
+
+def retained_bytes(build: Callable[[], Any]) -> int:
+    """Return the memory still allocated by the object build() returns."""
+    tracemalloc.start()
+    try:
+        before = tracemalloc.get_traced_memory()[0]
+        result = build()
+        retained = tracemalloc.get_traced_memory()[0] - before
+    finally:
+        tracemalloc.stop()
+    del result
+    return retained
+
+
+@pytest.mark.parametrize("sink_count", SINK_COUNTS)
+async def test_benchmark_snapshot_models(hass, sink_count: int) -> None:
+    """Models hold the same data as dicts in less memory and share unchanged items."""
+    coordinator = await build_coordinator(hass, sink_count)
+    dicts = dict_snapshot(decoded_responses(sink_count))
+    models = model_snapshot(coordinator, decoded_responses(sink_count))
+    assert [(sink.name, sink.state) for sink in models["sinks"]] == [
+        (sink["name"], sink["state"]) for sink in dicts["sinks"]
+    ]
+    assert [item.index for item in models["sink_inputs"]] == [
+        item["index"] for item in dicts["sink_inputs"]
+    ]
+    # An unchanged poll reuses the cached model lists
+    assert models["sinks"] is coordinator.data["sinks"]
+
+    dict_memory = retained_bytes(lambda: dict_snapshot(decoded_responses(sink_count)))
+    # A coordinator with an empty slice cache builds every model anew
+    empty = LinuxAudioServerCoordinator(hass, coordinator.client)
+    model_memory = retained_bytes(lambda: model_snapshot(empty, decoded_responses(sink_count)))
+
+    # Per update: decode, build the snapshot and find what changed
+    previous_dicts = dict_snapshot(decoded_responses(sink_count))
+    dict_time = best_time(
+        lambda: changed(previous_dicts, dict_snapshot(decoded_responses(sink_count)))
+    )
+    previous_models = coordinator.data
+    model_time = best_time(
+        lambda: changed(
+            previous_models, model_snapshot(coordinator, decoded_responses(sink_count))
+        )
+    )
+
+    print(
+        f"\n{sink_count} sinks: dict snapshot {dict_memory / 1024:.1f} KiB, "
+        f"{dict_time * 1000:.2f} ms per update; models {model_memory / 1024:.1f} KiB, "
+        f"{model_time * 1000:.2f} ms per update"
+    )
+    if sink_count == max(SINK_COUNTS):
+        assert model_memory < dict_memory
+
+
+async def test_benchmark_unix_socket_requests(stand_in_server, tmp_path) -> None:
+    """A co-located server answers the same over its Unix socket as over loopback TCP."""
+
+    async def health(request: web.Request) -> web.Response:
+        return web.json_response({"status": "ok"})
+
+    app = web.Application()
+    app.router.add_get("/api/health", health)
+    socket_path = str(tmp_path / "api.sock")
+    server = await stand_in_server(app, unix_socket=socket_path)
+    # A tiny response, so the timings are dominated by the transport
+    tcp = LinuxAudioServerApiClient(host=server.host, port=server.port, get_cache_ttl=0)
+    unix = LinuxAudioServerApiClient(host=f"unix://{socket_path}", port=0, get_cache_ttl=0)
+    try:
+        assert await unix.health_check() == await tcp.health_check() == {"status": "ok"}
+
+        async def requests(client: LinuxAudioServerApiClient) -> None:
+            for _ in range(REQUESTS_PER_ROUND):
+                await client.health_check()
+
+        with loop_debug_disabled():
+            tcp_time = await best_async_time(lambda: requests(tcp))
+            unix_time = await best_async_time(lambda: requests(unix))
+    finally:
+        await tcp.async_close()
+        await unix.async_close()
+
+    print(
+        f"\nGET /api/health: loopback TCP {tcp_time / REQUESTS_PER_ROUND * 1000:.3f} ms, "
+        f"Unix socket {unix_time / REQUESTS_PER_ROUND * 1000:.3f} ms per request"
+    )
+
+
+@pytest.mark.parametrize("sink_count", CODEC_SINK_COUNTS)
+async def test_benchmark_json_codec(sink_count: int) -> None:
+    """The fast codec decodes like the stdlib; big bodies pay the executor hand-off."""
+    body = json.dumps(server_state(sink_count)["sinks"]).encode()
+    codec = JsonCodec()
+    assert codec.loads(body) == json.loads(body)
+
+    stdlib_time = best_time(lambda: json.loads(body))
+    codec_time = best_time(lambda: codec.loads(body))
+    loop = asyncio.get_running_loop()
+    with loop_debug_disabled():
+        executor_time = await best_async_time(
+            lambda: loop.run_in_executor(None, codec.loads, body)
+        )
+
+    where = "executor" if len(body) >= JSON_EXECUTOR_THRESHOLD else "event loop"
+    print(
+        f"\n{len(body) / 1024:.0f} KiB body: json {stdlib_time * 1000:.2f} ms, "
+        f"{codec.name} {codec_time * 1000:.2f} ms, {codec.name} in executor "
+        f"{executor_time * 1000:.2f} ms; decoded in the {where}"
+    )
+    if codec.name != "json" and sink_count == max(CODEC_SINK_COUNTS):
+        assert codec_time < stdlib_time
@@ -0,0 +1,164 @@
+"""Tests for the Linux Audio Server coordinator."""
+from __future__ import annotations
+
+from unittest.mock import patch
+
+from aiohttp import web
+from homeassistant.components.media_player import MediaPlayerState
+
+from custom_components.linux_audio_server.api import (
+    WS_RESYNC_EVENT,
+    LinuxAudioServerApiClient,
+)
+from custom_components.linux_audio_server.coordinator import LinuxAudioServerCoordinator
+
+from .conftest import SINKS
+
+
+async def test_targeted_refresh_keeps_poll_schedule(coordinator, client) -> None:
+    """An event-triggered refresh must not postpone the reconciliation poll."""
+    client.get_sink_inputs.return_value = {"sink_inputs": []}
+    unsub = coordinator.async_add_listener(lambda: None)
+    with patch.object(coordinator, "_schedule_refresh") as schedule_refresh:
+        await coordinator.async_refresh_slices("sink_inputs")
+
+    unsub()
+
+    assert coordinator.data["sink_inputs"] == []
+    schedule_refresh.assert_not_called()
+
+
+async def test_event_delta_keeps_poll_schedule(coordinator) -> None:
+    """Applying an event must not postpone the reconciliation poll."""
+    unsub = coordinator.async_add_listener(lambda: None)
+    with patch.object(coordinator, "_schedule_refresh") as schedule_refresh:
+        await coordinator._handle_websocket_event(
+            {
+                "source": "pulseaudio",
+                "event": "sink_input.remove",
+                "data": {"index": 7},
+            }
+        )
+
+    unsub()
+
+    assert coordinator.data["sink_inputs"] == []
+    schedule_refresh.assert_not_called()
+
+
+async def test_partial_sink_input_change_keeps_other_fields(coordinator) -> None:
+    """A change event only overrides the fields it carries."""
+    await coordinator._handle_websocket_event(
+        {
+            "source": "pulseaudio",
+            "event": "sink_input.change",
+            "data": {"index": 7, "sink": "kitchen"},
+        }
+    )
+
+    (sink_input,) = coordinator.data["sink_inputs"]
+    assert sink_input.name == "Mopidy Player 1"
+    assert sink_input.sink == "kitchen"
+    assert sink_input.volume == 0.8
+    assert sink_input.sink_description == "Kitchen"
+    assert coordinator.data["sink_inputs_by_sink"] == {"kitchen": [sink_input]}
+
+
+async def test_new_sink_input_gets_sink_description(coordinator) -> None:
+    """A new stream is labelled with the description of its sink."""
+    await coordinator._handle_websocket_event(
+        {
+            "source": "pulseaudio",
+            "event": "sink_input.new",
+            "data": {"index": 8, "name": "Spotify", "sink": "kitchen"},
+        }
+    )
+
+    assert coordinator.data["sink_inputs"][-1].sink_description == "Kitchen"
+
+
+async def test_incomplete_new_sink_input_triggers_refetch(coordinator, client) -> None:
+    """A new stream without its name and sink is refetched, not guessed."""
+    coordinator._event_coalesce_window = 0
+    await coordinator._handle_websocket_event(
+        {"source": "pulseaudio", "event": "sink_input.new", "data": {"index": 8}}
+    )
+    await coordinator._event_flush_task
+
+    assert client.get_sink_inputs.await_count == 2
+
+
+async def test_resync_refetches_cached_slices(coordinator, client) -> None:
+    """A resync after missed events also refetches slow-changing slices."""
+    client.get_bluetooth_devices.reset_mock()
+    client.get_player_assignments.reset_mock()
+    coordinator._event_coalesce_window = 0
+
+    await coordinator._handle_websocket_event(dict(WS_RESYNC_EVENT))
+    await coordinator._event_flush_task
+    await coordinator.async_shutdown()
+
+    client.get_bluetooth_devices.assert_awaited_once()
+    client.get_player_assignments.assert_awaited_once()
+
+
+async def test_refetch_event_invalidates_cached_gets(coordinator, client) -> None:
+    """Events that need a refetch must not be served pre-event responses."""
+    coordinator._event_coalesce_window = 0
+    await coordinator._handle_websocket_event(
+        {"source": "pulseaudio", "event": "sink.change", "data": {}}
+    )
+    await coordinator._event_flush_task
+
+    client.invalidate_gets.assert_called_once()
+    assert client.get_sinks.await_count == 2
+
+
+async def test_absent_sink_playback_does_not_mutate_snapshot(coordinator, client) -> None:
+    """Resolving a missing sink must not make identical polls look changed."""
+    assert coordinator.sink_playback("gone")["state"] == MediaPlayerState.OFF
+    assert "gone" not in coordinator.data["sink_playback"]
+
+    await coordinator.async_refresh()
+    assert coordinator.changed_keys == set()
+
+    client.get_player_assignments.return_value = {"assignments": {"gone": "player1"}}
+    client.get_players.return_value = {
+        "players": [{"id": "player1", "state": "playing", "current_track": {"name": "Song"}}]
+    }
+    coordinator.invalidate_slices("player_assignments", "players")
+    await coordinator.async_refresh()
+
+    assert ("sink_playback", "gone") in coordinator.changed_keys
+    assert coordinator.sink_playback("gone")["track"].name == "Song"
+
+
+async def test_not_modified_slice_is_not_reparsed(hass, client, stand_in_server) -> None:
+    """A 304 reply reuses the parsed slice instead of parsing it again."""
+
+    async def sinks(request: web.Request) -> web.Response:
+        if request.headers.get("If-None-Match") == '"v1"':
+            return web.Response(status=304)
+        return web.json_response(SINKS, headers={"ETag": '"v1"'})
+
+    app = web.Application()
+    app.router.add_get("/api/audio/sinks", sinks)
+    server = await stand_in_server(app)
+    api = LinuxAudioServerApiClient(host=server.host, port=server.port, get_cache_ttl=0)
+    client.get_sinks = api.get_sinks
+    coordinator = LinuxAudioServerCoordinator(hass, client)
+    try:
+        await coordinator.async_refresh()
+        sink_models = coordinator.data["sinks"]
+        with patch.object(
+            coordinator, "_parse_slice", wraps=coordinator._parse_slice
+        ) as parse_slice:
+            await coordinator.async_refresh()
+        stats = api.validation_stats
+    finally:
+        await api.async_close()
+
+    assert coordinator.last_update_success
+    assert "sinks" not in [call.args[0] for call in parse_slice.call_args_list]
+    assert coordinator.data["sinks"] is sink_models
+    assert stats["not_modified"] == 1
@@ -0,0 +1,105 @@
+"""Tests for the shared Linux Audio Server entity helpers."""
+from __future__ import annotations
+
+from datetime import timedelta
+from typing import Any
+from unittest.mock import MagicMock, patch
+
+from homeassistant.helpers.entity import Entity
+from homeassistant.util import dt as dt_util
+from pytest_homeassistant_custom_component.common import async_fire_time_changed
+
+from custom_components.linux_audio_server.const import OPTIMISTIC_STATE_TTL
+from custom_components.linux_audio_server.entity import ChangeFilterMixin, OptimisticStateMixin
+
+
+class _OptimisticEntity(OptimisticStateMixin, Entity):
+    """Entity whose backend value is set directly by the test."""
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.backend_value: Any = "off"
+        self.written: list[Any] = []
+
+    def _actual_value(self, key: str) -> Any:
+        return self.backend_value
+
+    @property
+    def value(self) -> Any:
+        return self._optimistic_value("value", self.backend_value)
+
+    def async_write_ha_state(self) -> None:
+        self.written.append(self.value)
+
+
+class _CoordinatorBackedEntity(Entity):
+    """Stand-in for CoordinatorEntity that counts written updates."""
+
+    def __init__(self, coordinator: MagicMock) -> None:
+        super().__init__()
+        self.coordinator = coordinator
+        self.writes = 0
+
+    def _handle_coordinator_update(self) -> None:
+        self.writes += 1
+
+
+class _FilteredEntity(ChangeFilterMixin, _CoordinatorBackedEntity):
+    """Entity rendering from a single sink."""
+
+    def _change_keys(self) -> set[tuple[str, str]]:
+        return {("sink", "kitchen")}
+
+
+def test_state_is_assumed_until_first_live_update() -> None:
+    """Entities flag the cached snapshot and write once it is replaced."""
+    coordinator = MagicMock(
+        changed_keys={("sink", "living_room")},
+        last_update_success=True,
+        snapshot_stale=True,
+    )
+    entity = _FilteredEntity(coordinator)
+    entity._handle_coordinator_update()
+    assert entity.assumed_state
+    assert entity.writes == 1
+
+    entity._handle_coordinator_update()
+    assert entity.writes == 1
+
+    coordinator.snapshot_stale = False
+    entity._handle_coordinator_update()
+    assert not entity.assumed_state
+    assert entity.writes == 2
+
+
+async def test_unconfirmed_value_rolls_back_when_ttl_expires(hass) -> None:
+    """An unconfirmed optimistic value is rolled back and written at expiry."""
+    entity = _OptimisticEntity()
+    entity.hass = hass
+    entity.entity_id = "switch.test"
+
+    with patch("custom_components.linux_audio_server.entity._LOGGER") as logger:
+        entity._set_optimistic("value", "on")
+        assert entity.written == ["on"]
+
+        async_fire_time_changed(
+            hass, dt_util.utcnow() + timedelta(seconds=OPTIMISTIC_STATE_TTL + 1)
+        )
+        await hass.async_block_till_done()
+
+    assert entity.written == ["on", "off"]
+    assert not entity._optimistic
+    logger.warning.assert_called_once()
+
+
+async def test_confirmed_value_cancels_expiry(hass) -> None:
+    """A value confirmed by the backend needs no rollback."""
+    entity = _OptimisticEntity()
+    entity.hass = hass
+    entity.entity_id = "switch.test"
+    entity._set_optimistic("value", "on")
+    entity.backend_value = "on"
+    entity._reconcile_optimistic("value", expired=False)
+
+    assert not entity._optimistic
+    assert not entity._optimistic_timers
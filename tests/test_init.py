@@ -0,0 +1,69 @@
+"""Tests for setting up the Linux Audio Server integration."""
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Iterator
+from unittest.mock import AsyncMock, MagicMock, patch
+
+from homeassistant.config_entries import ConfigEntryState
+from homeassistant.const import CONF_HOST, CONF_PORT, EVENT_HOMEASSISTANT_CLOSE
+from homeassistant.core import HomeAssistant
+import pytest
+from pytest_homeassistant_custom_component.common import MockConfigEntry
+
+from custom_components.linux_audio_server.const import DOMAIN
+
+
+@pytest.fixture
+def config_entry(hass: HomeAssistant, enable_custom_integrations) -> MockConfigEntry:
+    """Return a config entry for a server that is never contacted."""
+    entry = MockConfigEntry(domain=DOMAIN, data={CONF_HOST: "audio.local", CONF_PORT: 6000})
+    entry.add_to_hass(hass)
+    return entry
+
+
+@pytest.fixture
+def setup_client(client: MagicMock) -> Iterator[MagicMock]:
+    """Patch the integration to use the fixed-state client."""
+    client.async_close = AsyncMock()
+
+    async def stay_connected(on_message_callback) -> None:
+        # Stay "connected" until the listener is cancelled
+        await asyncio.Event().wait()
+
+    client.connect_websocket = AsyncMock(side_effect=stay_connected)
+    with patch(
+        "custom_components.linux_audio_server.LinuxAudioServerApiClient",
+        return_value=client,
+    ), patch("custom_components.linux_audio_server.PLATFORMS", []):
+        yield client
+
+
+async def test_client_closed_when_home_assistant_closes(
+    hass: HomeAssistant, config_entry: MockConfigEntry, setup_client: MagicMock
+) -> None:
+    """The client's own connection pool is closed on shutdown."""
+    assert await hass.config_entries.async_setup(config_entry.entry_id)
+    setup_client.async_close.assert_not_awaited()
+
+    hass.bus.async_fire(EVENT_HOMEASSISTANT_CLOSE)
+    await hass.async_block_till_done()
+
+    setup_client.async_close.assert_awaited_once()
+    assert await hass.config_entries.async_unload(config_entry.entry_id)
+
+
+async def test_client_closed_when_platform_setup_fails(
+    hass: HomeAssistant, config_entry: MockConfigEntry, setup_client: MagicMock
+) -> None:
+    """A failed platform setup does not leak the connection pool."""
+    with patch.object(
+        hass.config_entries,
+        "async_forward_entry_setups",
+        side_effect=RuntimeError("platform failed"),
+    ):
+        assert not await hass.config_entries.async_setup(config_entry.entry_id)
+
+    assert config_entry.state is ConfigEntryState.SETUP_ERROR
+    setup_client.async_close.assert_awaited_once()
+    assert config_entry.entry_id not in hass.data[DOMAIN]
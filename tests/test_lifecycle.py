@@ -0,0 +1,72 @@
+"""Tests for the Linux Audio Server entity lifecycle manager."""
+from __future__ import annotations
+
+from typing import Any
+from unittest.mock import AsyncMock, MagicMock
+
+from custom_components.linux_audio_server.lifecycle import (
+    KIND_BLUETOOTH_DEVICE,
+    KIND_SINK,
+    EntityLifecycleManager,
+)
+
+
+def _factory(domain: str):
+    """Return an entity factory for one platform."""
+
+    def factory(sink: Any) -> MagicMock:
+        return MagicMock(unique_id=f"{domain}_{sink}", async_remove=AsyncMock())
+
+    return factory
+
+
+async def test_entity_removed_on_one_platform_is_readded(hass) -> None:
+    """A sink kept by one platform but removed by another comes back on both."""
+    coordinator = MagicMock(data={"sinks_by_name": {"kitchen": "kitchen"}})
+    manager = EntityLifecycleManager(hass, coordinator, removal_grace=0)
+    added: dict[str, list[Any]] = {"media_player": [], "switch": []}
+    manager.async_register_platform(
+        "media_player", KIND_SINK, _factory("media_player"),
+        added["media_player"].extend, keep=lambda entity: True,
+    )
+    manager.async_register_platform(
+        "switch", KIND_SINK, _factory("switch"), added["switch"].extend
+    )
+
+    coordinator.data = {"sinks_by_name": {}}
+    manager.async_sync(force_removal_kinds={KIND_SINK})
+    await hass.async_block_till_done()
+    assert [entity.unique_id for entity in added["switch"]] == ["switch_kitchen"]
+    added["switch"][0].async_remove.assert_awaited_once()
+
+    coordinator.data = {"sinks_by_name": {"kitchen": "kitchen"}}
+    manager.async_sync()
+
+    assert len(added["media_player"]) == 1
+    assert [entity.unique_id for entity in added["switch"]] == [
+        "switch_kitchen", "switch_kitchen"
+    ]
+
+
+async def test_forced_removal_is_limited_to_the_given_kinds(hass) -> None:
+    """Forcing removal of gone Bluetooth devices leaves briefly missing sinks alone."""
+    coordinator = MagicMock(
+        data={
+            "sinks_by_name": {"usb_dac": "usb_dac"},
+            "bluetooth_devices_by_address": {"AA": "AA"},
+        }
+    )
+    manager = EntityLifecycleManager(hass, coordinator)
+    sinks: list[Any] = []
+    devices: list[Any] = []
+    manager.async_register_platform("switch", KIND_SINK, _factory("switch"), sinks.extend)
+    manager.async_register_platform(
+        "device_tracker", KIND_BLUETOOTH_DEVICE, _factory("device_tracker"), devices.extend
+    )
+
+    coordinator.data = {"sinks_by_name": {}, "bluetooth_devices_by_address": {}}
+    manager.async_sync(force_removal_kinds={KIND_BLUETOOTH_DEVICE})
+    await hass.async_block_till_done()
+
+    devices[0].async_remove.assert_awaited_once()
+    sinks[0].async_remove.assert_not_called()